@@ -0,0 +1,100 @@
+"""
+统计100个同时动画的 GaugePanel 每帧的耗时
+
+10x10 个仪表盘在 offscreen 平台下同时在最小值和最大值之间来回动画,由全局动画时钟推进:
+1. 推进: FrameClock 统计的每帧100个 updateValue 回调的总耗时
+2. 绘制: 每帧100个 paintEvent 的总耗时
+3. 分别统计使用缓存的静态表盘(dialPixmap)和每次绘制都重新绘制表盘的耗时
+
+用法: python benchmarks/gaugepanel_frames.py [动画次数]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from collections import defaultdict
+from time import perf_counter
+from typing import Dict, List
+
+from PySide2.QtCore import QEventLoop
+from PySide2.QtGui import QPaintEvent, QPixmap
+from PySide2.QtWidgets import QApplication, QGridLayout, QWidget
+
+from custom_widgets.frameclock.frameclock import FrameClock
+from custom_widgets.panel.gaugepanel import GaugePanel
+
+ROWS: int = 10  # 行数
+COLUMNS: int = 10  # 列数
+SWEEPS: int = 4  # 默认动画次数
+
+
+class TimedGaugePanel(GaugePanel):
+    """ 按帧记录绘制耗时的仪表盘, cached 为 False 时每次绘制都重新绘制表盘 """
+    frameTimes: Dict[int, float] = defaultdict(float)  # 帧序号 -> 该帧所有仪表盘的绘制总耗时
+    cached: bool = True
+
+    def paintEvent(self, event: QPaintEvent = None) -> None:
+        start: float = perf_counter()
+        super(TimedGaugePanel, self).paintEvent(event)
+        TimedGaugePanel.frameTimes[FrameClock().frameCount] += (perf_counter() - start) * 1000.0
+
+    def dialPixmap(self) -> QPixmap:
+        if TimedGaugePanel.cached:
+            return super(TimedGaugePanel, self).dialPixmap()
+        return self._GaugePanel__drawDial(self.devicePixelRatioF())
+
+
+def percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100.0), len(values) - 1)] if values else 0.0
+
+
+def run(app: QApplication, gauges: List[TimedGaugePanel], sweeps: int) -> None:
+    """ 所有仪表盘同时在最小值和最大值之间来回动画,每次等待动画结束 """
+    clock: FrameClock = FrameClock()
+    clock.resetStats()
+    TimedGaugePanel.frameTimes.clear()
+
+    start: float = perf_counter()
+    for i in range(sweeps):
+        for gauge in gauges:
+            gauge.value = gauge.maxValue if i % 2 == 0 else gauge.minValue
+        while clock.isActive:
+            app.processEvents(QEventLoop.WaitForMoreEvents)
+        app.processEvents()
+    total: float = (perf_counter() - start) * 1000.0
+
+    frames: int = clock.frameCount
+    advance: List[float] = [clock.stats(gauge).totalTime for gauge in gauges]
+    paints: List[float] = [TimedGaugePanel.frameTimes[frame] for frame in range(1, frames + 1)]
+    print('dial cache %s: %d frames in %.0f ms' % ('on' if TimedGaugePanel.cached else 'off', frames, total))
+    print('  advance: average %.3f ms per frame  max %.3f ms per gauge' % (
+        sum(advance) / frames if frames else 0.0, max(clock.stats(gauge).maxTime for gauge in gauges)))
+    print('  paint:   average %.3f ms per frame  p95 %.3f ms  max %.3f ms' % (
+        sum(paints) / len(paints) if paints else 0.0, percentile(paints, 95), max(paints) if paints else 0.0))
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    sweeps: int = int(sys.argv[1]) if len(sys.argv) > 1 else SWEEPS
+
+    window: QWidget = QWidget()
+    layout: QGridLayout = QGridLayout(window)
+    gauges: List[TimedGaugePanel] = []
+    for i in range(ROWS * COLUMNS):
+        gauge: TimedGaugePanel = TimedGaugePanel()
+        gauge.animation = True
+        gauge.animationStep = 2
+        layout.addWidget(gauge, i // COLUMNS, i % COLUMNS)
+        gauges.append(gauge)
+    window.resize(COLUMNS * 120, ROWS * 120)
+    window.show()
+    app.processEvents()
+
+    print('GaugePanel x%d, %d sweeps' % (len(gauges), sweeps))
+    for cached in (True, False):
+        TimedGaugePanel.cached = cached
+        run(app, gauges, sweeps)
@@ -0,0 +1,162 @@
+"""
+检查 IconHelper 按钮登记的释放和事件过滤开销
+
+1. 登记1000个导航按钮后删除一半, btn_pixmaps/btn_icons 应随按钮销毁缩小到500
+2. 向剩余按钮发送各种非鼠标进入/离开事件, 事件过滤器不应查找按钮图标
+3. 鼠标进入/离开事件每次只查找一次, 并切换到对应的图标
+4. 统计200个按钮的导航面板每次鼠标进入/离开切换图标的耗时, 与每次事件都构造新 QIcon 的原实现对比
+
+用法: python benchmarks/iconhelper_buttons.py [悬停轮数], 检查不通过时返回非0
+"""
+
+import gc
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from typing import List, Tuple
+from weakref import WeakKeyDictionary
+
+from time import perf_counter
+from PySide2.QtCore import QEvent, QElapsedTimer, QObject
+from PySide2.QtGui import QIcon, QPixmap
+from PySide2.QtWidgets import QApplication, QToolButton, QVBoxLayout, QWidget
+
+from custom_widgets.iconhelper.iconhelper import IconHelper
+
+COUNT: int = 1000  # 登记的按钮数量
+EVENTS: List[QEvent.Type] = [QEvent.User, QEvent.StyleChange, QEvent.ToolTipChange,
+                             QEvent.FontChange, QEvent.PaletteChange]  # 不需要查找按钮的事件
+HOVER_COUNT: int = 200  # 悬停计时的导航面板按钮数量
+HOVER_PASSES: int = 20  # 默认悬停轮数
+
+
+class LookupCounter(WeakKeyDictionary):
+    """ 统计按钮图标查找次数的弱引用字典 """
+
+    def __init__(self):
+        super(LookupCounter, self).__init__()
+        self.lookups: int = 0
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super(LookupCounter, self).get(key, default)
+
+
+def check(name: str, ok: bool, detail: str) -> bool:
+    print('%-44s %s  %s' % (name, 'ok  ' if ok else 'FAIL', detail))
+    return ok
+
+
+def hoverPass(app: QApplication, buttons: List[QToolButton], passes: int, repaint: bool) -> float:
+    """ 依次向每个按钮发送鼠标进入/离开事件, 返回每次切换的平均耗时微秒 """
+    start: float = perf_counter()
+    for _ in range(passes):
+        for button in buttons:
+            app.sendEvent(button, QEvent(QEvent.Enter))
+            if repaint: button.repaint()
+            app.sendEvent(button, QEvent(QEvent.Leave))
+            if repaint: button.repaint()
+    return (perf_counter() - start) * 1e6 / (passes * len(buttons) * 2)
+
+
+class NewIconFilter(QObject):
+    """ 原实现的事件过滤器: 每次鼠标进入/离开都用缓存的图片构造新的 QIcon """
+
+    def __init__(self, pixmaps: WeakKeyDictionary):
+        super(NewIconFilter, self).__init__()
+        self.pixmaps: WeakKeyDictionary = pixmaps  # 按钮 -> (正常图片, 加深图片)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        eventType: QEvent.Type = event.type()
+        if eventType == QEvent.Enter or eventType == QEvent.Leave:
+            pixmaps: Tuple[QPixmap, QPixmap] = self.pixmaps.get(watched)
+            if pixmaps is not None:
+                dark: bool = eventType == QEvent.Enter or watched.isChecked()
+                watched.setIcon(QIcon(pixmaps[1] if dark else pixmaps[0]))
+        return super(NewIconFilter, self).eventFilter(watched, event)
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    helper: IconHelper = IconHelper()
+
+    panel: QWidget = QWidget()
+    buttons: List[QToolButton] = [QToolButton(panel) for _ in range(COUNT)]
+    helper.setIconForNavButtons(buttons, [0xf030 + i % 16 for i in range(COUNT)])
+    registered: int = len(helper.btn_icons)
+
+    # 删除一半按钮, 只保留另一半的引用
+    # 循环变量也会引用按钮包装对象, 删除后一并释放
+    for button in buttons[::2]: button.deleteLater()
+    del button
+    buttons = buttons[1::2]
+    app.sendPostedEvents(None, QEvent.DeferredDelete)
+    gc.collect()
+
+    passed: bool = True
+    passed &= check('registered buttons', registered == COUNT, '%d' % registered)
+    passed &= check('btn_pixmaps after deleting half', len(helper.btn_pixmaps) == len(buttons),
+                    '%d' % len(helper.btn_pixmaps))
+    passed &= check('btn_icons after deleting half', len(helper.btn_icons) == len(buttons),
+                    '%d' % len(helper.btn_icons))
+
+    # 替换为计数字典, 统计事件过滤器的查找次数
+    counter: LookupCounter = LookupCounter()
+    counter.update(helper.btn_icons)
+    helper.btn_icons = counter
+
+    timer: QElapsedTimer = QElapsedTimer()
+    timer.start()
+    for button in buttons:
+        for eventType in EVENTS:
+            app.sendEvent(button, QEvent(eventType))
+    elapsed: int = timer.elapsed()
+    passed &= check('lookups for %d other events' % (len(buttons) * len(EVENTS)), counter.lookups == 0,
+                    '%d lookups, %d ms' % (counter.lookups, elapsed))
+
+    counter.lookups = 0
+    switched: int = 0
+    for button in buttons:
+        app.sendEvent(button, QEvent(QEvent.Enter))
+        switched += button.icon().cacheKey() == counter[button][1].cacheKey()
+        app.sendEvent(button, QEvent(QEvent.Leave))
+        switched += button.icon().cacheKey() == counter[button][0].cacheKey()
+    passed &= check('lookups for %d enter/leave events' % (len(buttons) * 2), counter.lookups == len(buttons) * 2,
+                    '%d lookups, %d icons switched' % (counter.lookups, switched))
+    passed &= check('icons switched on enter/leave', switched == len(buttons) * 2, '%d' % switched)
+
+    # 200个按钮的导航面板, 按钮都在显示中, 分别统计只切换图标和切换后立即重绘的耗时
+    passes: int = int(sys.argv[1]) if len(sys.argv) > 1 else HOVER_PASSES
+    pane: QWidget = QWidget()
+    pane.setObjectName('pane')
+    layout: QVBoxLayout = QVBoxLayout(pane)
+    navButtons: List[QToolButton] = []
+    for i in range(HOVER_COUNT):
+        navButton: QToolButton = QToolButton(pane)
+        navButton.setText('button%03d' % i)
+        layout.addWidget(navButton)
+        navButtons.append(navButton)
+    helper.setStyleForNavPane(pane, navButtons, [0xf030 + i % 16 for i in range(HOVER_COUNT)])
+    pane.resize(200, HOVER_COUNT * 30)
+    pane.show()
+    app.processEvents()
+
+    print('%-44s %12s %12s' % ('hover x%d buttons, %d passes' % (HOVER_COUNT, passes), 'switch us', 'repaint us'))
+    # 临时换成原实现的事件过滤器
+    newIconFilter: NewIconFilter = NewIconFilter(helper.btn_pixmaps)
+    for navButton in navButtons:
+        navButton.removeEventFilter(helper)
+        navButton.installEventFilter(newIconFilter)
+    print('%-44s %12.2f %12.2f' % ('before: new QIcon per event',
+                                   hoverPass(app, navButtons, passes, False), hoverPass(app, navButtons, passes, True)))
+
+    for navButton in navButtons:
+        navButton.removeEventFilter(newIconFilter)
+        navButton.installEventFilter(helper)
+    print('%-44s %12.2f %12.2f' % ('after: prebuilt QIcons',
+                                   hoverPass(app, navButtons, passes, False), hoverPass(app, navButtons, passes, True)))
+
+    sys.exit(0 if passed else 1)
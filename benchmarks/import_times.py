@@ -0,0 +1,85 @@
+"""
+统计各控件模块的导入耗时
+
+每个模块在独立的子进程中用 python -X importtime 导入, 输出:
+1. 模块自身及其依赖的累计导入耗时, 以及除去 PySide2 后的耗时
+2. 是否在导入时加载了 Qt 资源模块(图形字体/拼音数据), 资源应在首次使用时才注册
+
+用法: python benchmarks/import_times.py [模块名...], 默认统计 custom_widgets 下所有控件模块
+"""
+
+import os
+import subprocess
+import sys
+
+from typing import Dict, List, Tuple
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# 部分模块按各自目录导入同目录的模块(如 telwidget 的 main.py)
+EXTRA_PATHS: List[str] = [os.path.join(ROOT, 'custom_widgets', 'telwidget')]
+RESOURCES: List[str] = ['custom_widgets.iconhelper.resource', 'custom_widgets.zhtopy.resource']
+
+
+def widgetModules() -> List[str]:
+    """ custom_widgets 下所有控件模块, 不含资源数据模块和演示入口 """
+    modules: List[str] = []
+    for folder, _, files in os.walk(os.path.join(ROOT, 'custom_widgets')):
+        for name in sorted(files):
+            if not name.endswith('.py') or name == '__init__.py' or name == 'main.py' or name.startswith('resource'):
+                continue
+            path: str = os.path.relpath(os.path.join(folder, name[:-3]), ROOT)
+            modules.append(path.replace(os.sep, '.'))
+    return sorted(modules)
+
+
+def importTime(module: str) -> Tuple[float, float, List[str], str]:
+    """ 返回 (累计耗时毫秒, PySide2 耗时毫秒, 导入的资源模块, 错误信息) """
+    env: Dict[str, str] = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([ROOT] + EXTRA_PATHS + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+    # 格式: import time: self [us] | cumulative | imported package, 依赖按缩进嵌套且先于导入方输出
+    entries: List[Tuple[int, str, float]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line: continue
+        fields: List[str] = line[len('import time:'):].split('|')
+        if not fields[1].strip().isdigit(): continue
+        name: str = fields[2].strip()
+        entries.append((len(fields[2]) - len(fields[2].lstrip()), name, int(fields[1]) / 1000.0))
+
+    # 倒序遍历即先导入方后依赖, PySide2 只统计最外层的导入, 不重复计入其内部导入的模块
+    total: float = 0.0
+    pyside: float = 0.0
+    resources: List[str] = []
+    stack: List[Tuple[int, bool]] = []  # (缩进, 是否在 PySide2 内部)
+    for depth, name, cumulative in reversed(entries):
+        while stack and stack[-1][0] >= depth: stack.pop()
+        inside: bool = bool(stack) and stack[-1][1]
+        qt: bool = name.split('.')[0] in ('PySide2', 'shiboken2')
+        if qt and not inside: pyside += cumulative
+        stack.append((depth, inside or qt))
+
+        if name == module: total = cumulative
+        if name in RESOURCES: resources.append(name.split('.')[1])
+
+    # 只按是否抛出异常判断导入失败, 部分环境下进程退出时的崩溃不影响导入耗时
+    error: str = ''
+    lines: List[str] = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+    if 'Traceback (most recent call last):' in lines:
+        error = lines[-1]
+    return total, pyside, resources, error
+
+
+if __name__ == '__main__':
+    modules: List[str] = sys.argv[1:] or widgetModules()
+
+    print('%-52s %10s %10s  %s' % ('module', 'total ms', 'own ms', 'resources'))
+    for module in modules:
+        total, pyside, resources, error = importTime(module)
+        if error:
+            print('%-52s %s' % (module, error))
+            continue
+        print('%-52s %10.1f %10.1f  %s' % (module, total, max(total - pyside, 0.0), ','.join(resources) or '-'))
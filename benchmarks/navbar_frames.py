@@ -0,0 +1,81 @@
+"""
+统计50个条目的 NavBar 滑动时每帧的耗时
+
+横向导航条在 offscreen 平台下来回滑动,由全局动画时钟推进:
+1. 推进: FrameClock 统计的每帧滑动回调耗时
+2. 绘制: 每次 paintEvent 的耗时(背景+选中条目+50个条目文字)
+3. 帧数: 每次滑动绘制的帧数
+
+用法: python benchmarks/navbar_frames.py [滑动次数]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter
+from typing import List
+
+from PySide2.QtCore import QEventLoop
+from PySide2.QtGui import QPaintEvent
+from PySide2.QtWidgets import QApplication
+
+from custom_widgets.frameclock.frameclock import FrameClock, FrameStats
+from custom_widgets.navigation.navbar.navbar import NavBar
+
+ITEMS: int = 50  # 条目数量
+SLIDES: int = 20  # 默认滑动次数
+
+
+class TimedNavBar(NavBar):
+    """ 记录每次绘制耗时的导航条 """
+
+    def __init__(self, parent=None):
+        super(TimedNavBar, self).__init__(parent)
+        self.paintTimes: List[float] = []
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        start: float = perf_counter()
+        super(TimedNavBar, self).paintEvent(event)
+        self.paintTimes.append((perf_counter() - start) * 1000.0)
+
+
+def percentile(values: List[float], percent: float) -> float:
+    values = sorted(values)
+    return values[min(int(len(values) * percent / 100.0), len(values) - 1)] if values else 0.0
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    slides: int = int(sys.argv[1]) if len(sys.argv) > 1 else SLIDES
+
+    bar: TimedNavBar = TimedNavBar()
+    bar.horizontal = True
+    bar.items = "|".join("条目%02d" % i for i in range(ITEMS))
+    bar.resize(ITEMS * 90, 40)
+    bar.show()
+    app.processEvents()
+
+    clock: FrameClock = FrameClock()
+    clock.resetStats()
+    bar.paintTimes.clear()
+
+    # 在首尾之间来回滑动,每次等待滑动结束
+    start: float = perf_counter()
+    for i in range(slides):
+        bar.currentIndex = ITEMS - 1 if i % 2 == 0 else 0
+        while clock.isActive:
+            app.processEvents(QEventLoop.WaitForMoreEvents)
+        app.processEvents()
+    total: float = (perf_counter() - start) * 1000.0
+
+    stats: FrameStats = clock.stats(bar)
+    paints: List[float] = bar.paintTimes
+    print('NavBar x%d items, %d slides in %.0f ms' % (ITEMS, slides, total))
+    print('advance: %5d frames  average %.3f ms  max %.3f ms' % (stats.ticks, stats.averageTime, stats.maxTime))
+    print('paint:   %5d frames  average %.3f ms  p95 %.3f ms  max %.3f ms' % (
+        len(paints), sum(paints) / len(paints) if paints else 0.0, percentile(paints, 95),
+        max(paints) if paints else 0.0))
+    print('frames per slide: %.1f' % (len(paints) / slides if slides else 0.0))
@@ -0,0 +1,82 @@
+"""
+统计5000行的 NavListView 滚动时每帧的重绘耗时
+
+两级节点树全部展开共5000行, 每帧滚动一格鼠标滚轮的距离, 从顶部滚动到底部, 每帧处理事件完成重绘, 分别统计:
+1. cached: 当前实现, 委托缓存绘制样式(画笔/字体/尺寸), 样式属性改变时才重新生成
+2. uncached: 每帧丢弃缓存的绘制样式, 即每帧都重新读取属性并生成画笔和字体
+3. uniform: 开启统一行高, 视图按固定行高布局, 不再逐行调用 sizeHint
+以及重新布局全部行(doItemsLayout)的耗时
+
+用法: python benchmarks/navlistview_scroll.py [行数]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter
+from typing import Callable, List
+
+from PySide2.QtGui import QPaintEvent
+from PySide2.QtWidgets import QApplication, QScrollBar
+
+from benchmarks.navbar_frames import percentile
+from benchmarks.navmodel_items import makeItems
+from custom_widgets.navigation.navlistview.navlistview import NavDelegate, NavListView
+
+ROWS: int = 5000  # 默认行数
+WHEEL: int = 3  # 每帧滚动的步数, 即一格鼠标滚轮
+
+
+def measure(app: QApplication, items: str, mode: str) -> None:
+    view: NavListView = NavListView()
+    view.uniformHeight = mode == 'uniform'
+    view.items = items
+    view.resize(250, 600)
+    view.show()
+    app.processEvents()
+
+    delegate: NavDelegate = view.itemDelegate()
+    paints: List[float] = []
+    paintEvent: Callable[[QPaintEvent], None] = view.paintEvent
+
+    def timedPaintEvent(event: QPaintEvent) -> None:
+        start: float = perf_counter()
+        if mode == 'uncached': delegate.clearCache()
+        paintEvent(event)
+        paints.append((perf_counter() - start) * 1000.0)
+
+    view.paintEvent = timedPaintEvent
+
+    # 重新布局全部行
+    start: float = perf_counter()
+    view.doItemsLayout()
+    layout: float = (perf_counter() - start) * 1000.0
+
+    bar: QScrollBar = view.verticalScrollBar()
+    frames: List[float] = []
+    for value in range(0, bar.maximum() + bar.singleStep() * WHEEL, bar.singleStep() * WHEEL):
+        start = perf_counter()
+        bar.setValue(value)
+        app.processEvents()
+        frames.append((perf_counter() - start) * 1000.0)
+
+    print('%-9s %6d %10.3f %8d %10.3f %10.3f %10.1f' % (
+        mode, len(frames), sum(frames) / len(frames), len(paints), sum(paints) / len(paints) if paints else 0.0,
+        percentile(paints, 95), layout))
+
+    view.deleteLater()
+    app.processEvents()
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    rows: int = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+
+    items: str = ','.join(makeItems(rows, 2))
+    print('NavListView x%d rows, scroll %d steps per frame' % (rows, WHEEL))
+    print('%-9s %6s %10s %8s %10s %10s %10s' % ('mode', 'frames', 'frame ms', 'paints', 'paint ms', 'p95 ms', 'layout ms'))
+    for mode in ('cached', 'uncached', 'uniform'):
+        measure(app, items, mode)
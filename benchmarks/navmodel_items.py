@@ -0,0 +1,131 @@
+"""
+统计 NavModel.setItems 构建节点树的耗时
+
+按 "标题|父节点标题|是否展开|提示信息|左侧图标" 格式生成 1000/10000 个条目:
+1. setItems: 当前实现, 先按标题建立索引, 再一次遍历挂到父节点下
+2. old: 原实现, 每个父节点都重新拆分并遍历全部条目查找子节点, 只支持两级
+3. 三级节点树: 每个二级节点下再挂子节点, 原实现不支持, 只统计当前实现
+并检查两级节点树与原实现的结构一致
+
+用法: python benchmarks/navmodel_items.py [条目数量...], 默认统计 1000 10000, 结构不一致时返回非0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Tuple, AnyStr
+
+from PySide2.QtCore import QObject
+from PySide2.QtWidgets import QApplication
+
+from custom_widgets.navigation.navlistview.navlistview import NavModel
+
+COUNTS: List[int] = [1000, 10000]  # 默认条目数量
+CHILDREN: int = 19  # 每个节点的子节点数量
+
+
+def makeItems(count: int, levels: int) -> List[AnyStr]:
+    """ 生成 levels 级的节点树条目, 每个节点 CHILDREN 个子节点, 按层级依次排列, 父节点在前 """
+    items: List[AnyStr] = []
+    parents: Deque[Tuple[AnyStr, int]] = deque()  # 等待挂子节点的 (标题, 层级)
+    children: int = 0  # 当前父节点已有的子节点数量
+    while items.__len__() < count:
+        if parents and children >= CHILDREN:
+            parents.popleft()
+            children = 0
+            continue
+
+        # 没有等待的父节点时新建顶层节点
+        parentText, level = parents[0] if parents else ('', 0)
+        index: int = items.__len__()
+        text: AnyStr = 'node%05d' % index
+        items.append('%s|%s|%d|%d|0x%x' % (text, parentText, index % 2, index, 0xf030 + index % 16))
+        children += 1 if parents else 0
+        if level + 1 < levels: parents.append((text, level + 1))
+    return items
+
+
+def oldSetItems(items: List[AnyStr]) -> List[NavModel.TreeNode]:
+    """ 原实现: 每个父节点重新遍历全部条目查找子节点 """
+    treeNode: List[NavModel.TreeNode] = []
+    count: int = len(items)
+    for i in range(count):
+        lists: List[AnyStr] = items[i].split("|")
+        if len(lists) < 5:
+            continue
+
+        text, parentText, expand, tip, icon = lists[:5]
+        if parentText == '':
+            node: NavModel.TreeNode = NavModel.TreeNode()
+            node.level = 1
+            node.expand = int(expand)
+            if icon != '':
+                node.icon = chr(int(icon, 16))
+            node.text = text
+            node.tip = tip
+            node.parentText = parentText
+
+            for j in range(count):
+                childList: List[AnyStr] = items[j].split("|")
+                if len(childList) < 5:
+                    continue
+
+                childText, childParentText, _, childTip, childIcon = childList[:5]
+                childIcon = childIcon.replace("0x", "")
+                if childParentText == text:
+                    childNode: NavModel.TreeNode = NavModel.TreeNode()
+                    childNode.level = 2
+                    childNode.last = j == count - 1
+                    if childIcon != '':
+                        childNode.icon = chr(int(childIcon, 16))
+                    childNode.text = childText
+                    childNode.tip = childTip
+                    childNode.parentText = childParentText
+                    node.children.append(childNode)
+            treeNode.append(node)
+    return treeNode
+
+
+def structure(nodes: List[NavModel.TreeNode]) -> List[Tuple]:
+    return [(node.text, node.level, node.icon, node.tip, structure(node.children)) for node in nodes]
+
+
+def measure(model: NavModel, count: int) -> bool:
+    items: List[AnyStr] = makeItems(count, 2)
+    start: float = perf_counter()
+    model.setItems(items)
+    new: float = (perf_counter() - start) * 1000.0
+    rows: int = model.rowCount()
+
+    start = perf_counter()
+    oldNodes: List[NavModel.TreeNode] = oldSetItems(items)
+    old: float = (perf_counter() - start) * 1000.0
+    same: bool = structure(model.treeNodes) == structure(oldNodes)
+
+    deepItems: List[AnyStr] = makeItems(count, 3)
+    start = perf_counter()
+    model.setItems(deepItems)
+    deep: float = (perf_counter() - start) * 1000.0
+
+    print('%-8d %12.1f %12.1f %8d  %-5s %12.1f %8d' % (
+        count, new, old, rows, 'ok' if same else 'FAIL', deep, model.rowCount()))
+    return same
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    counts: List[int] = [int(arg) for arg in sys.argv[1:]] or COUNTS
+
+    owner: QObject = QObject()
+    model: NavModel = NavModel(owner)
+    passed: bool = True
+    print('%-8s %12s %12s %8s  %-5s %12s %8s' % ('items', 'setItems ms', 'old ms', 'rows', 'same', '3-level ms', 'rows'))
+    for count in counts:
+        passed &= measure(model, count)
+
+    sys.exit(0 if passed else 1)
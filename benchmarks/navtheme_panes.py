@@ -0,0 +1,87 @@
+"""
+统计50个导航面板切换样式的耗时
+
+同一窗口中的50个导航面板(每个8个按钮)在两套配色之间来回切换, 对比:
+1. IconHelper: 每个面板各自生成并设置样式表, 每次都重新解析样式表并 polish 面板
+2. NavTheme: 相同参数的样式表只生成一次, 统一设置在窗口上, 面板只切换 navTheme 属性
+每轮耗时包含下一轮事件循环中的样式应用和重新 polish
+
+用法: python benchmarks/navtheme_panes.py [切换次数]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from PySide2.QtWidgets import QApplication, QGridLayout, QToolButton, QVBoxLayout, QWidget
+
+from custom_widgets.iconhelper.iconhelper import IconHelper, NavTheme
+
+PANES: int = 50  # 面板数量
+BUTTONS: int = 8  # 每个面板的按钮数量
+SWITCHES: int = 10  # 默认切换次数
+THEMES: List[Tuple[str, str, str, str]] = [("#292F38", "#1D2025", "#54626F", "#FDFDFD"),
+                                           ("#2FC5A2", "#3EA7E9", "#EEEEEE", "#FFFFFF")]  # 背景/加深背景/文字/加深文字
+
+
+def makePanes(window: QWidget) -> List[Tuple[QWidget, List[QToolButton]]]:
+    layout: QGridLayout = QGridLayout(window)
+    panes: List[Tuple[QWidget, List[QToolButton]]] = []
+    for i in range(PANES):
+        pane: QWidget = QWidget(window)
+        pane.setObjectName('pane%02d' % i)
+        paneLayout: QVBoxLayout = QVBoxLayout(pane)
+        buttons: List[QToolButton] = []
+        for j in range(BUTTONS):
+            button: QToolButton = QToolButton(pane)
+            button.setText('button%d' % j)
+            paneLayout.addWidget(button)
+            buttons.append(button)
+        layout.addWidget(pane, i // 10, i % 10)
+        panes.append((pane, buttons))
+    return panes
+
+
+def restyle(app: QApplication, panes: List[Tuple[QWidget, List[QToolButton]]], switches: int,
+            setStyle: Callable[..., None]) -> List[float]:
+    """ 在两套配色之间切换 switches 次, 返回每次切换50个面板的耗时毫秒 """
+    times: List[float] = []
+    chars: List[int] = [0xf030 + i for i in range(BUTTONS)]
+    for i in range(switches):
+        normalBg, darkBg, normalText, darkText = THEMES[i % THEMES.__len__()]
+        start: float = perf_counter()
+        for pane, buttons in panes:
+            setStyle(pane, buttons, chars, normal_bg_color=normalBg, dark_bg_color=darkBg,
+                     normal_text_color=normalText, dark_text_color=darkText)
+        app.processEvents()
+        times.append((perf_counter() - start) * 1000.0)
+    return times
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    switches: int = int(sys.argv[1]) if len(sys.argv) > 1 else SWITCHES
+
+    print('%d panes x %d buttons, %d switches' % (PANES, BUTTONS, switches))
+    print('%-12s %12s %12s %12s' % ('method', 'first ms', 'average ms', 'max ms'))
+    for name in ('IconHelper', 'NavTheme'):
+        # 每种方式使用独立的窗口, 互不影响
+        window: QWidget = QWidget()
+        panes: List[Tuple[QWidget, List[QToolButton]]] = makePanes(window)
+        window.resize(1200, 1200)
+        window.show()
+        app.processEvents()
+
+        setStyle: Callable[..., None] = IconHelper().setStyleForNavPane if name == 'IconHelper' \
+            else NavTheme(window).setStyleForNavPane
+        times: List[float] = restyle(app, panes, switches, setStyle)
+        rest: List[float] = times[1:] or times
+        print('%-12s %12.1f %12.1f %12.1f' % (name, times[0], sum(rest) / len(rest), max(rest)))
+
+        window.deleteLater()
+        app.processEvents()
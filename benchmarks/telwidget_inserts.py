@@ -0,0 +1,122 @@
+"""
+统计 TelWidget 逐个添加联系人的耗时
+
+模拟同步数据逐个到达, 每添加一个联系人处理一次事件循环, 分别统计 1000/10000 个联系人:
+1. addInfo: 当前实现, 只转换新姓名, 二分插入一个按钮, 出现新字母时再插入一个分隔
+2. setInfo: 原实现, 每添加一个联系人都整体重建所有按钮和分隔, 耗时随联系人数量平方增长,
+   只统计添加到最后时的若干次, 即此时每添加一个联系人的耗时
+3. addInfos: 一次批量添加全部联系人
+并检查逐个添加与批量添加后联系人顺序和位置一致
+
+用法: python benchmarks/telwidget_inserts.py [联系人数量...], 默认统计 1000 10000, 结果不一致时返回非0
+"""
+
+import os
+import sys
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# telwidget 按目录导入同目录的资源模块 main.py
+sys.path.insert(0, os.path.join(ROOT, 'custom_widgets', 'telwidget'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from random import Random
+from time import perf_counter
+from typing import List, Tuple
+
+from PySide2.QtGui import QPixmap
+from PySide2.QtWidgets import QApplication
+
+from custom_widgets.telwidget.telwidget import TelAvatar, TelButton, TelWidget
+
+COUNTS: List[int] = [1000, 10000]  # 默认联系人数量
+SAMPLES: int = 5  # 统计最后添加的次数, 原实现在10000个联系人时每次重建约需十几秒
+SURNAMES: str = "王李张刘陈杨黄赵吴周徐孙马朱胡郭何高林罗郑梁谢宋唐许韩冯邓曹彭曾肖田董袁潘于蒋蔡余杜叶程苏魏吕丁任沈"
+GIVEN: str = "伟芳娜秀英敏静丽强磊军洋勇艳杰娟涛明超兰霞平刚桂华建国志文红玉凤晨鹏辉欣怡子涵雨轩浩宇思博"
+TYPES: List[str] = ["住宅", "家里", "公司"]
+
+
+def makeInfos(count: int, seed: int = 0) -> List[Tuple[str, str, str, QPixmap]]:
+    random: Random = Random(seed)
+    pixmaps: List[QPixmap] = [TelAvatar().pixmap(":/image/img%d.jpg" % i) for i in range(10)]
+    return [(random.choice(SURNAMES) + ''.join(random.choice(GIVEN) for _ in range(random.randint(1, 2))),
+             random.choice(TYPES), '1381234%04d' % i, random.choice(pixmaps)) for i in range(count)]
+
+
+def newWidget(app: QApplication) -> TelWidget:
+    widget: TelWidget = TelWidget()
+    widget.resize(300, 500)
+    widget.show()
+    app.processEvents()
+    return widget
+
+
+def settle(app: QApplication, widget: TelWidget) -> List[Tuple[str, str, int]]:
+    """ 等待排列完成, 返回按位置排序的 (姓名, 电话, 纵坐标) """
+    widget.letterPosition('A')
+    app.processEvents()
+    buttons: List[TelButton] = widget.findChildren(TelButton)
+    return sorted((button.name, button.tel, button.y()) for button in buttons if button.isVisible())
+
+
+def measure(app: QApplication, infos: List[Tuple[str, str, str, QPixmap]]) -> bool:
+    count: int = infos.__len__()
+
+    # 逐个添加
+    widget: TelWidget = newWidget(app)
+    times: List[float] = []
+    start: float = perf_counter()
+    for info in infos:
+        begin: float = perf_counter()
+        widget.addInfo(*info)
+        app.processEvents()
+        times.append((perf_counter() - begin) * 1000.0)
+    total: float = perf_counter() - start
+    positions: List[Tuple[str, str, int]] = settle(app, widget)
+    widget.deleteLater()
+    app.processEvents()
+
+    # 原实现: 先批量添加到只差最后几个, 再逐个追加并整体重建
+    widget = newWidget(app)
+    widget.addInfos(infos[:count - SAMPLES])
+    app.processEvents()
+    rebuilds: List[float] = []
+    for info in infos[count - SAMPLES:]:
+        begin: float = perf_counter()
+        widget.names.append(info[0])
+        widget.types.append(info[1])
+        widget.tels.append(info[2])
+        widget.pixmaps.append(info[3])
+        widget.setInfo()
+        app.processEvents()
+        rebuilds.append((perf_counter() - begin) * 1000.0)
+    widget.deleteLater()
+    app.processEvents()
+
+    # 批量添加
+    widget = newWidget(app)
+    start = perf_counter()
+    widget.addInfos(infos)
+    app.processEvents()
+    bulk: float = perf_counter() - start
+    same: bool = settle(app, widget) == positions
+    widget.deleteLater()
+    app.processEvents()
+
+    last: List[float] = times[-SAMPLES:]
+    print('%-8d %-10s %10.2f %10.2f %10.1f' % (count, 'addInfo', sum(times) / count, sum(last) / last.__len__(), total))
+    print('%-8d %-10s %10s %10.2f %10s' % (count, 'setInfo', '-', sum(rebuilds) / rebuilds.__len__(), '-'))
+    print('%-8d %-10s %10s %10s %10.1f  %s' % (count, 'addInfos', '-', '-', bulk, 'same' if same else 'FAIL'))
+    return same
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    counts: List[int] = [int(arg) for arg in sys.argv[1:]] or COUNTS
+
+    passed: bool = True
+    print('%-8s %-10s %10s %10s %10s' % ('contacts', 'method', 'avg ms', 'last ms', 'total s'))
+    for count in counts:
+        passed &= measure(app, makeInfos(count))
+
+    sys.exit(0 if passed else 1)
@@ -0,0 +1,94 @@
+"""
+统计 TelWidget 惯性滑动时背景图片的重绘耗时
+
+通讯录设置背景图片, 高亮字母标签设置背景图片并保持显示, 模拟从顶部到底部的惯性滑动, 每帧处理事件完成重绘:
+1. cached: 当前实现, 缩放后的背景图片缓存到尺寸或图片改变为止
+2. scaled: 原实现, 每次重绘都平滑缩放背景图片
+分别统计 TelWidget.paintEvent 和 TelHigh.paintEvent 的平均耗时, 以及每帧的总耗时
+
+用法: python benchmarks/telwidget_repaint.py [联系人数量]
+"""
+
+import os
+import sys
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# telwidget 按目录导入同目录的资源模块 main.py
+sys.path.insert(0, os.path.join(ROOT, 'custom_widgets', 'telwidget'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter
+from typing import Callable, List
+
+from PySide2.QtGui import QPaintEvent, QPixmap
+from PySide2.QtWidgets import QApplication, QScrollArea, QWidget
+
+from benchmarks.telwidget_inserts import makeInfos
+from benchmarks.telwidget_scroll import average, kineticPositions
+from custom_widgets.telwidget.telwidget import TelHigh, TelPanel, TelWidget
+
+COUNT: int = 1000  # 默认联系人数量
+
+
+def timePaint(widget: QWidget, cache: str, cached: bool, times: List[float]) -> None:
+    """ 记录控件每次绘制的耗时, cached 为 False 时每次绘制前丢弃缓存的背景图片, 即原实现每次都缩放 """
+    paintEvent: Callable[[QPaintEvent], None] = widget.paintEvent
+
+    def timedPaintEvent(event: QPaintEvent) -> None:
+        start: float = perf_counter()
+        if not cached: setattr(widget, cache, QPixmap())
+        paintEvent(event)
+        times.append((perf_counter() - start) * 1000.0)
+
+    widget.paintEvent = timedPaintEvent
+
+
+def measure(app: QApplication, infos: list, cached: bool) -> None:
+    widget: TelWidget = TelWidget()
+    widget.bgImage = QPixmap(":/image/bg.jpg")
+    widget.telHighBgImage = QPixmap(":/image/letter.png")
+    widget.resize(300, 500)
+    widget.show()
+    widget.addInfos(infos)
+    widget.letterPosition('A')
+    app.processEvents()
+
+    # 高亮字母标签保持显示, 与单击字母导航后的位置一致
+    telHigh: TelHigh = widget.findChild(TelHigh)
+    panel: TelPanel = widget.findChild(TelPanel)
+    telHigh.resize(100, 55)
+    telHigh.move(panel.width() - telHigh.width() - 12, 100)
+    telHigh.show()
+    app.processEvents()
+
+    widgetTimes: List[float] = []
+    highTimes: List[float] = []
+    timePaint(widget, '_TelWidget__bgPixmap', cached, widgetTimes)
+    timePaint(telHigh, '_TelHigh__bgPixmap', cached, highTimes)
+
+    frames: List[float] = []
+    positions: List[int] = kineticPositions(widget.findChild(QScrollArea).verticalScrollBar().maximum())
+    for position in positions:
+        begin: float = perf_counter()
+        panel.position = position
+        app.processEvents()
+        frames.append((perf_counter() - begin) * 1000.0)
+
+    print('%-8s %6d %8.3f %8d %10.3f %8d %10.3f' % (
+        'cached' if cached else 'scaled', len(frames), average(frames),
+        len(widgetTimes), average(widgetTimes), len(highTimes), average(highTimes)))
+
+    widget.deleteLater()
+    app.processEvents()
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    infos: list = makeInfos(count)
+    print('TelWidget x%d contacts, kinetic scroll top to bottom' % count)
+    print('%-8s %6s %8s %8s %10s %8s %10s' % ('bg', 'frames', 'frame ms', 'paints', 'widget ms', 'paints', 'high ms'))
+    for cached in (True, False):
+        measure(app, infos, cached)
@@ -0,0 +1,129 @@
+"""
+统计 TelWidget 在10000个联系人中惯性滑动时每帧的字母查找耗时
+
+模拟面板的惯性滑动(每次滑动1200像素, OutCirc 曲线, 500毫秒约30帧), 从顶部一直滑到底部:
+1. letterAt: 当前实现, 按字母分隔的起始位置二分查找, 每帧滚动位置改变时调用
+2. scan: 原实现, 每帧遍历所有按钮比较位置
+3. frame: 每帧设置滚动位置并处理事件(包括重绘)的总耗时
+4. letterPosition/letterClicked: 依次跳转到每个字母, 当前实现与原实现遍历按钮的耗时
+分别统计普通模式和虚拟列表模式, 虚拟列表模式没有全部按钮, 不统计原实现
+
+用法: python benchmarks/telwidget_scroll.py [联系人数量]
+"""
+
+import os
+import sys
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# telwidget 按目录导入同目录的资源模块 main.py
+sys.path.insert(0, os.path.join(ROOT, 'custom_widgets', 'telwidget'))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from time import perf_counter
+from typing import List
+
+from PySide2.QtCore import QEasingCurve
+from PySide2.QtWidgets import QApplication, QScrollArea, QWidget
+
+from benchmarks.telwidget_inserts import makeInfos
+from custom_widgets.telwidget.telwidget import TelPanel, TelWidget
+
+COUNT: int = 10000  # 默认联系人数量
+STEP: int = 1200  # 每次滑动的距离,与 TelPanel.step 一致
+FRAMES: int = 30  # 每次滑动的帧数
+
+
+def oldLetterAt(items: List[QWidget], value: int) -> str:
+    """ 原实现: 遍历所有按钮, 找到与当前位置相邻的按钮 """
+    for item in items:
+        if abs(item.pos().y() - (value + 20)) < 5:
+            return str(item.letter)
+    return ''
+
+
+def oldLetterPosition(items: List[QWidget], letter: str) -> int:
+    """ 原实现: 遍历所有按钮, 找到字母下的第一个按钮 """
+    for item in items:
+        if str(item.letter) == letter:
+            return item.pos().y()
+    return -1
+
+
+def kineticPositions(maximum: int) -> List[int]:
+    """ 从顶部滑动到底部每帧的滚动位置 """
+    curve: QEasingCurve = QEasingCurve(QEasingCurve.OutCirc)
+    positions: List[int] = []
+    start: int = 0
+    while start < maximum:
+        end: int = min(start + STEP, maximum)
+        positions.extend(int(start + (end - start) * curve.valueForProgress(i / FRAMES)) for i in range(1, FRAMES + 1))
+        start = end
+    return positions
+
+
+def average(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def measure(app: QApplication, infos: list, virtual: bool) -> None:
+    widget: TelWidget = TelWidget()
+    widget.virtual = virtual
+    widget.resize(300, 500)
+    widget.show()
+    widget.addInfos(infos)
+    widget.letterPosition('A')
+    app.processEvents()
+
+    panel: TelPanel = widget.findChild(TelPanel)
+    positions: List[int] = kineticPositions(widget.findChild(QScrollArea).verticalScrollBar().maximum())
+    items: List[QWidget] = [] if virtual else widget._TelWidget__items
+
+    lookups: List[float] = []
+    scans: List[float] = []
+    frames: List[float] = []
+    for position in positions:
+        begin: float = perf_counter()
+        panel.position = position
+        app.processEvents()
+        frames.append((perf_counter() - begin) * 1000.0)
+
+        begin = perf_counter()
+        widget.letterAt(position + 20)
+        lookups.append((perf_counter() - begin) * 1e6)
+
+        if items:
+            begin = perf_counter()
+            oldLetterAt(items, position)
+            scans.append((perf_counter() - begin) * 1e6)
+
+    jumps: List[float] = []
+    oldJumps: List[float] = []
+    for letter in TelWidget.TEXTS:
+        begin = perf_counter()
+        widget.letterPosition(letter)
+        jumps.append((perf_counter() - begin) * 1e6)
+
+        if items:
+            begin = perf_counter()
+            oldLetterPosition(items, letter)
+            oldJumps.append((perf_counter() - begin) * 1e6)
+
+    mode: str = 'virtual' if virtual else 'widgets'
+    print('%-8s %6d frames  frame %.3f ms  letterAt %.1f us  scan %s' % (
+        mode, len(positions), average(frames), average(lookups), '%.1f us' % average(scans) if scans else '-'))
+    print('%-8s %6d jumps   letterPosition %.1f us  scan %s' % (
+        mode, len(jumps), average(jumps), '%.1f us' % average(oldJumps) if oldJumps else '-'))
+
+    widget.deleteLater()
+    app.processEvents()
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else COUNT
+
+    infos: list = makeInfos(count)
+    print('TelWidget x%d contacts, kinetic scroll top to bottom' % count)
+    for virtual in (False, True):
+        measure(app, infos, virtual)
@@ -0,0 +1,137 @@
+"""
+统计空闲动画控件的定时器唤醒次数
+
+每种控件创建100个,在 offscreen 平台下显示并触发一次动画:
+1. 动画全部结束后统计1秒内的 QEvent.Timer 事件数,应为0
+2. 重新触发动画后立即隐藏,统计1秒内的 QEvent.Timer 事件数,应为0
+3. 重新显示后动画继续并最终结束
+
+用法: python benchmarks/timer_wakeups.py, 有唤醒时返回非0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from typing import Callable, List, Tuple
+
+from PySide2.QtCore import QObject, QEvent, QElapsedTimer
+from PySide2.QtWidgets import QApplication, QWidget
+
+from custom_widgets.squiggle.waveline import WaveLine
+from custom_widgets.progressbar.progressbutton import ProgressButton
+from custom_widgets.switchbutton.switchbutton import SwitchButton
+from custom_widgets.navigation.navbar.navbar import NavBar
+
+COUNT: int = 100  # 每种控件的数量
+
+
+class TimerCounter(QObject):
+    """ 应用级事件过滤器,统计所有对象收到的定时器事件 """
+
+    def __init__(self):
+        super(TimerCounter, self).__init__()
+        self.count: int = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Timer: self.count += 1
+        return False
+
+
+def run(app: QApplication, ms: int) -> None:
+    timer: QElapsedTimer = QElapsedTimer()
+    timer.start()
+    while timer.elapsed() < ms:
+        app.processEvents()
+
+
+def wakeups(app: QApplication, counter: TimerCounter, ms: int = 1000) -> int:
+    counter.count = 0
+    run(app, ms)
+    return counter.count
+
+
+def createWaveLine() -> WaveLine:
+    widget: WaveLine = WaveLine()
+    widget.resize(200, 100)
+    return widget
+
+
+def startWaveLine(widget: WaveLine, step: int) -> None:
+    widget.setData([(i * (step + 7)) % 50 for i in range(100)])
+
+
+def createProgressButton() -> ProgressButton:
+    widget: ProgressButton = ProgressButton()
+    widget.resize(200, 60)
+    return widget
+
+
+def startProgressButton(widget: ProgressButton, step: int) -> None:
+    widget.mousePressEvent(None)
+
+
+def createSwitchButton() -> SwitchButton:
+    widget: SwitchButton = SwitchButton()
+    widget.animation = True
+    widget.resize(70, 30)
+    return widget
+
+
+def startSwitchButton(widget: SwitchButton, step: int) -> None:
+    widget.mousePressEvent(None)
+
+
+def createNavBar() -> NavBar:
+    widget: NavBar = NavBar()
+    widget.resize(500, 40)
+    return widget
+
+
+def startNavBar(widget: NavBar, step: int) -> None:
+    widget.setCurrentIndex(4 if step % 2 == 0 else 0)
+
+
+# (控件名, 创建函数, 触发动画函数(参数为第几次触发), 等待动画结束的毫秒数)
+WIDGETS: List[Tuple[str, Callable[[], QWidget], Callable[[QWidget, int], None], int]] = [
+    ('WaveLine', createWaveLine, startWaveLine, 3000),
+    ('ProgressButton', createProgressButton, startProgressButton, 8000),
+    ('SwitchButton', createSwitchButton, startSwitchButton, 1000),
+    ('NavBar', createNavBar, startNavBar, 1000),
+]
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    counter: TimerCounter = TimerCounter()
+    app.installEventFilter(counter)
+
+    failed: bool = False
+    for name, create, start, settle in WIDGETS:
+        widgets: List[QWidget] = [create() for _ in range(COUNT)]
+        for widget in widgets: widget.show()
+        run(app, 100)
+
+        for widget in widgets: start(widget, 0)
+        run(app, settle)
+        idle: int = wakeups(app, counter)
+
+        for widget in widgets: start(widget, 1)
+        for widget in widgets: widget.hide()
+        hidden: int = wakeups(app, counter)
+
+        for widget in widgets: widget.show()
+        resumed: int = wakeups(app, counter, 200)
+        run(app, settle)
+        settled: int = wakeups(app, counter)
+
+        print('%-16s x%d  idle: %5d/s  hidden mid-animation: %5d/s  resumed: %s  idle again: %5d/s' % (
+            name, COUNT, idle, hidden, 'yes' if resumed else 'no', settled))
+        failed = failed or idle != 0 or hidden != 0 or resumed == 0 or settled != 0
+
+        for widget in widgets: widget.deleteLater()
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,99 @@
+"""
+统计 WaveLine 在不同数据量下每帧的耗时
+
+400像素宽的波形图分别保存 1000/10000/100000 个数据, 按列抽稀开启和关闭时各统计:
+1. stream: 每帧追加1%的采样数据并立即重绘, 即传感器数据流的场景
+2. ease: 每帧由 updateData 向新的目标数据过渡一步并立即重绘, 即 setData 后的过渡动画
+3. paint: 上述帧中 paintEvent 的平均耗时
+
+用法: python benchmarks/waveline_frames.py [每组帧数]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from array import array
+from random import Random
+from time import perf_counter
+from typing import List
+
+from PySide2.QtGui import QPaintEvent
+from PySide2.QtWidgets import QApplication
+
+from custom_widgets.squiggle.waveline import WaveLine
+
+COUNTS: List[int] = [1000, 10000, 100000]  # 数据个数
+FRAMES: int = 20  # 默认每组帧数
+WIDTH: int = 400  # 控件宽度
+
+
+class TimedWaveLine(WaveLine):
+    """ 记录每次绘制耗时的波形图 """
+
+    def __init__(self, parent=None):
+        super(TimedWaveLine, self).__init__(parent)
+        self.paintTimes: List[float] = []
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        start: float = perf_counter()
+        super(TimedWaveLine, self).paintEvent(event)
+        self.paintTimes.append((perf_counter() - start) * 1000.0)
+
+
+def samples(random: Random, count: int) -> array:
+    return array('d', (random.uniform(0, 100) for _ in range(count)))
+
+
+def streamFrames(wave: TimedWaveLine, random: Random, count: int, frames: int) -> float:
+    """ 每帧追加1%的数据并重绘, 返回平均每帧耗时毫秒 """
+    chunks: List[array] = [samples(random, max(1, count // 100)) for _ in range(frames)]
+    start: float = perf_counter()
+    for chunk in chunks:
+        wave.appendSamples(chunk)
+        wave.repaint()
+    return (perf_counter() - start) * 1000.0 / frames
+
+
+def easeFrames(wave: TimedWaveLine, random: Random, count: int, frames: int) -> float:
+    """ 设置新的目标数据后每帧过渡一步并重绘, 返回平均每帧耗时毫秒 """
+    wave.step = 1
+    wave.setData(list(samples(random, count)))
+    start: float = perf_counter()
+    for _ in range(frames):
+        wave.updateData(10)
+        wave.repaint()
+    return (perf_counter() - start) * 1000.0 / frames
+
+
+if __name__ == '__main__':
+    app: QApplication = QApplication(sys.argv)
+    frames: int = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    random: Random = Random(0)
+
+    print('WaveLine %dpx, %d frames each' % (WIDTH, frames))
+    print('%-8s %-10s %12s %12s %12s' % ('samples', 'decimation', 'stream ms', 'ease ms', 'paint ms'))
+    for count in COUNTS:
+        for decimation in (True, False):
+            wave: TimedWaveLine = TimedWaveLine()
+            wave.decimation = decimation
+            wave.capacity = count
+            wave.resize(WIDTH, 200)
+            wave.show()
+            wave.appendSamples(samples(random, count))
+            app.processEvents()
+            # 预热: 首次绘制会初始化画笔和后备缓冲区
+            streamFrames(wave, random, count, 2)
+            wave.paintTimes.clear()
+
+            stream: float = streamFrames(wave, random, count, frames)
+            ease: float = easeFrames(wave, random, count, frames)
+            paints: List[float] = wave.paintTimes
+            print('%-8d %-10s %12.2f %12.2f %12.2f' % (
+                count, 'on' if decimation else 'off', stream, ease, sum(paints) / len(paints) if paints else 0.0))
+
+            wave.hide()
+            wave.deleteLater()
+            app.processEvents()
@@ -0,0 +1,93 @@
+"""
+统计 ZhToPY 逐字转换的耗时
+
+同一段中英文混合文本, 对比每个字符的平均转换耗时:
+1. before: 原实现, 拼音保存为 QByteArray 列表, 每个汉字都要 data().decode(), 简拼每次调用都拼接首字母字符串
+2. after: 当前实现, 拼音池 + 下标索引, 简拼使用 str.translate 转换表
+并检查两者的转换结果一致
+
+用法: python benchmarks/zhtopy_chars.py [重复次数], 结果不一致时返回非0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from timeit import timeit
+from typing import List, AnyStr
+
+from PySide2.QtCore import QByteArray, QFile
+
+from custom_widgets.zhtopy.zhtopy import ZhToPY, initResources
+
+TEXT: str = "2019年2月16日 feiyangqingyun 汉字转拼音类, 支持汉字转拼音、汉字转拼音简拼以及汉字转拼音首字母; " \
+            "译者 sunchuquin 将其移植到 PySide2, 用于通讯录按字母分组和搜索联系人 ABC-123"  # 约110个字符
+REPEAT: int = 2000  # 默认重复次数
+
+
+class OldZhToPY:
+    """ 原实现的拼音转换, 仅用于对比耗时 """
+
+    def __init__(self, listJP: List[str], file_name: str = ":/image/zhtopy.txt"):
+        self.__listJP: List[str] = listJP
+        self.__listPY: List[QByteArray] = []
+        initResources()
+        file: QFile = QFile(file_name)
+        if file.open(QFile.ReadOnly | QFile.Text):
+            text: QByteArray = file.readAll()
+            self.__listPY = text.split(" ")
+
+    def zhToPY(self, chinese: str) -> str:
+        if not self.__listPY.__len__(): return ""
+
+        items: List[AnyStr] = []
+        for i in range(chinese.__len__()):
+            unicode: int = ord(chinese[i])
+            if 0x9FA5 > unicode >= 0x4E00:
+                items.append(self.__listPY[unicode - 0x4E00].data().decode())
+            else:
+                items.append(chinese[i])
+        return ' '.join(items)
+
+    def zhToJP(self, chinese: str) -> str:
+        strChineseFirstPY: str = ''.join(self.__listJP)
+        if not chinese.__len__(): return chinese
+
+        item: str = ''
+        for i in range(chinese.__len__()):
+            vChar: int = ord(chinese[i])
+            if ord('a') <= vChar <= ord('z') or ord('A') <= vChar <= ord('Z'):
+                item += chinese[i].upper()
+
+            if ord('0') <= vChar <= ord('9'):
+                item += chinese[i]
+            else:
+                index: int = vChar - 19968
+                if 0 <= index < strChineseFirstPY.__len__():
+                    item += strChineseFirstPY[index]
+        return item
+
+
+def nsPerChar(func, repeat: int) -> float:
+    return timeit(lambda: func(TEXT), number=repeat) * 1e9 / (repeat * TEXT.__len__())
+
+
+if __name__ == '__main__':
+    repeat: int = int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT
+
+    new: ZhToPY = ZhToPY()
+    old: OldZhToPY = OldZhToPY(new._ZhToPY__listJP)
+
+    passed: bool = True
+    print('%d chars x %d' % (TEXT.__len__(), repeat))
+    print('%-8s %14s %14s %8s  %s' % ('method', 'before ns/char', 'after ns/char', 'speedup', 'same'))
+    for name in ('zhToPY', 'zhToJP'):
+        before: float = nsPerChar(getattr(old, name), repeat)
+        after: float = nsPerChar(getattr(new, name), repeat)
+        same: bool = getattr(old, name)(TEXT) == getattr(new, name)(TEXT)
+        passed &= same
+        print('%-8s %14.1f %14.1f %7.1fx  %s' % (name, before, after, before / after, 'ok' if same else 'FAIL'))
+
+    sys.exit(0 if passed else 1)
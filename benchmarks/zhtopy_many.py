@@ -0,0 +1,59 @@
+"""
+统计 ZhToPY 批量转换与逐个转换的耗时
+
+随机生成由2~3个常用汉字组成的姓名, 对比:
+1. loop: 逐个调用 zhToPY/zhToJP 的循环
+2. many: 一次调用 zhToPYMany/zhToJPMany 批量转换
+并检查两者的转换结果一致
+
+用法: python benchmarks/zhtopy_many.py [姓名数量...], 默认统计 10000 100000 1000000, 结果不一致时返回非0
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from random import Random
+from time import perf_counter
+from typing import Callable, List, Tuple
+
+from custom_widgets.zhtopy.zhtopy import ZhToPY
+
+COUNTS: List[int] = [10000, 100000, 1000000]  # 默认姓名数量
+SURNAMES: str = "王李张刘陈杨黄赵吴周徐孙马朱胡郭何高林罗郑梁谢宋唐许韩冯邓曹彭曾肖田董袁潘于蒋蔡余杜叶程苏魏吕丁任沈"
+GIVEN: str = "伟芳娜秀英敏静丽强磊军洋勇艳杰娟涛明超兰霞平刚桂华建国志文红玉凤晨鹏辉欣怡子涵雨轩浩宇思博"
+
+
+def makeNames(count: int, seed: int = 0) -> List[str]:
+    random: Random = Random(seed)
+    return [random.choice(SURNAMES) + ''.join(random.choice(GIVEN) for _ in range(random.randint(1, 2)))
+            for _ in range(count)]
+
+
+def measure(func: Callable[[], List[str]]) -> Tuple[float, List[str]]:
+    start: float = perf_counter()
+    result: List[str] = func()
+    return perf_counter() - start, result
+
+
+if __name__ == '__main__':
+    counts: List[int] = [int(arg) for arg in sys.argv[1:]] or COUNTS
+    zh: ZhToPY = ZhToPY()
+    # 首次批量转换会构建全拼转换表, 预先构建以免计入第一组
+    zh.zhToPYMany(makeNames(10))
+
+    passed: bool = True
+    print('%-8s %-6s %10s %10s %8s  %s' % ('names', 'method', 'loop s', 'many s', 'speedup', 'same'))
+    for count in counts:
+        names: List[str] = makeNames(count)
+        for method, single, many in (('PY', zh.zhToPY, zh.zhToPYMany), ('JP', zh.zhToJP, zh.zhToJPMany)):
+            loop, expected = measure(lambda: [single(name) for name in names])
+            batch, result = measure(lambda: many(names))
+            same: bool = result == expected
+            passed &= same
+            print('%-8d %-6s %10.3f %10.3f %7.1fx  %s' % (
+                count, method, loop, batch, loop / batch if batch else 0.0, 'ok' if same else 'FAIL'))
+
+    sys.exit(0 if passed else 1)
@@ -406,7 +406,7 @@ if __name__ == '__main__':
     from PySide2.QtCore import QTextCodec
     from PySide2.QtGui import QFontDatabase
     from PySide2.QtWidgets import QApplication, QGridLayout
-    from custom_widgets.iconhelper.resource import *
+    from custom_widgets.iconhelper.iconhelper import initResources
 
     class FrmColorButton(QWidget):
         def __init__(self, parent: QWidget = None):
@@ -416,6 +416,7 @@ if __name__ == '__main__':
             # 判断图形字体是否存在，不存在则加入
             fontDb: QFontDatabase = QFontDatabase()
             if not fontDb.families().__contains__("FontAwesome"):
+                initResources()
                 fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
                 fontName: List[str] = fontDb.applicationFontFamilies(fontId)
                 if len(fontName) == 0:
@@ -4,7 +4,7 @@ from PySide2.QtCore import QEvent, QSize, Signal, Qt, QRect
 from PySide2.QtGui import QColor, QMouseEvent, QPaintEvent, QPainter, QFont, QFontDatabase, QPen
 from PySide2.QtWidgets import QWidget
 
-from custom_widgets.iconhelper.resource import *
+from custom_widgets.iconhelper.iconhelper import initResources
 
 class ColorStyle(QWidget):
     """
@@ -31,6 +31,7 @@ class ColorStyle(QWidget):
         # 判断图形字体是否存在，不存在则加入
         fontDb: QFontDatabase = QFontDatabase()
         if not fontDb.families().__contains__("FontAwesome"):
+            initResources()
             fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
             fontName: List[str] = fontDb.applicationFontFamilies(fontId)
             if len(fontName) == 0:
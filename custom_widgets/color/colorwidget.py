@@ -2,14 +2,7 @@ from PySide2.QtCore import QObject, QTimer, Qt, QSize
 from PySide2.QtGui import QClipboard, QMouseEvent, QFont, QCursor, QScreen, QPixmap, QImage, QColor
 from PySide2.QtWidgets import QWidget, QGridLayout, QVBoxLayout, QLabel, QLineEdit, QSizePolicy, QFrame, QApplication
 
-
-class Singleton(type(QObject), type):
-    _instances = {}
-
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+from custom_widgets.singleton.singleton import Singleton
 
 
 class ColorWidget(QWidget, metaclass=Singleton):
@@ -0,0 +1,184 @@
+"""
+全局动画时钟
+
+所有动画控件共用一个定时器,而不是各自持有一个 QTimer/QPropertyAnimation 互相错开节拍:
+1. 控件开始动画时订阅时钟,动画结束或隐藏时取消订阅,没有订阅者时定时器停止
+2. 每一帧依次推进所有订阅者,回调参数为距上次回调经过的毫秒数,控件按实际经过时间计算步长
+3. 同一帧内各控件调用的 update() 在同一次事件循环中合并重绘,不再按各自的节拍分散重绘
+4. 可设置帧率上限,订阅时可指定回调间隔(如报警闪烁),定时器按最近到期的订阅者单次唤醒,
+   只有报警闪烁之类的间隔订阅者时不会按帧率空转
+5. 按订阅者(回调所属对象)统计回调次数/总耗时/最大耗时
+"""
+
+from math import ceil
+from time import perf_counter
+from typing import Callable, Dict, Optional
+from weakref import WeakKeyDictionary
+
+import shiboken2
+from PySide2.QtCore import QObject, QTimer, Qt
+
+from custom_widgets.singleton.singleton import Singleton
+
+
+class FrameStats:
+    """ 订阅者的回调耗时统计,时间单位为毫秒 """
+
+    def __init__(self):
+        self.ticks: int = 0  # 回调次数
+        self.totalTime: float = 0.0  # 回调总耗时
+        self.maxTime: float = 0.0  # 单次回调最大耗时
+        self.lastTime: float = 0.0  # 最近一次回调耗时
+
+    @property
+    def averageTime(self) -> float:
+        return self.totalTime / self.ticks if self.ticks else 0.0
+
+    def __repr__(self) -> str:
+        return 'FrameStats(ticks=%d, total=%.3fms, average=%.3fms, max=%.3fms)' % (
+            self.ticks, self.totalTime, self.averageTime, self.maxTime)
+
+
+class FrameClock(QObject, metaclass=Singleton):
+    """ 全局动画时钟,进程内唯一 """
+
+    # 单帧最多推进的毫秒数,避免界面卡顿后动画一次跳到终点
+    MAX_ELAPSED: float = 100.0
+
+    class Subscriber:
+        """ 订阅记录 """
+
+        def __init__(self, callback: Callable[[float], None], interval: float, owner: object):
+            self.callback: Callable[[float], None] = callback  # 回调,参数为经过的毫秒数
+            self.interval: float = interval  # 回调间隔,0 表示每帧回调
+            self.owner: object = owner  # 回调所属对象,已销毁时自动取消订阅
+            self.elapsed: float = 0.0  # 距上次回调累计的毫秒数
+
+    def __init__(self):
+        super().__init__()
+        self.__fps: int = 60  # 帧率上限
+        self.__subscribers: Dict[Callable, FrameClock.Subscriber] = {}  # 按订阅顺序回调
+        # 按回调所属对象统计耗时,对象销毁后自动移除
+        self.__stats: Dict[object, FrameStats] = WeakKeyDictionary()
+
+        self.frameCount: int = 0  # 已推进的帧数
+        self.frameTime: float = 0.0  # 最近一帧所有回调的总耗时
+
+        self.__lastTime: float = 0.0  # 上一帧的时间点
+        # 单次定时器,每帧结束后按最近到期的订阅者重新计算唤醒时间
+        self.__timer: QTimer = QTimer(self)
+        self.__timer.setTimerType(Qt.PreciseTimer)
+        self.__timer.setSingleShot(True)
+        self.__timer.timeout.connect(self.__tick)
+
+    @property
+    def fps(self) -> int: return self.__fps
+
+    @fps.setter
+    def fps(self, n_fps: int) -> None:
+        n_fps = max(1, min(n_fps, 1000))
+        if self.__fps == n_fps: return
+        self.__fps = n_fps
+        self.__schedule()
+
+    @property
+    def interval(self) -> int:
+        """ 帧间隔毫秒数 """
+        return 1000 // self.__fps
+
+    @property
+    def isActive(self) -> bool:
+        """ 是否有订阅者在运行 """
+        return bool(self.__subscribers)
+
+    def subscribe(self, callback: Callable[[float], None], interval: float = 0) -> None:
+        """ 订阅时钟,重复订阅只更新回调间隔 """
+        subscriber: Optional[FrameClock.Subscriber] = self.__subscribers.get(callback)
+        if subscriber is not None:
+            if subscriber.interval == interval: return
+            subscriber.interval = interval
+        else:
+            now: float = perf_counter()
+            if not self.__subscribers:
+                self.__lastTime = now
+
+            # 累计时间从订阅时刻开始计算,下一帧会加上整个帧间隔,这里先减去订阅前已经过的部分
+            subscriber = FrameClock.Subscriber(callback, interval, getattr(callback, '__self__', None))
+            subscriber.elapsed = -(now - self.__lastTime) * 1000.0
+            self.__subscribers[callback] = subscriber
+
+        self.__schedule()
+
+    def unsubscribe(self, callback: Callable[[float], None]) -> None:
+        """ 取消订阅,没有订阅者时停止定时器 """
+        if self.__subscribers.pop(callback, None) is None: return
+        self.__schedule()
+
+    def isSubscribed(self, callback: Callable[[float], None]) -> bool:
+        return callback in self.__subscribers
+
+    def stats(self, owner: object) -> FrameStats:
+        """ 返回对象的回调耗时统计,回调为普通函数时传入函数本身 """
+        stats: Optional[FrameStats] = self.__stats.get(owner)
+        return stats if stats is not None else FrameStats()
+
+    def resetStats(self) -> None:
+        self.__stats.clear()
+        self.frameCount = 0
+        self.frameTime = 0.0
+
+    def __schedule(self) -> None:
+        """ 按最近到期的订阅者启动单次定时器,每帧回调的订阅者一帧后到期,没有订阅者时停止 """
+        if not self.__subscribers:
+            self.__timer.stop()
+            return
+
+        frame: float = 1000.0 / self.__fps
+        passed: float = (perf_counter() - self.__lastTime) * 1000.0
+        delay: float = min(max(subscriber.interval, frame) - subscriber.elapsed
+                           for subscriber in self.__subscribers.values())
+        self.__timer.start(max(0, ceil(delay - passed)))
+
+    def __tick(self) -> None:
+        now: float = perf_counter()
+        passed: float = (now - self.__lastTime) * 1000.0
+        self.__lastTime = now
+
+        # 回调中可能订阅或取消订阅,遍历副本,已取消的订阅者跳过
+        for subscriber in list(self.__subscribers.values()):
+            if self.__subscribers.get(subscriber.callback) is not subscriber: continue
+
+            owner: object = subscriber.owner
+            if isinstance(owner, QObject) and not shiboken2.isValid(owner):
+                self.unsubscribe(subscriber.callback)
+                continue
+
+            # 每帧回调的订阅者单帧最多推进 MAX_ELAPSED,按间隔回调的订阅者按实际经过的时间累计
+            if not subscriber.interval:
+                subscriber.elapsed = min(max(subscriber.elapsed + passed, 0.0), FrameClock.MAX_ELAPSED)
+            else:
+                subscriber.elapsed += passed
+                # 单次定时器以毫秒取整,允许提前不足1毫秒到期
+                if subscriber.elapsed < subscriber.interval - 1: continue
+
+            start: float = perf_counter()
+            subscriber.callback(subscriber.elapsed)
+            cost: float = (perf_counter() - start) * 1000.0
+
+            # 按间隔回调的订阅者保留余数,保持平均间隔不变
+            subscriber.elapsed = max(subscriber.elapsed - subscriber.interval, 0.0) % subscriber.interval \
+                if subscriber.interval else 0.0
+
+            key: object = owner if owner is not None else subscriber.callback
+            stats: Optional[FrameStats] = self.__stats.get(key)
+            if stats is None:
+                stats = FrameStats()
+                self.__stats[key] = stats
+            stats.ticks += 1
+            stats.totalTime += cost
+            stats.lastTime = cost
+            if cost > stats.maxTime: stats.maxTime = cost
+
+        self.frameCount += 1
+        self.frameTime = (perf_counter() - now) * 1000.0
+        self.__schedule()
@@ -1,20 +1,19 @@
-from typing import List
-
-import custom_widgets.iconhelper.resource
+from typing import List, Dict, Tuple, Callable
+from collections import OrderedDict
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 
 import PySide2
-from PySide2.QtCore import QObject, Qt, QSize, QEvent
-from PySide2.QtGui import QFontDatabase, QFont, QPixmap, QPainter, QColor, QIcon
-from PySide2.QtWidgets import QToolButton, QAbstractButton, QLabel, QWidget
+from PySide2.QtCore import QObject, Qt, QSize, QEvent, QRect, QTimer
+from PySide2.QtGui import QFontDatabase, QFont, QPixmap, QPainter, QColor, QIcon, QGuiApplication
+from PySide2.QtWidgets import QApplication, QToolButton, QAbstractButton, QLabel, QWidget, QStyle
 
+from custom_widgets.singleton.singleton import Singleton
 
-class Singleton(type(QObject), type):
-    _instances = {}
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+def initResources() -> None:
+    """ 注册图形字体资源,首次调用时才导入资源模块,重复调用无副作用 """
+    import custom_widgets.iconhelper.resource
 
 
 class IconHelper(QObject, metaclass=Singleton):
@@ -28,12 +27,20 @@ class IconHelper(QObject, metaclass=Singleton):
         super().__init__()
 
         self.icon_font: QFont = QFont()  # 图形字体
-        self.btns: List[QToolButton] = []  # 按钮队列
-        self.pix_normal: List[QPixmap] = []  # 正常图片队列
-        self.pix_dark: List[QPixmap] = []  # 加深图片队列
+        # 按钮对应的 (正常图片, 加深图片), 按钮弱引用, 按钮销毁后自动移除
+        self.btn_pixmaps: Dict[QToolButton, Tuple[QPixmap, QPixmap]] = WeakKeyDictionary()
+        # 按钮对应的 (正常图标, 加深图标), 预先生成, 鼠标移入移出时直接切换
+        self.btn_icons: Dict[QToolButton, Tuple[QIcon, QIcon]] = WeakKeyDictionary()
+
+        self.cache_size: int = 256  # 图标缓存最大数量
+        self.cache_hits: int = 0  # 图标缓存命中次数
+        self.cache_misses: int = 0  # 图标缓存未命中次数
+        # 图标缓存, 键为 (图形字符, 颜色, 字体大小, 宽, 高, 对齐方式, 设备像素比), 按最近使用排序
+        self.__pix_cache: Dict[Tuple, QPixmap] = OrderedDict()
 
         fontDb: QFontDatabase = QFontDatabase()
         if not fontDb.families().__contains__("FontAwesome"):
+            initResources()
             fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
             fontName: List[str] = fontDb.applicationFontFamilies(fontId)
             if len(fontName) == 0:
@@ -72,76 +79,194 @@ class IconHelper(QObject, metaclass=Singleton):
                   pix_width: int = 15,
                   pix_height: int = 15,
                   flags=Qt.AlignCenter) -> QPixmap:
-        """ 生成图标 """
-        pix: QPixmap = QPixmap(pix_width, pix_height)
+        """ 生成图标, 相同参数的图标直接从缓存中取出, 返回隐式共享的副本, 调用方修改时不影响缓存 """
+        app: QGuiApplication = QGuiApplication.instance()
+        dpr: float = app.devicePixelRatio() if app is not None else 1.0
+        key: Tuple = (text, QColor(color).rgba(), font_size, pix_width, pix_height, int(flags), dpr)
+        pix: QPixmap = self.__pix_cache.get(key)
+        if pix is not None:
+            self.__pix_cache.move_to_end(key)
+            self.cache_hits += 1
+            return QPixmap(pix)
+
+        self.cache_misses += 1
+        pix = QPixmap(int(pix_width * dpr), int(pix_height * dpr))
+        pix.setDevicePixelRatio(dpr)
         pix.fill(Qt.transparent)
 
+        # 使用字体副本绘制, 不修改共享的图形字体
+        font: QFont = QFont(self.icon_font)
+        font.setPixelSize(font_size)
+
         painter: QPainter = QPainter()
         painter.begin(pix)
         painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
         painter.setPen(color)
-
-        self.icon_font.setPixelSize(font_size)
-        painter.setFont(self.icon_font)
-        painter.drawText(pix.rect(), flags, text)
+        painter.setFont(font)
+        painter.drawText(QRect(0, 0, pix_width, pix_height), flags, text)
         painter.end()
 
-        return pix
+        self.__pix_cache[key] = pix
+        while self.__pix_cache.__len__() > self.cache_size:
+            self.__pix_cache.popitem(last=False)
+
+        return QPixmap(pix)
 
     # getPixmap
 
+    def clearCache(self) -> None:
+        """ 清空图标缓存及命中统计 """
+        self.__pix_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # clearCache
+
     def getPixmapForQToolButton(self, button: QAbstractButton,
                                 normal: bool) -> QPixmap:
         """ 从 QToolButton 获取图标 """
         pix: QPixmap = QPixmap()
-        index: int = self.btns.index(button)
+        pixmaps: Tuple[QPixmap, QPixmap] = self.btn_pixmaps.get(button)
 
-        if index >= 0:
+        if pixmaps is not None:
             if normal:
-                pix = self.pix_normal[index]
+                pix = pixmaps[0]
             else:
-                pix = self.pix_dark[index]
+                pix = pixmaps[1]
         return pix
 
     # getPixmapForQToolButton
 
     @staticmethod
-    def setStyleForNavPaneNoIcon(widget: QWidget,
-                                 text_location: str = "left",
-                                 border_width: int = 3,
-                                 border_color: str = "#029FEA",
-                                 normal_bg_color: str = "#292F38",
-                                 dark_bg_color: str = "#1D2025",
-                                 normal_text_color: str = "#54626F",
-                                 dark_text_color: str = "#FDFDFD") -> None:
-        """ 指定导航面板样式，不带图标 """
+    def getQssForBorder(text_location: str, border_width: int) -> str:
+        """ 生成导航面板选中边框样式 """
         strBorder: str = ""
         if text_location == "top":
             strBorder = "border-width:{0}px 0px 0px 0px;padding:{0}px {1}px {1}px {1}px;".format(border_width,
                                                                                                  border_width * 2)
         elif text_location == "right":
-            strBorder = "border-width:0px {0}px 0px 0px;padding:{1}px {0}px {1}px {1}px;;".format(border_width,
-                                                                                                  border_width * 2)
+            strBorder = "border-width:0px {0}px 0px 0px;padding:{1}px {0}px {1}px {1}px;".format(border_width,
+                                                                                                 border_width * 2)
         elif text_location == "bottom":
             strBorder = "border-width:0px 0px {0}px 0px;padding:{1}px {1}px {0}px {1}px;".format(border_width,
                                                                                                  border_width * 2)
         elif text_location == "left":
             strBorder = "border-width:0px 0px 0px {0}px;padding:{1}px {1}px {1}px {0}px;".format(border_width,
                                                                                                  border_width * 2)
+        return strBorder
+
+    # getQssForBorder
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def getQssForNavPaneNoIcon(flag_selector: str,
+                               text_location: str = "left",
+                               border_width: int = 3,
+                               border_color: str = "#029FEA",
+                               normal_bg_color: str = "#292F38",
+                               dark_bg_color: str = "#1D2025",
+                               normal_text_color: str = "#54626F",
+                               dark_text_color: str = "#FDFDFD") -> str:
+        """ 生成导航面板样式，不带图标，相同参数只生成一次 """
+        strBorder: str = IconHelper.getQssForBorder(text_location, border_width)
+
+        qss: List[str] = [
+            "{0} QAbstractButton{{border-style:none;border-radius:0px;padding:5px;color:{1};background:{2};}}".format(
+                flag_selector, normal_text_color, normal_bg_color),
+
+            "{0} QAbstractButton:hover,"
+            "{0} QAbstractButton:pressed,"
+            "{0} QAbstractButton:checked{{"
+            "border-style:solid;{1}border-color:{2};color:{3};background:{4};}}".format(flag_selector, strBorder,
+                                                                                         border_color, dark_text_color,
+                                                                                         dark_bg_color)
+        ]
+
+        return "".join(qss)
+
+    # getQssForNavPaneNoIcon
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def getQssForNavPane(flag_selector: str,
+                         pane_selector: str,
+                         child_selector: str,
+                         beside_icon: bool,
+                         text_location: str = "left",
+                         border_width: int = 3,
+                         border_color: str = "#029FEA",
+                         normal_bg_color: str = "#292F38",
+                         dark_bg_color: str = "#1D2025",
+                         normal_text_color: str = "#54626F",
+                         dark_text_color: str = "#FDFDFD") -> str:
+        """ 生成导航面板样式，带图标，相同参数只生成一次 """
+        strBorder: str = IconHelper.getQssForBorder(text_location, border_width)
+
+        # 如果图标是左侧显示则需要让没有选中的按钮左侧也有加深的边框，颜色为背景颜色
+        qss: List[str] = []
+        if beside_icon:
+            qss.append(
+                "{0} QAbstractButton{{border-style:solid;border-radius:0px;{1}border-color:{2};color:{3};background:{2};}}".format(
+                    flag_selector, strBorder, normal_bg_color, normal_text_color))
+        else:
+            qss.append(
+                "{0} QAbstractButton{{border-style:none;border-radius:0px;padding:5px;color:{1};background:{2};}}".format(
+                    flag_selector, normal_text_color, normal_bg_color))
 
+        qss.append("{0} QAbstractButton:hover,"
+                   "{0} QAbstractButton:pressed,"
+                   "{0} QAbstractButton:checked{{"
+                   "border-style:solid;{1}border-color:{2};color:{3};background:{4};}}".format(
+            flag_selector, strBorder, border_color, dark_text_color, dark_bg_color))
+
+        qss.append("{0}{{background:{1};}}".format(pane_selector, normal_bg_color))
+
+        qss.append("{0}>QToolButton{{border-width:0px;}}".format(child_selector))
+        qss.append("{0}>QToolButton{{background-color:{1};color:{2};}}".format(
+            child_selector, normal_bg_color, normal_text_color))
+        qss.append(
+            "{0}>QToolButton:hover,{0}>QToolButton:pressed,{0}>QToolButton:checked{{background-color:{1};color:{2};}}".format(
+                child_selector, dark_bg_color, dark_text_color))
+
+        return "".join(qss)
+
+    # getQssForNavPane
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def getQssForNavButton(frame_selector: str,
+                           normal_bg_color: str = "#2FC5A2",
+                           dark_bg_color: str = "#3EA7E9",
+                           normal_text_color: str = "EEEEEE",
+                           dark_text_color: str = "FFFFFF") -> str:
+        """ 生成导航按钮样式，相同参数只生成一次 """
         qss: List[str] = [
-            "QWidget[flag=\"{0}\"] QAbstractButton{border-style:none;border-radius:0px;padding:5px;color:{1};background:{2};}".format(
-                text_location, normal_text_color, normal_bg_color),
-
-            "QWidget[flag=\"{0}\"] QAbstractButton:hover,"
-            "QWidget[flag=\"{0}\"] QAbstractButton:pressed,"
-            "QWidget[flag=\"{0}\"] QAbstractButton:checked{"
-            "border-style:solid;{1}border-color:{2};color:{3};background:{4};}".format(text_location, strBorder,
-                                                                                       border_color, dark_text_color,
-                                                                                       dark_bg_color)
+            "{0}>QToolButton{{border-style:none;border-width:0px;}}".format(frame_selector),
+
+            "{0}>QToolButton{{background-color:{1};color:{2};}}".format(
+                frame_selector, normal_bg_color, normal_text_color),
+
+            "{0}>QToolButton:hover,{0}>QToolButton:pressed,{0}>QToolButton:checked{{background-color:{1};color:{2};}}".format(
+                frame_selector, dark_bg_color, dark_text_color)
         ]
 
-        widget.setStyleSheet("".join(qss))
+        return "".join(qss)
+
+    # getQssForNavButton
+
+    @staticmethod
+    def setStyleForNavPaneNoIcon(widget: QWidget,
+                                 text_location: str = "left",
+                                 border_width: int = 3,
+                                 border_color: str = "#029FEA",
+                                 normal_bg_color: str = "#292F38",
+                                 dark_bg_color: str = "#1D2025",
+                                 normal_text_color: str = "#54626F",
+                                 dark_text_color: str = "#FDFDFD") -> None:
+        """ 指定导航面板样式，不带图标 """
+        widget.setStyleSheet(IconHelper.getQssForNavPaneNoIcon(
+            "QWidget[flag=\"{0}\"]".format(text_location), text_location, border_width, border_color,
+            normal_bg_color, dark_bg_color, normal_text_color, dark_text_color))
 
     # setStyleForNavPaneNoIcon
 
@@ -165,61 +290,13 @@ class IconHelper(QObject, metaclass=Singleton):
         if btnCount <= 0 or charCount <= 0 or btnCount != charCount:
             return
 
-        strBorder: str = ""
-        if text_location == "top":
-            strBorder = "border-width:{0}px 0px 0px 0px;padding:{0}px {1}px {1}px {1}px;".format(border_width,
-                                                                                                 border_width * 2)
-        elif text_location == "right":
-            strBorder = "border-width:0px {0}px 0px 0px;padding:{1}px {0}px {1}px {1}px;".format(border_width,
-                                                                                                 border_width * 2)
-        elif text_location == "bottom":
-            strBorder = "border-width:0px 0px {0}px 0px;padding:{1}px {1}px {0}px {1}px;".format(border_width,
-                                                                                                 border_width * 2)
-        elif text_location == "left":
-            strBorder = "border-width:0px 0px 0px {0}px;padding:{1}px {1}px {1}px {0}px;".format(border_width,
-                                                                                                 border_width * 2)
-
-        # 如果图标是左侧显示则需要让没有选中的按钮左侧也有加深的边框，颜色为背景颜色
-        qss: List[str] = []
-        if buttons[0].toolButtonStyle() == Qt.ToolButtonTextBesideIcon:
-            qss.append(
-                "QWidget[flag=\"{0}\"] QAbstractButton{border-style:solid;border-radius:0px;{1}border-color:{2};color:{3};background:{2};}".format(
-                    text_location, strBorder, normal_bg_color, normal_text_color))
-        else:
-            qss.append(
-                "QWidget[flag=\"{0}\"] QAbstractButton{border-style:none;border-radius:0px;padding:5px;color:{1};background:{2};}".format(
-                    text_location, normal_text_color, normal_bg_color))
-
-        qss.append("QWidget[flag=\"{0}\"] QAbstractButton:hover,"
-                   "QWidget[flag=\"{0}\"] QAbstractButton:pressed,"
-                   "QWidget[flag=\"{0}\"] QAbstractButton:checked{"
-                   "border-style:solid;{1}border-color:{2};color:{3};background:{4};}".format(
-            text_location, strBorder, bordef_color, dark_text_color, dark_bg_color))
-
-        qss.append("QWidget#{0}{background:{1};}".format(widget.objectName(), normal_bg_color))
-
-        qss.append("QWidget>QToolButton{border-width:0px;}")
-        qss.append("QWidget>QToolButton{background-color:{0};color:{1};}".format(normal_bg_color, normal_text_color))
-        qss.append(
-            "QWidget>QToolButton:hover,QWidget>QToolButton:pressed,QWidget>QToolButton:checked{background-color:{0};color:{1};}".format(
-                dark_bg_color, dark_text_color))
-
-        widget.setStyleSheet("".join(qss))
+        widget.setStyleSheet(IconHelper.getQssForNavPane(
+            "QWidget[flag=\"{0}\"]".format(text_location), "QWidget#{0}".format(widget.objectName()), "QWidget",
+            buttons[0].toolButtonStyle() == Qt.ToolButtonTextBesideIcon, text_location, border_width, bordef_color,
+            normal_bg_color, dark_bg_color, normal_text_color, dark_text_color))
 
-        for i in range(btnCount):
-            # 存储对应按钮对象，方便鼠标移上去的时候切换图片
-            pixNormal: PySide2.QtGui.QPixmap = self.getPixmap(QColor(normal_text_color), str(pix_char[i]), icon_size,
-                                                              icon_width, icon_height)
-            pixDark: PySide2.QtGui.QPixmap = self.getPixmap(QColor(dark_text_color), str(pix_char[i]), icon_size,
-                                                            icon_width, icon_height)
-
-            buttons[i].setIcon(QIcon(pixNormal))
-            buttons[i].setIconSize(QSize(icon_width, icon_height))
-            buttons[i].installEventFilter(self)
-
-            self.btns.append(buttons[i])
-            self.pix_normal.append(pixNormal)
-            self.pix_dark.append(pixDark)
+        self.setIconForNavButtons(buttons, pix_char, icon_size, icon_width, icon_height,
+                                  normal_text_color, dark_text_color)
 
     # setStyleForNavPane
 
@@ -239,50 +316,206 @@ class IconHelper(QObject, metaclass=Singleton):
         if btnCount <= 0 or charCount <= 0 or btnCount != charCount:
             return
 
-        qss: List[str] = [
-            "QFrame>QToolButton{border-style:none;border-width:0px;}",
+        frame.setStyleSheet(IconHelper.getQssForNavButton(
+            "QFrame", normal_bg_color, dark_bg_color, normal_text_color, dark_text_color))
 
-            "QFrame>QToolButton{background-color:{0};color:{1};}".format(
-                normal_bg_color, normal_text_color),
+        self.setIconForNavButtons(buttons, pix_char, icon_size, icon_width, icon_height,
+                                  normal_text_color, dark_text_color)
 
-            "QFrame>QToolButton:hover,QFrame>QToolButton:pressed,QFrame>QToolButton:checked{background-color:{0};color:{1};}".format(
-                dark_bg_color, dark_text_color)
-        ]
-
-        frame.setStyleSheet("".join(qss))
+    # setStyleForNavButton
 
-        for i in range(btnCount):
+    def setIconForNavButtons(self, buttons: List[QToolButton],
+                             pix_char: List[int],
+                             icon_size: int = 12,
+                             icon_width: int = 15,
+                             icon_height: int = 15,
+                             normal_text_color: str = "#54626F",
+                             dark_text_color: str = "#FDFDFD") -> None:
+        """ 设置导航按钮图标，鼠标移入移出时自动切换 """
+        for i in range(min(len(buttons), len(pix_char))):
             # 存储对应按钮对象，方便鼠标移上去的时候切换图片
             pixNormal: QPixmap = self.getPixmap(QColor(normal_text_color), str(pix_char[i]), icon_size, icon_width, icon_height)
             pixDark: QPixmap = self.getPixmap(QColor(dark_text_color), str(pix_char[i]), icon_size, icon_width, icon_height)
 
-            buttons[i].setIcon(QIcon(pixNormal))
-            buttons[i].setIconSize(QSize(icon_width, icon_height))
-            buttons[i].installEventFilter(self)
+            self.__addButton(buttons[i], pixNormal, pixDark, icon_width, icon_height)
 
-            self.btns.append(buttons[i])
-            self.pix_normal.append(pixNormal)
-            self.pix_dark.append(pixDark)
+    # setIconForNavButtons
 
-    # setStyleForNavButton
+    def __addButton(self, button: QToolButton,
+                    pix_normal: QPixmap,
+                    pix_dark: QPixmap,
+                    icon_width: int,
+                    icon_height: int) -> None:
+        """ 存储按钮对应的图片, 并预先生成正常/加深两种图标 """
+        # 正常图标在选中(On)或自动浮起按钮悬停(Active)时本身就显示加深图片
+        iconNormal: QIcon = QIcon()
+        iconNormal.addPixmap(pix_normal, QIcon.Normal, QIcon.Off)
+        iconNormal.addPixmap(pix_dark, QIcon.Normal, QIcon.On)
+        iconNormal.addPixmap(pix_dark, QIcon.Active, QIcon.Off)
+        iconNormal.addPixmap(pix_dark, QIcon.Active, QIcon.On)
+        iconDark: QIcon = QIcon(pix_dark)
+
+        button.setIcon(iconNormal)
+        button.setIconSize(QSize(icon_width, icon_height))
+        button.installEventFilter(self)
+
+        self.btn_pixmaps[button] = (pix_normal, pix_dark)
+        self.btn_icons[button] = (iconNormal, iconDark)
+
+    # __addButton
 
     def eventFilter(self, watched: PySide2.QtCore.QObject, event: PySide2.QtCore.QEvent) -> bool:
         """ 事件过滤器 """
-        if watched.inherits("QToolButton"):  # 这里会警告期望输入bytes实际输入str，应该是qt本身的问题，因为文档和实际运行都是str
-            btn: QToolButton = watched
-            index: int = self.btns.index(btn)
-            if index >= 0:
-                if event.type() == QEvent.Enter:
-                    btn.setIcon(QIcon(self.pix_dark[index]))
-                elif event.type() == QEvent.Leave:
-                    if btn.isChecked():
-                        btn.setIcon(QIcon(self.pix_dark[index]))
-                    else:
-                        btn.setIcon(QIcon(self.pix_normal[index]))
-        return QObject.eventFilter(watched, event)
+        # 先按事件类型过滤,只有鼠标进入/离开才需要查找按钮
+        eventType: QEvent.Type = event.type()
+        if eventType == QEvent.Enter or eventType == QEvent.Leave:
+            icons: Tuple[QIcon, QIcon] = self.btn_icons.get(watched)
+            if icons is not None:
+                # 直接切换预先生成的图标,不再每次构造新的 QIcon
+                btn: QToolButton = watched
+                icon: QIcon = icons[1] if eventType == QEvent.Enter else icons[0]
+                if btn.icon().cacheKey() != icon.cacheKey():
+                    btn.setIcon(icon)
+        return super(IconHelper, self).eventFilter(watched, event)
 
     # eventFilter
 
+class NavTheme(QObject):
+    """
+    导航样式主题
+    1. 相同参数的样式表只生成一次并缓存
+    2. 样式表统一设置在顶层窗口或整个程序上, 面板通过 navTheme 动态属性匹配对应样式, 不占用 flag 属性
+    3. 同一样式应用到多个面板时只设置 navTheme 属性, 不再逐个面板设置并解析样式表
+    4. 同一轮事件循环内的多次设置在下一轮事件循环合并应用, 也可调用 apply 立即应用
+    """
+
+    def __init__(self, scope: QWidget = None):
+        super(NavTheme, self).__init__(scope)
+
+        # 样式表作用范围, 为空时作用于整个程序
+        self.__target = scope if scope is not None else QApplication.instance()
+        # 生成的样式表放在作用范围样式表中的标记注释之间, 应用时只替换这一段, 保留其他代码后来设置的样式
+        self.__begin: str = "/* NavTheme {0:x} begin */".format(id(self))
+        self.__end: str = "/* NavTheme {0:x} end */".format(id(self))
+        self.__flags: Dict[Tuple, str] = {}  # 样式参数对应的 navTheme 属性值
+        self.__qss: List[str] = []  # 已生成的样式表
+
+        # 同一轮事件循环内的多次设置合并为一次应用
+        self.__dirty: bool = False  # 样式表是否有新增, 需重新设置到作用范围
+        self.__pending: Dict[QWidget, None] = WeakKeyDictionary()  # 待重新 polish 的面板
+        self.__timer: QTimer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(0)
+        self.__timer.timeout.connect(self.apply)
+
+    def __addStyle(self, key: Tuple, build: Callable[[str], str]) -> str:
+        """ 参数对应的样式不存在时生成样式表, 返回样式对应的 navTheme 属性值 """
+        flag: str = self.__flags.get(key)
+        if flag is None:
+            flag = "navtheme{0:x}_{1}".format(id(self), self.__flags.__len__())
+            self.__flags[key] = flag
+            self.__qss.append(build("QWidget[navTheme=\"{0}\"]".format(flag)))
+            self.__dirty = True
+            self.__timer.start()
+        return flag
+
+    def __setFlag(self, widget: QWidget, flag: str) -> None:
+        """ 设置面板的 navTheme 属性, 等待统一重新 polish """
+        if widget.property("navTheme") == flag: return
+        widget.setProperty("navTheme", flag)
+        self.__pending[widget] = None
+        self.__timer.start()
+
+    def apply(self) -> None:
+        """ 立即应用所有未生效的样式 """
+        self.__timer.stop()
+        if self.__dirty:
+            # 样式表有新增时一次性设置到作用范围上, 范围内所有控件都会重新 polish
+            # 每次重新读取当前样式表, 只替换标记之间的部分
+            self.__dirty = False
+            qss: str = self.__target.styleSheet()
+            begin: int = qss.find(self.__begin)
+            end: int = qss.find(self.__end, begin)
+            if begin >= 0 and end >= 0:
+                qss = qss[:begin] + qss[end + self.__end.__len__():]
+            self.__target.setStyleSheet(qss + self.__begin + "".join(self.__qss) + self.__end)
+        else:
+            # 只有 navTheme 属性改变时, 重新 polish 对应面板及子控件使样式生效
+            for widget in list(self.__pending.keys()):
+                style: QStyle = widget.style()
+                for w in [widget] + widget.findChildren(QWidget):
+                    style.unpolish(w)
+                    style.polish(w)
+        self.__pending.clear()
+
+    def setStyleForNavPaneNoIcon(self, widget: QWidget,
+                                 text_location: str = "left",
+                                 border_width: int = 3,
+                                 border_color: str = "#029FEA",
+                                 normal_bg_color: str = "#292F38",
+                                 dark_bg_color: str = "#1D2025",
+                                 normal_text_color: str = "#54626F",
+                                 dark_text_color: str = "#FDFDFD") -> None:
+        """ 指定导航面板样式，不带图标 """
+        args: Tuple = (text_location, border_width, border_color, normal_bg_color, dark_bg_color,
+                       normal_text_color, dark_text_color)
+        flag: str = self.__addStyle(("NavPaneNoIcon",) + args,
+                                    lambda selector: IconHelper.getQssForNavPaneNoIcon(selector, *args))
+        self.__setFlag(widget, flag)
+
+    def setStyleForNavPane(self,
+                           widget: QWidget,
+                           buttons: List[QToolButton],
+                           pix_char: List[int],
+                           icon_size: int = 12,
+                           icon_width: int = 15,
+                           icon_height: int = 15,
+                           text_location: str = "left",
+                           border_width: int = 3,
+                           border_color: str = "#029FEA",
+                           normal_bg_color: str = "#292F38",
+                           dark_bg_color: str = "#1D2025",
+                           normal_text_color: str = "#54626F",
+                           dark_text_color: str = "#FDFDFD") -> None:
+        """ 指定导航面板样式，带图标和效果切换 """
+        btnCount: int = len(buttons)
+        charCount: int = len(pix_char)
+        if btnCount <= 0 or charCount <= 0 or btnCount != charCount:
+            return
+
+        args: Tuple = (buttons[0].toolButtonStyle() == Qt.ToolButtonTextBesideIcon, text_location, border_width,
+                       border_color, normal_bg_color, dark_bg_color, normal_text_color, dark_text_color)
+        flag: str = self.__addStyle(("NavPane",) + args,
+                                    lambda selector: IconHelper.getQssForNavPane(selector, selector, selector, *args))
+        self.__setFlag(widget, flag)
+
+        IconHelper().setIconForNavButtons(buttons, pix_char, icon_size, icon_width, icon_height,
+                                          normal_text_color, dark_text_color)
+
+    def setStyleForNavButton(self, frame: QWidget,
+                             buttons: List[QToolButton],
+                             pix_char: List[int],
+                             icon_size: int = 12,
+                             icon_width: int = 15,
+                             icon_height: int = 15,
+                             normal_bg_color: str = "#2FC5A2",
+                             dark_bg_color: str = "#3EA7E9",
+                             normal_text_color: str = "EEEEEE",
+                             dark_text_color: str = "FFFFFF") -> None:
+        """ 指定导航按钮样式，带图标和效果切换 """
+        btnCount: int = len(buttons)
+        charCount: int = len(pix_char)
+        if btnCount <= 0 or charCount <= 0 or btnCount != charCount:
+            return
+
+        args: Tuple = (normal_bg_color, dark_bg_color, normal_text_color, dark_text_color)
+        flag: str = self.__addStyle(("NavButton",) + args,
+                                    lambda selector: IconHelper.getQssForNavButton(selector, *args))
+        self.__setFlag(frame, flag)
+
+        IconHelper().setIconForNavButtons(buttons, pix_char, icon_size, icon_width, icon_height,
+                                          normal_text_color, dark_text_color)
+
 
 if __name__ == '__main__':
     def buttonClick1() -> None:
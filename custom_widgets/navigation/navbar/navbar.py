@@ -1,11 +1,13 @@
 from typing import List, Union
 
 from enum import Enum
-from decimal import Decimal
-from PySide2.QtGui import QColor, QPainter, QLinearGradient, QPen, QFont, QResizeEvent, QMouseEvent, QKeyEvent, QPaintEvent
-from PySide2.QtCore import Slot, Signal, QRectF, QTimer, QSize, QPointF, QEnum, Qt, QPoint
+from PySide2.QtGui import QColor, QPainter, QLinearGradient, QPen, QFont, QResizeEvent, QMouseEvent, QKeyEvent, QPaintEvent, \
+    QShowEvent, QHideEvent
+from PySide2.QtCore import Slot, Signal, QRectF, QSize, QPointF, QEnum, Qt, QPoint, QVariantAnimation, QEasingCurve
 from PySide2.QtWidgets import QApplication, QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class NavBar(QWidget):
     """
@@ -53,6 +55,7 @@ class NavBar(QWidget):
         self.__textSelectColor: QColor = QColor(255, 255, 255)  # 文字选中颜色
 
         self.__items: str = ""  # 所有条目文字信息
+        self.__longText: str = ""  # 条目文字中最长的一个
         self.__currentIndex: int = -1  # 当前选中条目索引
         self.__currentItem: str = ""  # 当前选中条目文字
 
@@ -73,17 +76,21 @@ class NavBar(QWidget):
 
         self.__barRect: QRectF = QRectF()  # 选中区域的矩形
         self.__targetRect: QRectF = QRectF()  # 目标区域的矩形
-        self.__barLen: Decimal = Decimal(0)  # 选中区域的长度
-        self.__targetLen: Decimal = Decimal(0)  # 目标区域的长度
+        self.__barLen: float = 0.0  # 选中区域的长度
+        self.__targetLen: float = 0.0  # 目标区域的长度
 
-        self.__initLen: Decimal = Decimal(10)  # 导航条的长度
-        self.__step: int = 0  # 每次移动的步长
+        self.__initLen: float = 10.0  # 导航条的长度
 
-        self.__isForward: bool = True  # 是否往前移动
         self.__isVirgin: bool = True  # 是否首次处理
-        self.__timer: QTimer = QTimer(self)  # 滑动绘制定时器
-        self.__timer.setInterval(10)
-        self.__timer.timeout.connect(self.__slide)
+
+        # 滑动动画,原先每10毫秒步长减1的减速滑动即二次缓出曲线
+        # 动画本身只负责按曲线插值,由全局动画时钟推进时间
+        self.__animation: QVariantAnimation = QVariantAnimation(self)
+        self.__animation.setEasingCurve(QEasingCurve.OutQuad)
+        self.__animation.valueChanged.connect(self.__slide)
+        self.__animationTime: float = 0.0  # 滑动动画已推进的毫秒数
+        self.__sliding: bool = False  # 是否正在滑动,隐藏时暂停
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,滑动时订阅
 
         self.setItems("主界面|系统设置|防区管理|警情查询|视频预览")
 
@@ -118,6 +125,15 @@ class NavBar(QWidget):
 
         self.moveTo_int(index)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """ 重新显示后继续未完成的滑动 """
+        if self.__sliding:
+            self.__clock.subscribe(self.__advance)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """ 隐藏后暂停滑动动画 """
+        self.__clock.unsubscribe(self.__advance)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """ 鼠标按压信号 """
         self.moveTo_point(event.pos())
@@ -180,19 +196,19 @@ class NavBar(QWidget):
         pen.setColor(self.__lineColor)
         painter.setPen(pen)
 
-        offset: Decimal = Decimal(self.__lineWidth) / 2
+        offset: float = self.__lineWidth / 2
         if self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_TOP:
-            painter.drawLine(int(self.__barRect.left()), self.__barRect.top() + offset,
-                             int(self.__barRect.right()), self.__barRect.top() + offset)
-        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_TOP:
-            painter.drawLine(self.__barRect.right() - offset, int(self.__barRect.top()),
-                             self.__barRect.right() - offset, int(self.__barRect.bottom()))
-        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_TOP:
-            painter.drawLine(int(self.__barRect.left()), self.__barRect.bottom() - offset,
-                             int(self.__barRect.right()), self.__barRect.bottom() - offset)
-        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_TOP:
-            painter.drawLine(self.__barRect.left() + offset, int(self.__barRect.top()),
-                             self.__barRect.left() + offset, int(self.__barRect.bottom()))
+            painter.drawLine(QPointF(int(self.__barRect.left()), self.__barRect.top() + offset),
+                             QPointF(int(self.__barRect.right()), self.__barRect.top() + offset))
+        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_RIGHT:
+            painter.drawLine(QPointF(self.__barRect.right() - offset, int(self.__barRect.top())),
+                             QPointF(self.__barRect.right() - offset, int(self.__barRect.bottom())))
+        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_BOTTOM:
+            painter.drawLine(QPointF(int(self.__barRect.left()), self.__barRect.bottom() - offset),
+                             QPointF(int(self.__barRect.right()), self.__barRect.bottom() - offset))
+        elif self.__barStyle == NavBar.BarStyle.BARSTYLE_LINE_LEFT:
+            painter.drawLine(QPointF(self.__barRect.left() + offset, int(self.__barRect.top())),
+                             QPointF(self.__barRect.left() + offset, int(self.__barRect.bottom())))
 
         # 这里还可以增加右侧倒三角型
 
@@ -206,30 +222,26 @@ class NavBar(QWidget):
         painter.setFont(textFont)
 
         count: int = len(self.__listItem)
-        self.__initLen = 0
+        self.__initLen = 0.0
 
         # 横向导航时，字符区域取条目元素中最长的字符宽度
-        longText: str = ""
-        for item in self.__items.split("|"):
-            if len(item) > len(longText):
-                longText = item
-
         if self.horizontal:
-            textLen: Decimal = Decimal(painter.fontMetrics().width(longText))
+            textLen: float = float(painter.fontMetrics().width(self.__longText))
         else:
-            textLen: Decimal = Decimal(painter.fontMetrics().height())
+            textLen: float = float(painter.fontMetrics().height())
+
+        itemLen: float = textLen + self.__space
+        width: int = self.width()
+        height: int = self.height()
 
         # 逐个绘制元素列表中的文字及文字背景
         for i in range(count):
             strText: str = self.__listItem[i][0]
-            left: QPointF = QPointF(self.__initLen, 0)
-            right: QPointF = QPointF(self.__initLen + textLen + self.__space, self.height())
-
-            if not self.horizontal:
-                left = QPointF(0, self.__initLen)
-                right = QPointF(self.width(), self.__initLen + textLen + self.__space)
+            if self.horizontal:
+                textRect: QRectF = QRectF(self.__initLen, 0, itemLen, height)
+            else:
+                textRect: QRectF = QRectF(0, self.__initLen, width, itemLen)
 
-            textRect: QRectF = QRectF(left, right)
             self.__listItem[i][1] = textRect
 
             if self.__isVirgin:
@@ -237,43 +249,35 @@ class NavBar(QWidget):
                 self.__isVirgin = False
 
             # 当前选中区域的文字显示选中文字颜色
-            if textRect == self.__listItem[self.__currentIndex][1]:
+            if i == self.__currentIndex:
                 painter.setPen(self.__textSelectColor)
             else:
                 painter.setPen(self.__textNormalColor)
 
             painter.drawText(textRect, Qt.AlignCenter, strText)
-            self.__initLen += textLen + self.__space
+            self.__initLen += itemLen
 
         painter.restore()
 
-    def __slide(self) -> None:
-        """ 滑动绘制 """
-        if self.__step > 1:
-            self.__step -= 1
+    def __advance(self, elapsed: float) -> None:
+        """ 推进滑动动画,到达终点后取消订阅 """
+        duration: int = self.__animation.duration()
+        self.__animationTime = min(self.__animationTime + elapsed, duration)
+        self.__animation.setCurrentTime(int(self.__animationTime))
 
-        if self.horizontal:
-            self.__barLen = self.__barRect.topLeft().x()
-        else:
-            self.__barLen = self.__barRect.topLeft().y()
+        if self.__animationTime >= duration:
+            self.__sliding = False
+            self.__clock.unsubscribe(self.__advance)
 
-        if self.__isForward:
-            self.__barLen += self.__step
-            if self.__barLen >= self.__targetLen:
-                self.__barLen = self.__targetLen
-                self.__timer.stop()
-        else:
-            self.__barLen -= self.__step
-            if self.__barLen <= self.__targetLen:
-                self.__barLen = self.__targetLen
-                self.__timer.stop()
+    @Slot(object)
+    def __slide(self, value: float) -> None:
+        """ 滑动绘制 """
+        self.__barLen = value
 
         if self.horizontal:
-            self.__barRect = QRectF(QPointF(self.__barLen, 0),
-                                    QPointF(self.__barLen + self.__barRect.width(), self.height()))
+            self.__barRect = QRectF(self.__barLen, 0, self.__barRect.width(), self.height())
         else:
-            self.__barRect = QRectF(QPointF(0, self.__barLen),
-                                    QPointF(self.width(), self.__barLen + self.__barRect.height()))
+            self.__barRect = QRectF(0, self.__barLen, self.width(), self.__barRect.height())
 
         self.update()
 
@@ -351,6 +355,8 @@ class NavBar(QWidget):
         for item in items.split("|"):
             self.__listItem.append([item, QRectF()])
 
+        self.__longText = max((item[0] for item in self.__listItem), key=len)
+
         self.update()
 
     def getCurrentIndex(self) -> int:
@@ -549,12 +555,20 @@ class NavBar(QWidget):
                 self.__targetLen = self.__targetRect.topLeft().y()
                 self.__barLen = self.__barRect.topLeft().y()
 
-            self.__isForward = (self.__targetLen > self.__barLen)
             distance: int = int(abs(self.__targetLen - self.__barLen))
 
-            # 重新获取每次移动的步长
-            self.__step = self.__initStep(int(distance))
-            self.__timer.start()
+            # 原先按步长每10毫秒移动一次,步长逐次减1,移动次数即为初始步长
+            self.__animation.setStartValue(float(self.__barLen))
+            self.__animation.setEndValue(float(self.__targetLen))
+            self.__animation.setDuration(self.__initStep(distance) * 10)
+            self.__animationTime = 0.0
+            self.__sliding = True
+
+            # 隐藏时无需过渡,直接滑动到终点
+            if self.isVisible():
+                self.__clock.subscribe(self.__advance)
+            else:
+                self.__advance(self.__animation.duration())
 
             self.currentItemChanged.emit(self.__currentIndex, self.__currentItem)
             break
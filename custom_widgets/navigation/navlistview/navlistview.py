@@ -1,11 +1,11 @@
-from typing import List, Any, AnyStr
+from typing import List, Dict, Tuple, Iterable, Optional, Union, Any, AnyStr
 from enum import Enum
 
 from PySide2.QtCore import QAbstractListModel, QObject, QModelIndex, QSize, Signal, Slot, QEnum, Qt, QRect, QPointF
-from PySide2.QtGui import QPainter, QFont, QColor, QFontDatabase, QPen
+from PySide2.QtGui import QPainter, QFont, QColor, QFontDatabase, QPen, QBrush
 from PySide2.QtWidgets import QStyledItemDelegate, QListView, QStyleOptionViewItem, QWidget, QStyle
 
-from custom_widgets.iconhelper.resource import *
+from custom_widgets.iconhelper.iconhelper import initResources
 
 class NavListView(QListView):
     """
@@ -22,6 +22,9 @@ class NavListView(QListView):
     8. 可设置父节点文字的 图标边距+左侧距离+字体大小+高度
     9. 可设置子节点文字的 图标边距+左侧距离+字体大小+高度
     10. 可设置节点展开模式 单击+双击+禁用
+    11. 支持三级及以上节点,可设置每级缩进
+    12. 可设置统一行高,节点数量很多时按固定行高布局
+    13. 可按结构化数据批量设置节点,也可单独追加+移除+更新节点
     """
 
     @QEnum
@@ -42,7 +45,6 @@ class NavListView(QListView):
         self.__model: NavModel = NavModel(self)  # 数据模型
         self.__delegate: NavDelegate = NavDelegate(self)  # 数据委托
         self.parentItem: List[AnyStr] = []  # 父节点数据集合
-        self.__childItem: List[List[AnyStr]] = []  # 子节点数据
 
         self.__items: str = ''  # 节点集合
         self.__rightIconVisible: bool = True  # 右侧图标是否显示
@@ -74,6 +76,7 @@ class NavListView(QListView):
         self.__parentTextSelectedColor: QColor = QColor(250, 250, 250)  # 父节点选中文字颜色
         self.__parentTextHoverColor: QColor = QColor(250, 250, 250)  # 父节点悬停文字颜色
 
+        self.__levelIndent: int = 15  # 三级及以下节点每级缩进
         self.__childIconMargin: int = 15  # 子节点图标边距
         self.__childMargin: int = 35  # 子节点边距
         self.__childFontSize: int = 12  # 子节点字体大小
@@ -85,6 +88,7 @@ class NavListView(QListView):
         self.__childTextSelectedColor: QColor = QColor(250, 250, 250)  # 子节点选中文字颜色
         self.__childTextHoverColor: QColor = QColor(255, 255, 255)  # 子节点悬停文字颜色
 
+        self.__uniformHeight: bool = False  # 所有节点统一使用父节点高度
         self.__expendMode: NavListView.ExpendMode = NavListView.ExpendMode.ExpendMode_SingleClick  # 节点展开模式 单击/双击/禁用
 
         self.setMouseTracking(True)
@@ -112,40 +116,48 @@ class NavListView(QListView):
         node: NavModel.TreeNode = data.data(Qt.UserRole)
         text: AnyStr = node.text
         parentText: AnyStr = node.parentText
-        parentIndex: int = self.parentItem.index(parentText)
 
-        # 默认没有子节点则父节点为子节点
-        index: int = self.__childItem[parentIndex].index(text) if parentIndex >= 0 else self.parentItem.index(text)
-
-        # 找出子节点在子节点队列中的索引
+        # 直接从树上计算 当前节点在兄弟节点中的索引+父节点的索引+在整个子节点队列中的索引,父节点的子节点索引为-1
+        roots: List[NavModel.TreeNode] = self.__model.treeNodes
+        parentNode: Optional[NavModel.TreeNode] = node.parent
+        index: int = NavListView.__indexOf(roots if parentNode is None else parentNode.children, node)
+        parentIndex: int = -1
         childIndex: int = -1
-        for i in range(self.__childItem.__len__()):
-            item: List[AnyStr] = self.__childItem[i]
-            ok: bool = False
-            for subItem in item:
-                childIndex += 1
-
-                # 找到了对应子节点
-                if subItem == text:
-                    ok = True
-                    break
-
-            if ok:
-                break
+        if parentNode is not None:
+            grandNode: Optional[NavModel.TreeNode] = parentNode.parent
+            parentIndex = NavListView.__indexOf(roots if grandNode is None else grandNode.children, parentNode)
 
-        # 如果当前节点是父节点则将子节点索引置为-1
-        if parentIndex == -1:
-            childIndex = -1
+            # 二级节点按父节点顺序依次编号
+            if node.level == 2 and index >= 0 and parentIndex >= 0:
+                childIndex = sum(it.children.__len__() for it in roots[:parentIndex]) + index
 
         self.pressed_curName.emit(text, parentText)  # 当前节点名称+父节点名称
         self.pressed_curIndex.emit(index, parentIndex)  # 当前节点索引+父节点索引
         self.pressed_allIndex.emit(childIndex)  # 整个子节点中对应的索引
 
+    def __styleChanged(self) -> None:
+        """ 样式属性改变后丢弃委托缓存的画笔字体并重绘 """
+        self.__delegate.clearCache()
+        self.viewport().update()
+
+    def __layoutChanged(self) -> None:
+        """ 节点高度改变后还需要重新布局 """
+        self.__delegate.clearCache()
+        self.scheduleDelayedItemsLayout()
+
+    @staticmethod
+    def __indexOf(nodes: List['NavModel.TreeNode'], node: 'NavModel.TreeNode') -> int:
+        for i, it in enumerate(nodes):
+            if it is node:
+                return i
+        return -1
+
     @Slot()
     def __setData(self, list_items: List[AnyStr]) -> None:
         self.__model.setItems(list_items)
         self.setModel(self.__model)
         self.setItemDelegate(self.__delegate)
+        self.__initParentItem()
 
     @property
     def items(self) -> AnyStr: return self.__items
@@ -198,6 +210,8 @@ class NavListView(QListView):
     @property
     def parentTextHoverColor(self) -> QColor: return self.__parentTextHoverColor
     @property
+    def levelIndent(self) -> int: return self.__levelIndent
+    @property
     def childIconMargin(self) -> int: return self.__childIconMargin
     @property
     def childMargin(self) -> int: return self.__childMargin
@@ -218,6 +232,8 @@ class NavListView(QListView):
     @property
     def childTextHoverColor(self) -> QColor: return self.__childTextHoverColor
     @property
+    def uniformHeight(self) -> bool: return self.__uniformHeight
+    @property
     def expendMode(self) -> ExpendMode: return self.__expendMode
     @property
     def sizeHint(self) -> QSize: return QSize(200, 300)
@@ -242,106 +258,263 @@ class NavListView(QListView):
         item: List[AnyStr] = itemsa.split(",")
         self.__setData(item)
 
-        # 将对应的父节点子节点转换为数组,以便用户按下鼠标时候判断
-        self.parentItem.clear()
-        self.__childItem.clear()
-        count: int = len(item)
+    def setNodes(self, nodes: Iterable[Union['NavModel.TreeNode', tuple]]) -> None:
+        """
+        按结构化数据设置节点,不需要拼接和解析字符串
+        每个节点为 NavModel.TreeNode 或元组 (标题, 父节点标题, 是否展开, 提示信息, 左侧图标), 图标可直接传图形字体编码
+        """
+        self.__items = ''
+        self.__model.setNodes(nodes)
+        self.setModel(self.__model)
+        self.setItemDelegate(self.__delegate)
+        self.__initParentItem()
 
-        for i in range(count):
-            lists: List[AnyStr] = item[i].split("|")
-            if len(lists) < 5:
-                continue
+    def appendChild(self, parent_text: AnyStr, node: Union['NavModel.TreeNode', tuple]) -> bool:
+        """ 在父节点下追加节点,父节点标题为空则追加顶层节点 """
+        if not self.__model.appendChild(parent_text, node):
+            return False
 
-            # 父节点名称为空则说明是父节点
-            text: AnyStr = lists[0]
-            parentText: AnyStr = lists[1]
-            if parentText == '':
-                # 找出该父节点下的所有子节点
-                childs: List[AnyStr] = []
-                for j in range(count):
-                    childList: List[AnyStr] = item[j].split("|")
-                    if len(childList) < 5:
-                        continue
+        self.__items = ''
+        self.__initParentItem()
+        return True
+
+    def removeNode(self, text: AnyStr) -> bool:
+        """ 移除节点及其子孙节点 """
+        if not self.__model.removeNode(text):
+            return False
+
+        self.__items = ''
+        self.__initParentItem()
+        return True
 
-                    childText: AnyStr = childList[0]
-                    childParentText: AnyStr = childList[1]
+    def updateNode(self, text: AnyStr, tip: Optional[AnyStr] = None, icon: Union[AnyStr, int, None] = None) -> bool:
+        """ 更新节点的提示信息或图标 """
+        if not self.__model.updateNode(text, tip, icon):
+            return False
 
-                    # 如果父节点的名称和上一个子节点的名称一致则说明当前节点为其子节点
-                    if childParentText == text:
-                        childs.append(childText)
+        self.__items = ''
+        return True
 
-                self.parentItem.append(text)
-                self.__childItem.append(childs)
-        # print(parentItem, childItem)
+    def __initParentItem(self) -> None:
+        # 父节点数据集合直接取模型已经生成的树,按下节点时的索引在按下时再从树上计算
+        self.parentItem[:] = [node.text for node in self.__model.treeNodes]
 
     @rightIconVisible.setter  # 设置父节点右侧图标是否显示
-    def rightIconVisible(self, right_icon_visible: bool) -> None: self.__rightIconVisible = right_icon_visible
+    def rightIconVisible(self, right_icon_visible: bool) -> None:
+        if self.__rightIconVisible != right_icon_visible:
+            self.__rightIconVisible = right_icon_visible
+            self.__styleChanged()
+
     @tipVisible.setter  # 设置提示信息是否显示
-    def tipVisible(self, tip_visible: bool) -> None: self.__tipVisible = tip_visible
+    def tipVisible(self, tip_visible: bool) -> None:
+        if self.__tipVisible != tip_visible:
+            self.__tipVisible = tip_visible
+            self.__styleChanged()
+
     @tipWidth.setter  # 设置提示信息的宽度
-    def tipWidth(self, tip_width: int) -> None: self.__tipWidth = tip_width
+    def tipWidth(self, tip_width: int) -> None:
+        if self.__tipWidth != tip_width:
+            self.__tipWidth = tip_width
+            self.__styleChanged()
+
     @separateVisible.setter  # 设置行分隔符是否显示
-    def separateVisible(self, separate_visible: bool) -> None: self.__separateVisible = separate_visible
+    def separateVisible(self, separate_visible: bool) -> None:
+        if self.__separateVisible != separate_visible:
+            self.__separateVisible = separate_visible
+            self.__styleChanged()
+
     @separateHeight.setter  # 设置行分隔符的高度
-    def separateHeight(self, separate_height: int) -> None: self.__separateHeight = separate_height
+    def separateHeight(self, separate_height: int) -> None:
+        if self.__separateHeight != separate_height:
+            self.__separateHeight = separate_height
+            self.__styleChanged()
+
     @separateColor.setter  # 设置行分隔符的颜色
-    def separateColor(self, separate_color: QColor) -> None: self.__separateColor = separate_color
+    def separateColor(self, separate_color: QColor) -> None:
+        if self.__separateColor != separate_color:
+            self.__separateColor = separate_color
+            self.__styleChanged()
+
     @lineLeft.setter  # 设置线条的位置
-    def lineLeft(self, line_left: bool) -> None: self.__lineLeft = line_left
+    def lineLeft(self, line_left: bool) -> None:
+        if self.__lineLeft != line_left:
+            self.__lineLeft = line_left
+            self.__styleChanged()
+
     @lineVisible.setter  # 设置线条是否可见
-    def lineVisible(self, line_visible: bool) -> None: self.__lineVisible = line_visible
+    def lineVisible(self, line_visible: bool) -> None:
+        if self.__lineVisible != line_visible:
+            self.__lineVisible = line_visible
+            self.__styleChanged()
+
     @lineWidth.setter  # 设置线条的宽度
-    def lineWidth(self, line_width: int) -> None: self.__lineWidth = line_width
+    def lineWidth(self, line_width: int) -> None:
+        if self.__lineWidth != line_width:
+            self.__lineWidth = line_width
+            self.__styleChanged()
+
     @lineColor.setter  # 设置线条的颜色
-    def lineColor(self, line_color: QColor) -> None: self.__lineColor = line_color
+    def lineColor(self, line_color: QColor) -> None:
+        if self.__lineColor != line_color:
+            self.__lineColor = line_color
+            self.__styleChanged()
+
     @triangleLeft.setter  # 设置三角形的位置
-    def triangleLeft(self, triangle_left: bool) -> None: self.__triangleLeft = triangle_left
+    def triangleLeft(self, triangle_left: bool) -> None:
+        if self.__triangleLeft != triangle_left:
+            self.__triangleLeft = triangle_left
+            self.__styleChanged()
+
     @triangleVisible.setter  # 设置三角形是否可见
-    def triangleVisible(self, triangle_visible: bool) -> None: self.__triangleVisible = triangle_visible
+    def triangleVisible(self, triangle_visible: bool) -> None:
+        if self.__triangleVisible != triangle_visible:
+            self.__triangleVisible = triangle_visible
+            self.__styleChanged()
+
     @triangleWidth.setter  # 设置三角形的宽度
-    def triangleWidth(self, triangle_width: int) -> None: self.__triangleWidth = triangle_width
+    def triangleWidth(self, triangle_width: int) -> None:
+        if self.__triangleWidth != triangle_width:
+            self.__triangleWidth = triangle_width
+            self.__styleChanged()
+
     @triangleColor.setter  # 设置三角形的颜色
-    def triangleColor(self, triangle_color: QColor) -> None: self.__triangleColor = triangle_color
+    def triangleColor(self, triangle_color: QColor) -> None:
+        if self.__triangleColor != triangle_color:
+            self.__triangleColor = triangle_color
+            self.__styleChanged()
+
     @parentIconMargin.setter  # 设置父节点的图标边距
-    def parentIconMargin(self, parent_icon_margin: int) -> None: self.__parentIconMargin = parent_icon_margin
+    def parentIconMargin(self, parent_icon_margin: int) -> None:
+        if self.__parentIconMargin != parent_icon_margin:
+            self.__parentIconMargin = parent_icon_margin
+            self.__styleChanged()
+
     @parentMargin.setter  # 设置父节点的左侧边距
-    def parentMargin(self, parent_margin: int) -> None: self.__parentMargin = parent_margin
+    def parentMargin(self, parent_margin: int) -> None:
+        if self.__parentMargin != parent_margin:
+            self.__parentMargin = parent_margin
+            self.__styleChanged()
+
     @parentFontSize.setter  # 设置父节点的字体大小
-    def parentFontSize(self, parent_font_size: int) -> None: self.__parentFontSize = parent_font_size
+    def parentFontSize(self, parent_font_size: int) -> None:
+        if self.__parentFontSize != parent_font_size:
+            self.__parentFontSize = parent_font_size
+            self.__styleChanged()
+
     @parentHeight.setter  # 设置父节点的节点高度
-    def parentHeight(self, parent_height: int) -> None: self.__parentHeight = parent_height
+    def parentHeight(self, parent_height: int) -> None:
+        if self.__parentHeight != parent_height:
+            self.__parentHeight = parent_height
+            self.__layoutChanged()
+
     @parentBgNormalColor.setter  # 设置父节点的正常背景色
-    def parentBgNormalColor(self, parent_bg_normal_color: QColor) -> None: self.__parentBgNormalColor = parent_bg_normal_color
+    def parentBgNormalColor(self, parent_bg_normal_color: QColor) -> None:
+        if self.__parentBgNormalColor != parent_bg_normal_color:
+            self.__parentBgNormalColor = parent_bg_normal_color
+            self.__styleChanged()
+
     @parentBgSelectedColor.setter  # 设置父节点的选中背景色
-    def parentBgSelectedColor(self, parent_bg_selected_color: QColor) -> None: self.__parentBgSelectedColor = parent_bg_selected_color
+    def parentBgSelectedColor(self, parent_bg_selected_color: QColor) -> None:
+        if self.__parentBgSelectedColor != parent_bg_selected_color:
+            self.__parentBgSelectedColor = parent_bg_selected_color
+            self.__styleChanged()
+
     @parentBgHoverColor.setter  # 设置父节点的悬停背景色
-    def parentBgHoverColor(self, parent_bg_hover_color: QColor) -> None: self.__parentBgHoverColor = parent_bg_hover_color
+    def parentBgHoverColor(self, parent_bg_hover_color: QColor) -> None:
+        if self.__parentBgHoverColor != parent_bg_hover_color:
+            self.__parentBgHoverColor = parent_bg_hover_color
+            self.__styleChanged()
+
     @parentTextNormalColor.setter  # 设置父节点的正常文本色
-    def parentTextNormalColor(self, parent_text_normal_color: QColor) -> None: self.__parentTextNormalColor = parent_text_normal_color
+    def parentTextNormalColor(self, parent_text_normal_color: QColor) -> None:
+        if self.__parentTextNormalColor != parent_text_normal_color:
+            self.__parentTextNormalColor = parent_text_normal_color
+            self.__styleChanged()
+
     @parentTextSelectedColor.setter  # 设置父节点的选中文本色
-    def parentTextSelectedColor(self, parent_text_selected_color: QColor) -> None: self.__parentTextSelectedColor = parent_text_selected_color
+    def parentTextSelectedColor(self, parent_text_selected_color: QColor) -> None:
+        if self.__parentTextSelectedColor != parent_text_selected_color:
+            self.__parentTextSelectedColor = parent_text_selected_color
+            self.__styleChanged()
+
     @parentTextHoverColor.setter  # 设置父节点的悬停文本色
-    def parentTextHoverColor(self, parent_text_hover_color: QColor) -> None: self.__parentTextHoverColor = parent_text_hover_color
+    def parentTextHoverColor(self, parent_text_hover_color: QColor) -> None:
+        if self.__parentTextHoverColor != parent_text_hover_color:
+            self.__parentTextHoverColor = parent_text_hover_color
+            self.__styleChanged()
+
+    @levelIndent.setter  # 设置三级及以下节点每级缩进
+    def levelIndent(self, level_indent: int) -> None:
+        if self.__levelIndent != level_indent:
+            self.__levelIndent = level_indent
+            self.__styleChanged()
+
     @childIconMargin.setter  # 设置子节点的图标边距
-    def childIconMargin(self, child_icon_margin: int) -> None: self.__childIconMargin = child_icon_margin
+    def childIconMargin(self, child_icon_margin: int) -> None:
+        if self.__childIconMargin != child_icon_margin:
+            self.__childIconMargin = child_icon_margin
+            self.__styleChanged()
+
     @childMargin.setter  # 设置子节点的左侧边距
-    def childMargin(self, child_margin: int) -> None: self.__childMargin = child_margin
+    def childMargin(self, child_margin: int) -> None:
+        if self.__childMargin != child_margin:
+            self.__childMargin = child_margin
+            self.__styleChanged()
+
     @childFontSize.setter  # 设置子节点的字体大小
-    def childFontSize(self, child_font_size: int) -> None: self.__childFontSize = child_font_size
+    def childFontSize(self, child_font_size: int) -> None:
+        if self.__childFontSize != child_font_size:
+            self.__childFontSize = child_font_size
+            self.__styleChanged()
+
     @childHeight.setter  # 设置子节点的节点高度
-    def childHeight(self, child_height: int) -> None: self.__childHeight = child_height
+    def childHeight(self, child_height: int) -> None:
+        if self.__childHeight != child_height:
+            self.__childHeight = child_height
+            self.__layoutChanged()
+
     @childBgNormalColor.setter  # 设置子节点的正常背景色
-    def childBgNormalColor(self, child_bg_normal_color: QColor) -> None: self.__childBgNormalColor = child_bg_normal_color
+    def childBgNormalColor(self, child_bg_normal_color: QColor) -> None:
+        if self.__childBgNormalColor != child_bg_normal_color:
+            self.__childBgNormalColor = child_bg_normal_color
+            self.__styleChanged()
+
     @childBgSelectedColor.setter  # 设置子节点的选中背景色
-    def childBgSelectedColor(self, child_bg_selected_color: QColor) -> None: self.__childBgSelectedColor = child_bg_selected_color
+    def childBgSelectedColor(self, child_bg_selected_color: QColor) -> None:
+        if self.__childBgSelectedColor != child_bg_selected_color:
+            self.__childBgSelectedColor = child_bg_selected_color
+            self.__styleChanged()
+
     @childBgHoverColor.setter  # 设置子节点的悬停背景色
-    def childBgHoverColor(self, child_bg_hover_color: QColor) -> None: self.__childBgHoverColor = child_bg_hover_color
+    def childBgHoverColor(self, child_bg_hover_color: QColor) -> None:
+        if self.__childBgHoverColor != child_bg_hover_color:
+            self.__childBgHoverColor = child_bg_hover_color
+            self.__styleChanged()
+
     @childTextNormalColor.setter  # 设置子节点的正常文本色
-    def childTextNormalColor(self, child_text_normal_color: QColor) -> None: self.__childTextNormalColor = child_text_normal_color
+    def childTextNormalColor(self, child_text_normal_color: QColor) -> None:
+        if self.__childTextNormalColor != child_text_normal_color:
+            self.__childTextNormalColor = child_text_normal_color
+            self.__styleChanged()
+
     @childTextSelectedColor.setter  # 设置子节点的选中文本色
-    def childTextSelectedColor(self, child_text_selected_color: QColor) -> None: self.__childTextSelectedColor = child_text_selected_color
+    def childTextSelectedColor(self, child_text_selected_color: QColor) -> None:
+        if self.__childTextSelectedColor != child_text_selected_color:
+            self.__childTextSelectedColor = child_text_selected_color
+            self.__styleChanged()
+
     @childTextHoverColor.setter  # 设置子节点的悬停文本色
-    def childTextHoverColor(self, child_text_hover_color: QColor) -> None: self.__childTextHoverColor = child_text_hover_color
+    def childTextHoverColor(self, child_text_hover_color: QColor) -> None:
+        if self.__childTextHoverColor != child_text_hover_color:
+            self.__childTextHoverColor = child_text_hover_color
+            self.__styleChanged()
+
+    @uniformHeight.setter  # 设置是否统一行高,开启后所有节点均使用父节点高度,视图按固定行高快速布局
+    def uniformHeight(self, uniform_height: bool) -> None:
+        if self.__uniformHeight != uniform_height:
+            self.__uniformHeight = uniform_height
+            self.setUniformItemSizes(uniform_height)
+            self.__layoutChanged()
 
     @expendMode.setter  # 设置节点展开模式
     def expendMode(self, expend_mode: ExpendMode) -> None:
@@ -361,26 +534,31 @@ class NavListView(QListView):
 class NavModel(QAbstractListModel):
 
     class TreeNode:
-        def __init__(self):
-            self.level: int = 1  # 层级,父节点-1,子节点-2
-            self.expand: bool = False  # 是否打开子节点
+        def __init__(self, text: AnyStr = '', parentText: AnyStr = '', expand: bool = False,
+                     tip: AnyStr = '', icon: Union[AnyStr, int] = ''):
+            self.level: int = 1  # 层级,父节点-1,子节点-2,子节点的子节点-3,依次类推
+            self.expand: bool = expand  # 是否打开子节点
             self.last: bool = False  # 是否末尾元素
-            self.icon: AnyStr = ''  # 左侧图标
-            self.text: AnyStr = ''  # 显示的节点文字
-            self.tip: AnyStr = ''  # 右侧描述文字
-            self.parentText: AnyStr = ''  # 父节点名称
+            self.icon: AnyStr = chr(icon) if isinstance(icon, int) else icon  # 左侧图标,可直接传图形字体的编码
+            self.text: AnyStr = text  # 显示的节点文字
+            self.tip: AnyStr = tip  # 右侧描述文字
+            self.parentText: AnyStr = parentText  # 父节点名称
+            self.parent: Optional[NavModel.TreeNode] = None  # 父节点,顶层节点或未挂到树上时为空
             self.children: List[NavModel.TreeNode] = []  # 子节点集合
 
     class ListNode:
-        def __init__(self):
-            self.text: AnyStr = ''  # 节点文字
-            self.treeNode: NavModel.TreeNode = NavModel.TreeNode()  # 节点指针
+        def __init__(self, text: AnyStr = '', treeNode: 'NavModel.TreeNode' = None):
+            self.text: AnyStr = text  # 节点文字
+            self.treeNode: NavModel.TreeNode = treeNode  # 节点指针
 
     def __init__(self, parent: QObject):
         super(NavModel, self).__init__(parent)
 
         self.__treeNode: List[NavModel.TreeNode] = []
         self.__listNode: List[NavModel.ListNode] = []
+        self.__textNodes: Dict[AnyStr, NavModel.TreeNode] = {}  # 按标题索引已挂到树上的节点
+        # 可见节点所在行,可见行插入或移除后置空,下次查找时重新生成
+        self.__rows: Optional[Dict[NavModel.TreeNode, int]] = None
 
     def __del__(self):
         """for (QList<TreeNode *>::iterator it = treeNode.begin(); it != treeNode.end();) {
@@ -411,18 +589,22 @@ class NavModel(QAbstractListModel):
 
         return None
 
+    @property
+    def treeNodes(self) -> List['NavModel.TreeNode']: return self.__treeNode
+
+    def treeNode(self, row: int) -> 'NavModel.TreeNode':
+        """ 直接取指定行的节点,委托绘制时不必经过 data 转换 """
+        return self.__listNode[row].treeNode
+
     @Slot()
     def setItems(self, items: List[AnyStr]) -> None:
         count: int = len(items)
         if count == 0:
             return
 
-        self.__treeNode.clear()
-        self.__listNode.clear()
-
         # listItem格式: 标题|父节点标题(父节点为空)|是否展开|提示信息|左侧图标
-        for i in range(count):
-            item: AnyStr = items[i]
+        nodes: List[NavModel.TreeNode] = []
+        for item in items:
             lists: List[AnyStr] = item.split("|")
             if len(lists) < 5:
                 continue
@@ -434,104 +616,306 @@ class NavModel(QAbstractListModel):
             tip: AnyStr = lists[3]
             icon: AnyStr = lists[4]
 
-            # 将父节点即父节点标题为空的元素加载完毕
-            if parentText == '':
-                node: NavModel.TreeNode = NavModel.TreeNode()
-
-                # 设置父节点的level为1,是否要打开子节点从参数取
-                node.level = 1
-                node.expand = int(expand)
-                node.last = False
-
-                if icon != '':
-                    node.icon = chr(int(icon, 16))
-
-                node.text = text
-                node.tip = tip
-                node.parentText = parentText
-
-                # 查找该父节点是否有对应子节点,有则加载
-                for j in range(count):
-                    childItem: AnyStr = items[j]
-                    childList: List[AnyStr] = childItem.split("|")
-                    if len(childList) < 5:
-                        continue
-
-                    childText: AnyStr = childList[0]
-                    childParentText: AnyStr = childList[1]
-                    childTip: AnyStr = childList[3]
-                    childIcon: AnyStr = childList[4]
-
-                    # 传过来的图标字符串可能以0x打头,要去掉
-                    childIcon = childIcon.replace("0x", "")
-
-                    # 如果当前子节点的父节点名称是上一个节点的名称则归属于该节点
-                    if childParentText == text:
-                        childNode: NavModel.TreeNode = NavModel.TreeNode()
-
-                        # 设置子节点的level为2,是否要打开子节点设置false,可自行更改从参数取,如果有三级节点的话
-                        childNode.level = 2
-                        childNode.expand = False
-                        childNode.last = j == count - 1
-
-                        if childIcon != '':
-                            childNode.icon = chr(int(childIcon, 16))
-
-                        childNode.text = childText
-                        childNode.tip = childTip
-                        childNode.parentText = childParentText
-                        node.children.append(childNode)
+            # 传过来的图标字符串可能以0x打头, int 按十六进制解析时会自动处理
+            nodes.append(NavModel.TreeNode(text, parentText, int(expand) if expand != '' else False,
+                                           tip, int(icon, 16) if icon != '' else ''))
+
+        self.setNodes(nodes)
+
+    @Slot()
+    def setNodes(self, nodes: Iterable[Union['NavModel.TreeNode', tuple]]) -> None:
+        """ 按结构化数据设置全部节点,元组格式同 TreeNode 构造参数: (标题, 父节点标题, 是否展开, 提示信息, 左侧图标) """
+        self.__treeNode.clear()
+        self.__listNode.clear()
+        self.__textNodes.clear()
+        self.__rows = None
+
+        # 先按标题建立索引,子节点可以出现在父节点之前
+        records: List[NavModel.TreeNode] = []
+        textNodes: Dict[AnyStr, NavModel.TreeNode] = {}
+        for node in nodes:
+            if not isinstance(node, NavModel.TreeNode):
+                node = NavModel.TreeNode(*node)
+
+            node.parent = None
+            node.children = []
+            records.append(node)
+            textNodes.setdefault(node.text, node)
+
+        # 再按照原有顺序挂到父节点下,父节点标题为空的是顶层节点
+        for node in records:
+            if node.parentText == '':
                 self.__treeNode.append(node)
+            else:
+                parentNode: NavModel.TreeNode = textNodes.get(node.parentText)
+                if parentNode is not None and parentNode is not node:
+                    node.parent = parentNode
+                    parentNode.children.append(node)
+
+        # 从顶层节点开始逐级设置层级,没有挂到顶层节点下的节点不显示
+        for node in self.__treeNode:
+            self.__initLevel(node, 1)
+
         self.__refreshList()
         self.beginResetModel()
         self.endResetModel()
 
+    def __initLevel(self, treeNode: 'NavModel.TreeNode', level: int) -> None:
+        """ 设置节点及其子孙节点的层级并加入标题索引 """
+        stack: List[Tuple[NavModel.TreeNode, int]] = [(treeNode, level)]
+        while stack:
+            node, level = stack.pop()
+            node.level = level
+            self.__textNodes.setdefault(node.text, node)
+            stack.extend((child, level + 1) for child in node.children)
+
+    def findNode(self, text: AnyStr) -> Optional['NavModel.TreeNode']:
+        """ 按标题查找节点 """
+        return self.__textNodes.get(text)
+
+    def __rowOf(self, treeNode: 'NavModel.TreeNode') -> int:
+        """ 节点所在行,被折叠隐藏时返回-1 """
+        if self.__rows is None:
+            self.__rows = {it.treeNode: row for row, it in enumerate(self.__listNode)}
+        return self.__rows.get(treeNode, -1)
+
+    def __blockEnd(self, row: int) -> int:
+        """ 紧跟其后且层级更深的连续行都是该行的可见子孙节点,返回这一段之后的行号 """
+        level: int = self.__listNode[row].treeNode.level
+        end: int = row + 1
+        count: int = self.__listNode.__len__()
+        while end < count and self.__listNode[end].treeNode.level > level:
+            end += 1
+        return end
+
+    def __rowChanged(self, row: int) -> None:
+        index: QModelIndex = self.index(row, 0)
+        self.dataChanged.emit(index, index)
+
+    @Slot()
+    def appendChild(self, parentText: AnyStr, node: Union['NavModel.TreeNode', tuple]) -> bool:
+        """ 在父节点的子节点末尾追加节点,父节点标题为空则追加顶层节点,只发出对应行的插入信号 """
+        if not isinstance(node, NavModel.TreeNode):
+            node = NavModel.TreeNode(*node)
+
+        parentNode: Optional[NavModel.TreeNode] = None
+        if parentText != '':
+            parentNode = self.__textNodes.get(parentText)
+            if parentNode is None:
+                return False
+
+        node.parentText = parentText
+        node.parent = parentNode
+        node.children = []
+        if parentNode is None:
+            self.__treeNode.append(node)
+            self.__initLevel(node, 1)
+            row: int = self.__listNode.__len__()
+        else:
+            parentNode.children.append(node)
+            self.__initLevel(node, parentNode.level + 1)
+
+            # 父节点不可见或已折叠时只需刷新父节点的展开图标
+            parentRow: int = self.__rowOf(parentNode)
+            if parentRow < 0:
+                return True
+            if parentNode.expand:
+                self.__rowChanged(parentRow)
+                return True
+
+            row: int = self.__blockEnd(parentRow)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.__listNode.insert(row, NavModel.ListNode(node.text, node))
+        self.__rows = None
+        self.endInsertRows()
+
+        # 插入位置前一行可能不再是末尾行,分隔符随之变化
+        self.__updateLast(row)
+        if row > 0:
+            self.__updateLast(row - 1)
+            self.__rowChanged(row - 1)
+        if parentNode is not None and parentRow != row - 1:
+            self.__rowChanged(parentRow)
+        return True
+
+    @Slot()
+    def removeNode(self, text: AnyStr) -> bool:
+        """ 移除节点及其子孙节点,只发出对应行的移除信号 """
+        node: NavModel.TreeNode = self.__textNodes.get(text)
+        if node is None:
+            return False
+
+        parentNode: Optional[NavModel.TreeNode] = node.parent
+        row: int = self.__rowOf(node)
+        (self.__treeNode if parentNode is None else parentNode.children).remove(node)
+        node.parent = None
+
+        # 从标题索引中移除整棵子树
+        stack: List[NavModel.TreeNode] = [node]
+        while stack:
+            it: NavModel.TreeNode = stack.pop()
+            if self.__textNodes.get(it.text) is it:
+                del self.__textNodes[it.text]
+            stack.extend(it.children)
+
+        if row >= 0:
+            end: int = self.__blockEnd(row)
+            self.beginRemoveRows(QModelIndex(), row, end - 1)
+            del self.__listNode[row:end]
+            self.__rows = None
+            self.endRemoveRows()
+
+            if row > 0:
+                self.__updateLast(row - 1)
+                self.__rowChanged(row - 1)
+
+        # 父节点没有子节点后展开图标也要刷新
+        if parentNode is not None and parentNode.children.__len__() == 0:
+            parentRow: int = self.__rowOf(parentNode)
+            if parentRow >= 0:
+                self.__rowChanged(parentRow)
+        return True
+
+    @Slot()
+    def updateNode(self, text: AnyStr, tip: Optional[AnyStr] = None, icon: Union[AnyStr, int, None] = None) -> bool:
+        """ 更新节点的提示信息或图标,只刷新该行 """
+        node: NavModel.TreeNode = self.__textNodes.get(text)
+        if node is None:
+            return False
+
+        if tip is not None:
+            node.tip = tip
+        if icon is not None:
+            node.icon = chr(icon) if isinstance(icon, int) else icon
+
+        row: int = self.__rowOf(node)
+        if row >= 0:
+            self.__rowChanged(row)
+        return True
+
     @Slot()
     def expand(self, index: QModelIndex):
-        node: NavModel.TreeNode = self.__listNode[index.row()].treeNode
+        row: int = index.row()
+        node: NavModel.TreeNode = self.__listNode[row].treeNode
         if node.children.__len__() == 0:
             return
 
+        # 只拼接或移除该节点下面的可见行,不重建整个列表
         node.expand = not node.expand
-        self.__refreshList()
+        if node.expand:
+            # 折叠: 移除它下面的可见子孙节点
+            end: int = self.__blockEnd(row)
+            if end > row + 1:
+                self.beginRemoveRows(QModelIndex(), row + 1, end - 1)
+                del self.__listNode[row + 1:end]
+                self.__rows = None
+                self.endRemoveRows()
+        else:
+            # 展开: 按各子节点自身的折叠状态生成可见行后插入
+            rows: List[NavModel.ListNode] = []
+            for child in node.children:
+                self.__appendList(child, rows)
 
-        last = 1 if node.expand else node.children.__len__()
+            self.beginInsertRows(QModelIndex(), row + 1, row + rows.__len__())
+            self.__listNode[row + 1:row + 1] = rows
+            self.__rows = None
+            self.endInsertRows()
+            self.__updateLast(row + rows.__len__())
 
-        self.beginInsertRows(QModelIndex(), index.row() + 1, index.row() + last)
-        self.endInsertRows()
+        self.__updateLast(row)
+        self.dataChanged.emit(index, index)
+
+    def __updateLast(self, row: int) -> None:
+        """ 顶层节点的最后一行即下一行为顶层节点或末尾的行需要绘制分隔符 """
+        listNode: List[NavModel.ListNode] = self.__listNode
+        listNode[row].treeNode.last = row + 1 == listNode.__len__() or listNode[row + 1].treeNode.level == 1
 
     def __refreshList(self):
         self.__listNode.clear()
+        self.__rows = None
         for it in self.__treeNode:
-            node: NavModel.ListNode = NavModel.ListNode()
-            node.text = it.text
-            node.treeNode = it
+            self.__appendList(it, self.__listNode)
 
-            self.__listNode.append(node)
-            if it.expand:
-                continue
+            # 每个顶层节点最后一行需要绘制分隔符
+            self.__listNode[-1].treeNode.last = True
 
-            for child in it.children:
-                node_2: NavModel.ListNode = NavModel.ListNode()
-                node_2.text = child.text
-                node_2.treeNode = child
-                node_2.treeNode.last = False
-                self.__listNode.append(node_2)
+    @staticmethod
+    def __appendList(treeNode: 'NavModel.TreeNode', rows: List['NavModel.ListNode']) -> None:
+        """ 按顺序展开节点及其未折叠的子节点 """
+        stack: List[NavModel.TreeNode] = [treeNode]
+        while stack:
+            it: NavModel.TreeNode = stack.pop()
+            it.last = False
+            rows.append(NavModel.ListNode(it.text, it))
 
-            if self.__listNode is not None:
-                self.__listNode[-1].treeNode.last = True
+            # expand 为真表示子节点折叠
+            if not it.expand:
+                stack.extend(reversed(it.children))
 
 
 class NavDelegate(QStyledItemDelegate):
+
+    class Style:
+        """ 绘制用到的尺寸+颜色+画笔+字体,导航控件样式属性改变时整体重新生成 """
+        def __init__(self, nav: NavListView, iconFont: QFont):
+            self.rightIconVisible: bool = nav.rightIconVisible
+            self.tipVisible: bool = nav.tipVisible
+            self.tipWidth: int = nav.tipWidth
+            self.separateVisible: bool = nav.separateVisible
+            self.separatePen: QPen = QPen(nav.separateColor, nav.separateHeight)
+
+            self.lineLeft: bool = nav.lineLeft
+            self.lineVisible: bool = nav.lineVisible and nav.lineWidth > 0
+            self.lineOffset: float = nav.lineWidth / 2  # 设置偏移量,不然上下部分会有点偏移
+            self.linePen: QPen = QPen(nav.lineColor, nav.lineWidth)
+
+            self.triangleLeft: bool = nav.triangleLeft
+            self.triangleVisible: bool = nav.triangleVisible and nav.triangleWidth > 0
+            self.trianglePen: QPen = QPen(nav.triangleColor)
+            self.triangleFont: QFont = QFont(iconFont)
+            self.triangleFont.setPixelSize(nav.parentFontSize + nav.triangleWidth)
+
+            self.levelIndent: int = nav.levelIndent
+            self.uniformSize: QSize = QSize(50, nav.parentHeight)
+
+            # 以下均按 [是否父节点] 索引: 节点大小+文字边距+图标边距+文字字体+提示字体+图标字体
+            self.sizes: Tuple[QSize, QSize] = (QSize(50, nav.childHeight), self.uniformSize)
+            self.margins: Tuple[int, int] = (nav.childMargin, nav.parentMargin)
+            self.iconMargins: Tuple[int, int] = (nav.childIconMargin, nav.parentIconMargin)
+            fontSizes: Tuple[int, int] = (nav.childFontSize, nav.parentFontSize)
+            self.textFonts: Tuple[QFont, QFont] = tuple(NavDelegate.Style.pixelFont(QFont(), size) for size in fontSizes)
+            self.tipFonts: Tuple[QFont, QFont] = tuple(NavDelegate.Style.pixelFont(QFont(), size - 2) for size in fontSizes)
+            self.iconFonts: Tuple[QFont, QFont] = tuple(NavDelegate.Style.pixelFont(QFont(iconFont), size) for size in fontSizes)
+
+            # 按 [是否父节点][状态 0-正常 1-悬停 2-选中] 索引: 主背景色+主文字颜色+提示信息背景颜色+提示信息文字颜色
+            self.colors: Tuple[Tuple[Tuple[QBrush, QPen, QBrush, QPen], ...], ...] = tuple(
+                tuple((QBrush(bgColor), QPen(textColor), QBrush(tipBgColor), QPen(tipTextColor))
+                      for bgColor, textColor, tipBgColor, tipTextColor in states)
+                for states in (
+                    ((nav.childBgNormalColor, nav.childTextNormalColor, nav.childBgSelectedColor, nav.childTextSelectedColor),
+                     (nav.childBgHoverColor, nav.childTextHoverColor, nav.childTextSelectedColor, nav.childBgSelectedColor),
+                     (nav.childBgSelectedColor, nav.childTextSelectedColor, nav.childTextSelectedColor, nav.childBgSelectedColor)),
+                    ((nav.parentBgNormalColor, nav.parentTextNormalColor, nav.parentBgSelectedColor, nav.parentTextSelectedColor),
+                     (nav.parentBgHoverColor, nav.parentTextHoverColor, nav.parentTextSelectedColor, nav.parentBgSelectedColor),
+                     (nav.parentBgSelectedColor, nav.parentTextSelectedColor, nav.parentTextSelectedColor, nav.parentBgSelectedColor))))
+
+        @staticmethod
+        def pixelFont(font: QFont, pixel_size: int) -> QFont:
+            font.setPixelSize(pixel_size)
+            return font
+
     def __init__(self, parent: QObject):
         super(NavDelegate, self).__init__()
 
         self.__nav: NavListView = parent
         self.__iconFont: QFont = QFont()
+        self.__style: Optional[NavDelegate.Style] = None  # 缓存的绘制样式
 
         # 判断图形字体是否存在，不存在则加入
         fontDb: QFontDatabase = QFontDatabase()
         if not fontDb.families().__contains__("FontAwesome"):
+            initResources()
             fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
             fontName: List[str] = fontDb.applicationFontFamilies(fontId)
             if len(fontName) == 0:
@@ -541,16 +925,30 @@ class NavDelegate(QStyledItemDelegate):
             self.__iconFont: QFont = QFont("FontAwesome")
             self.__iconFont.setHintingPreference(QFont.PreferNoHinting)  # if Qt version >= 4.8.0
 
+    def clearCache(self) -> None:
+        """ 丢弃缓存的绘制样式,下次绘制时按导航控件当前属性重新生成 """
+        self.__style = None
+
+    def __getStyle(self) -> 'NavDelegate.Style':
+        if self.__style is None:
+            self.__style = NavDelegate.Style(self.__nav, self.__iconFont)
+        return self.__style
+
     def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
-        node: NavModel.TreeNode = index.data(Qt.UserRole)  # NavModel::TreeNode *node = (NavModel::TreeNode *)index.data(Qt::UserRole).toULongLong();
+        style: NavDelegate.Style = self.__style or self.__getStyle()
+
+        # 统一行高时不需要取节点
+        if self.__nav.uniformHeight:
+            return style.uniformSize
+
         # 设置最小的宽高
-        parent: bool = node.level == 1
-        size: QSize = QSize(50, self.__nav.parentHeight if parent else self.__nav.childHeight)
-        return size
+        node: NavModel.TreeNode = index.model().treeNode(index.row())
+        return style.sizes[node.level == 1]
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
         painter.setRenderHints(QPainter.Antialiasing)
-        node: NavModel.TreeNode = index.data(Qt.UserRole)
+        node: NavModel.TreeNode = index.model().treeNode(index.row())
+        style: NavDelegate.Style = self.__style or self.__getStyle()
 
         # 定义变量存储区域
         optionRect: QRect = option.rect
@@ -559,94 +957,63 @@ class NavDelegate(QStyledItemDelegate):
         width: int = optionRect.width()
         height: int = optionRect.height()
 
-        fontSize: int = self.__nav.parentFontSize
-
         parent: bool = node.level == 1  # 父节点和子节点颜色分开设置
+        indent: int = 0 if parent else (node.level - 2) * style.levelIndent
 
         # 根据不同的状态设置不同的颜色 bgColor-主背景色 textColor-主文字颜色 tipBgColor-提示信息背景颜色 tipTextColor-提示信息文字颜色
+        state: int = 0
         if option.state & QStyle.State_Selected:
-            bgColor = self.__nav.parentBgSelectedColor if parent else self.__nav.childBgSelectedColor
-            textColor = self.__nav.parentTextSelectedColor if parent else self.__nav.childTextSelectedColor
-            tipBgColor = self.__nav.parentTextSelectedColor if parent else self.__nav.childTextSelectedColor
-            tipTextColor = self.__nav.parentBgSelectedColor if parent else self.__nav.childBgSelectedColor
-            # iconColor = self.__nav.parentTextSelectedColor if parent else self.__nav.childTextSelectedColor
+            state = 2
         elif option.state & QStyle.State_MouseOver:
-            bgColor = self.__nav.parentBgHoverColor if parent else self.__nav.childBgHoverColor
-            textColor = self.__nav.parentTextHoverColor if parent else self.__nav.childTextHoverColor
-            tipBgColor = self.__nav.parentTextSelectedColor if parent else self.__nav.childTextSelectedColor
-            tipTextColor = self.__nav.parentBgSelectedColor if parent else self.__nav.childBgSelectedColor
-            # iconColor = self.__nav.parentTextHoverColor if parent else self.__nav.childTextHoverColor
-        else:
-            bgColor = self.__nav.parentBgNormalColor if parent else self.__nav.childBgNormalColor
-            textColor = self.__nav.parentTextNormalColor if parent else self.__nav.childTextNormalColor
-            tipBgColor = self.__nav.parentBgSelectedColor if parent else self.__nav.childBgSelectedColor
-            tipTextColor = self.__nav.parentTextSelectedColor if parent else self.__nav.childTextSelectedColor
-            # iconColor = self.__nav.parentTextNormalColor if parent else self.__nav.childTextNormalColor
+            state = 1
+        bgColor, textColor, tipBgColor, tipTextColor = style.colors[parent][state]
 
         painter.fillRect(optionRect, bgColor)  # 绘制背景
 
         # 绘制线条,目前限定子节点绘制,如果需要父节点也绘制则取消parent判断即可
-        lineWidth: int = self.__nav.lineWidth
-        if not parent and self.__nav.lineVisible and lineWidth > 0:
-            if (option.state & QStyle.State_Selected) or (option.state & QStyle.State_MouseOver):
-                offset: float = lineWidth / 2  # 设置偏移量,不然上下部分会有点偏移
-
-                # 计算上下两个坐标点
-                pointTop = QPointF(x, y + offset)
-                pointBottom = QPointF(x, height + y - offset)
-                if not self.__nav.lineLeft:
-                    pointTop.setX(width)
-                    pointBottom.setX(width)
-
-                # 设置线条颜色和宽度
-                painter.setPen(QPen(self.__nav.lineColor, lineWidth))
-                painter.drawLine(pointTop, pointBottom)
+        if not parent and style.lineVisible and state != 0:
+            # 计算上下两个坐标点
+            offset: float = style.lineOffset
+            lineX: int = x if style.lineLeft else width
+            painter.setPen(style.linePen)
+            painter.drawLine(QPointF(lineX, y + offset), QPointF(lineX, height + y - offset))
 
         # 绘制三角形,目前限定子节点绘制,如果需要父节点也绘制则取消parent判断即可
-        triangleWidth: int = self.__nav.triangleWidth
-        if not parent and self.__nav.triangleVisible and triangleWidth > 0:
-            if (option.state & QStyle.State_Selected) or (option.state & QStyle.State_MouseOver):
-                font: QFont = self.__iconFont
-                font.setPixelSize(fontSize + triangleWidth)
-                painter.setFont(font)
-                painter.setPen(self.__nav.triangleColor)
-
-                # 采用图形字体中的三角形绘制
-                if self.__nav.triangleLeft:
-                    painter.drawText(optionRect, Qt.AlignLeft | Qt.AlignVCenter, chr(0xf0da))
-                else:
-                    painter.drawText(optionRect, Qt.AlignRight | Qt.AlignVCenter, chr(0xf0d9))
+        if not parent and style.triangleVisible and state != 0:
+            painter.setFont(style.triangleFont)
+            painter.setPen(style.trianglePen)
+
+            # 采用图形字体中的三角形绘制
+            if style.triangleLeft:
+                painter.drawText(optionRect, Qt.AlignLeft | Qt.AlignVCenter, chr(0xf0da))
+            else:
+                painter.drawText(optionRect, Qt.AlignRight | Qt.AlignVCenter, chr(0xf0d9))
 
         # 绘制行分隔符
-        if self.__nav.separateVisible:
-            if node.level == 1 or node.level == 2 and node.last:
-                painter.setPen(QPen(self.__nav.separateColor, self.__nav.separateHeight))
+        if style.separateVisible:
+            if parent or node.last:
+                painter.setPen(style.separatePen)
                 painter.drawLine(QPointF(x, y + height), QPointF(x + width, y + height))
 
         # 绘制文字,如果文字为空则不绘制
         text: str = node.text
         if text != '':
-            # 文字离左边的距离+字体大小
-            margin: int = self.__nav.parentMargin
-            if node.level == 2:
-                margin = self.__nav.childMargin
-                fontSize = self.__nav.childFontSize
+            # 文字离左边的距离
+            margin: int = style.margins[parent] + indent
 
             # 计算文字区域
             textRect: QRect = optionRect.__copy__()
             textRect.setWidth(width - margin)
             textRect.setX(x + margin)
 
-            font: QFont = QFont()
-            font.setPixelSize(fontSize)
-            painter.setFont(font)
+            painter.setFont(style.textFonts[parent])
             painter.setPen(textColor)
             painter.drawText(textRect, Qt.AlignLeft | Qt.AlignVCenter, text)
 
         # 绘制提示信息,如果不需要显示提示信息或者提示信息为空则不绘制
         tip: str = node.tip
 
-        if self.__nav.tipVisible and tip != '':
+        if style.tipVisible and tip != '':
             # 如果是数字则将超过999的数字显示成 999+
             # 如果显示的提示信息长度过长则将多余显示成省略号.
             try:
@@ -661,13 +1028,11 @@ class NavDelegate(QStyledItemDelegate):
             tipRect: QRect = optionRect.__copy__()
             tipRect.setHeight(radius * 2)
             tipRect.moveCenter(optionRect.center())
-            tipRect.setLeft(optionRect.right() - self.__nav.tipWidth - 5)
+            tipRect.setLeft(optionRect.right() - style.tipWidth - 5)
             tipRect.setRight(optionRect.right() - 5)
 
             # 设置字体大小
-            font: QFont = QFont()
-            font.setPixelSize(fontSize - 2)
-            painter.setFont(font)
+            painter.setFont(style.tipFonts[parent])
 
             # 绘制提示文字的背景
             painter.setPen(Qt.NoPen)
@@ -681,18 +1046,16 @@ class NavDelegate(QStyledItemDelegate):
 
         # 计算绘制图标区域
         iconRect: QRect = optionRect.__copy__()
-        iconRect.setLeft(self.__nav.parentIconMargin if parent else self.__nav.childIconMargin)
+        iconRect.setLeft(style.iconMargins[parent] + indent)
 
         # 设置图形字体和画笔颜色
-        font: QFont = self.__iconFont
-        font.setPixelSize(fontSize)
-        painter.setFont(font)
+        painter.setFont(style.iconFonts[parent])
         painter.setPen(textColor)
 
         # 绘制左侧图标,有图标则绘制图标,没有的话父窗体取 + -
         if node.icon != '':
             painter.drawText(iconRect, Qt.AlignLeft | Qt.AlignVCenter, node.icon)
-        elif parent:
+        elif parent or node.children:
             if node.expand:
                 painter.drawText(iconRect, Qt.AlignLeft | Qt.AlignVCenter, chr(0xf067))
             else:
@@ -700,7 +1063,7 @@ class NavDelegate(QStyledItemDelegate):
 
         # 绘制父节点右侧图标
         iconRect.setRight(optionRect.width() - 10)
-        if not (self.__nav.tipVisible and node.tip != '') and self.__nav.rightIconVisible and parent:
+        if not (style.tipVisible and node.tip != '') and style.rightIconVisible and parent:
             if node.expand:
                 painter.drawText(iconRect, Qt.AlignRight | Qt.AlignVCenter, chr(0xf054))
             else:
@@ -5,7 +5,7 @@ from PySide2.QtCore import QEnum, QSize, Qt, QPoint, QRect
 from PySide2.QtGui import QColor, QFont, QPaintEvent, QPainter, QFontDatabase, QPen, QPolygon
 from PySide2.QtWidgets import QWidget
 
-from custom_widgets.iconhelper.resource import *
+from custom_widgets.iconhelper.iconhelper import initResources
 
 
 class NavProgress(QWidget):
@@ -50,6 +50,7 @@ class NavProgress(QWidget):
         # 判断图形字体是否存在，不存在则加入
         fontDb: QFontDatabase = QFontDatabase()
         if not fontDb.families().__contains__("FontAwesome"):
+            initResources()
             fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
             fontName: List[str] = fontDb.applicationFontFamilies(fontId)
             if len(fontName) == 0:
@@ -4,7 +4,7 @@ from PySide2.QtWidgets import QApplication, QWidget
 from PySide2.QtGui import QResizeEvent, QMouseEvent, QPaintEvent, QPainter, QColor, QFont, QFontDatabase
 from PySide2.QtCore import QEvent, QRect, QSize, Signal, QPoint, Qt
 
-from custom_widgets.iconhelper.resource import *
+from custom_widgets.iconhelper.iconhelper import initResources
 
 class NavTitle(QWidget):
     """
@@ -61,6 +61,7 @@ class NavTitle(QWidget):
         # 判断图形字体是否存在，不存在则加入
         fontDb: QFontDatabase = QFontDatabase()
         if not fontDb.families().__contains__("FontAwesome"):
+            initResources()
             fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
             fontName: List[str] = fontDb.applicationFontFamilies(fontId)
             if len(fontName) == 0:
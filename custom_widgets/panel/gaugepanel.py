@@ -1,7 +1,12 @@
-from PySide2.QtCore import QTimer, QSize, Signal, Qt, QRectF, QPoint
-from PySide2.QtGui import QPaintEvent, QPainter, QColor, QPen, QPolygon
+from typing import Dict, Tuple
+from collections import OrderedDict
+
+from PySide2.QtCore import QSize, Signal, Qt, QRectF, QPoint
+from PySide2.QtGui import QPaintEvent, QPainter, QColor, QPen, QPolygon, QFont, QPixmap, QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 import math
 
 
@@ -21,6 +26,10 @@ class GaugePanel(QWidget):
     """
     valueChanged = Signal(int)  # value
 
+    # 所有仪表盘共享的静态表盘缓存,尺寸和样式相同的仪表盘只绘制一次,按最近使用排序
+    dialCacheSize: int = 32  # 静态表盘缓存最大数量
+    __dialCache: Dict[Tuple, QPixmap] = OrderedDict()
+
     def __init__(self, parent: QWidget = None):
         super(GaugePanel, self).__init__(parent)
         self.__minValue: float = 0  # 最小值
@@ -49,18 +58,75 @@ class GaugePanel(QWidget):
 
         self.__reverse: bool = False  # 是否往回走
         self.__currentValue: float = 0  # 当前值
-        self.__timer: QTimer = QTimer(self)  # 定时器绘制动画
-        self.__timer.setInterval(10)
-        self.__timer.timeout.connect(self.updateValue)
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,动画时订阅
+
+        self.__dialKey: Tuple = ()  # 当前静态表盘对应的 (尺寸, 设备像素比, 样式)
+        self.__dialPixmap: QPixmap = QPixmap()  # 当前静态表盘
+        self.__valueFont: QFont = QFont()  # 当前值字体
+        self.__valueFont.setPixelSize(15)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续未完成的动画
+        if self.__animation and self.__currentValue != self.__value:
+            self.__clock.subscribe(self.updateValue)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停动画
+        self.__clock.unsubscribe(self.updateValue)
 
     def paintEvent(self, event: QPaintEvent = None) -> None:
         width: int = self.width()
         height: int = self.height()
         side: int = min(width, height)
-    
-        # 绘制准备工作,启用反锯齿,平移坐标轴中心,等比例缩放
+
+        # 背景/圆环/刻度线/刻度值/描述文字不随值变化,直接绘制缓存的静态表盘
         painter: QPainter = QPainter(self)
+        painter.drawPixmap(0, 0, self.dialPixmap())
+
+        # 绘制准备工作,启用反锯齿,平移坐标轴中心,等比例缩放
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.translate(width / 2, height / 2)
+        painter.scale(side / 200.0, side / 200.0)
+
+        self.drawPointer(painter)  # 绘制指示器
+        self.drawValue(painter)  # 绘制当前值
+
+    def dialPixmap(self) -> QPixmap:
+        """ 返回静态表盘,尺寸/设备像素比/样式改变后重新生成,相同参数的表盘直接从缓存中返回 """
+        dpr: float = self.devicePixelRatioF()
+        key: Tuple = (self.width(), self.height(), dpr, self.font().key(),
+                      self.__bgColor.rgba(), self.__ringColor.rgba(), self.__scaleColor.rgba(), self.__textColor.rgba(),
+                      self.__ringWidth, self.__startAngle, self.__endAngle, self.__scaleMajor, self.__scaleMinor,
+                      self.__minValue, self.__maxValue, self.__scalePrecision, self.__text)
+        if key == self.__dialKey: return self.__dialPixmap
+
+        pixmap: QPixmap = GaugePanel.__dialCache.get(key)
+        if pixmap is not None:
+            GaugePanel.__dialCache.move_to_end(key)
+        else:
+            pixmap = self.__drawDial(dpr)
+            GaugePanel.__dialCache[key] = pixmap
+            while GaugePanel.__dialCache.__len__() > GaugePanel.dialCacheSize:
+                GaugePanel.__dialCache.popitem(last=False)
+
+        self.__dialKey = key
+        self.__dialPixmap = pixmap
+        return pixmap
+
+    def __drawDial(self, dpr: float) -> QPixmap:
+        """ 绘制静态表盘 """
+        width: int = self.width()
+        height: int = self.height()
+        side: int = min(width, height)
+
+        pixmap: QPixmap = QPixmap(int(width * dpr), int(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+
+        # 绘制准备工作,启用反锯齿,平移坐标轴中心,等比例缩放,字体和控件保持一致
+        painter: QPainter = QPainter(pixmap)
         painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.setFont(self.font())
 
         # 绘制背景
         if self.__bgColor != Qt.transparent:
@@ -73,8 +139,10 @@ class GaugePanel(QWidget):
         self.drawRing(painter)  # 绘制圆环
         self.drawScale(painter)  # 绘制刻度线
         self.drawScaleNum(painter)  # 绘制刻度值
-        self.drawPointer(painter)  # 绘制指示器
-        self.drawValue(painter)  # 绘制当前值
+        self.drawText(painter)  # 绘制描述文字
+        painter.end()
+
+        return pixmap
 
     def drawRing(self, painter: QPainter = None) -> None:
         radius: int = 70
@@ -167,34 +235,44 @@ class GaugePanel(QWidget):
         radius: int = 100
         painter.save()
         painter.setPen(self.__textColor)
-
-        font: QFont = QFont()
-        font.setPixelSize(15)
-        painter.setFont(font)
+        painter.setFont(self.__valueFont)
 
         strValue: str = '%s' % round(self.__currentValue, self.__precision) if self.__precision else str(int(self.__currentValue))
         strValue = "%s %s" % (strValue, self.__unit)
         valueRect: QRectF = QRectF(-radius, radius / 3.5, radius * 2, radius / 3.5)
         painter.drawText(valueRect, Qt.AlignCenter, strValue)
 
-        textRect: QRectF = QRectF(-radius, radius / 2.5, radius * 2, radius / 2.5)
+        painter.restore()
+
+    def drawText(self, painter: QPainter = None) -> None:
+        radius: int = 100
+        painter.save()
+        painter.setPen(self.__textColor)
+
+        font: QFont = QFont()
         font.setPixelSize(12)
         painter.setFont(font)
+
+        textRect: QRectF = QRectF(-radius, radius / 2.5, radius * 2, radius / 2.5)
         painter.drawText(textRect, Qt.AlignCenter, self.__text)
 
         painter.restore()
 
-    def updateValue(self) -> None:
+    def updateValue(self, elapsed: float = 10) -> None:
+        # 步长按每10毫秒计算,按实际经过的时间折算,到达目标值后取消订阅
+        step: float = self.__animationStep * elapsed / 10
         if not self.__reverse:
-            if self.__currentValue >= self.__value:
-                self.__timer.stop()
+            if self.__currentValue + step >= self.__value:
+                self.__currentValue = self.__value
+                self.__clock.unsubscribe(self.updateValue)
             else:
-                self.__currentValue += self.__animationStep
+                self.__currentValue += step
         else:
-            if self.__currentValue <= self.__value:
-                self.__timer.stop()
+            if self.__currentValue - step <= self.__value:
+                self.__currentValue = self.__value
+                self.__clock.unsubscribe(self.updateValue)
             else:
-                self.__currentValue -= self.__animationStep
+                self.__currentValue -= step
 
         self.update()
 
@@ -254,8 +332,8 @@ class GaugePanel(QWidget):
         if not self.__animation:
             self.__currentValue = self.__value
             self.update()
-        else:
-            self.__timer.start()
+        elif self.isVisible():
+            self.__clock.subscribe(self.updateValue)
 
     @property
     def precision(self) -> int: return self.__precision
@@ -1,9 +1,12 @@
 from typing import AnyStr
 
-from PySide2.QtCore import QObject, QEvent, QTimer, QSize, QPoint, Qt, QRect
-from PySide2.QtGui import QColor, QPaintEvent, QPainter, QMouseEvent, QFont, QLinearGradient, QPainterPath
+from PySide2.QtCore import QObject, QEvent, QSize, QPoint, Qt, QRect
+from PySide2.QtGui import QColor, QPaintEvent, QPainter, QMouseEvent, QFont, QLinearGradient, QPainterPath, \
+    QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class LightButton(QWidget):
     """
@@ -41,14 +44,14 @@ class LightButton(QWidget):
         self.__overlayColor: QColor = QColor(255, 255, 255)  # 遮罩层颜色
 
         self.__isAlarm: bool = False  # 是否报警
-        self.__timerAlarm: QTimer = QTimer(self)  # 定时器切换颜色
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,报警时订阅切换颜色
+        self.__alarmInterval: int = 500  # 报警切换颜色间隔
+        self.__alarming: bool = False  # 是否正在报警闪烁,隐藏时暂停
 
         self.lastPoint: QPoint = QPoint()
         self.pressed: bool = False
 
         self.installEventFilter(self)
-        self.__timerAlarm.timeout.connect(self.alarm)
-        self.__timerAlarm.setInterval(500)
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         if self.__canMove:
@@ -67,6 +70,15 @@ class LightButton(QWidget):
 
         return super(LightButton, self).eventFilter(watched, event)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续报警闪烁
+        if self.__alarming:
+            self.__clock.subscribe(self.__alarmTick, self.__alarmInterval)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停报警闪烁
+        self.__clock.unsubscribe(self.__alarmTick)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         width: int = self.width()
         height: int = self.height()
@@ -344,13 +356,19 @@ class LightButton(QWidget):
 
     def startAlarm(self) -> None:
         """ 开始报警闪烁 """
-        if self.__timerAlarm.isActive(): return
-        self.__timerAlarm.start()
+        if self.__alarming: return
+        self.__alarming = True
+        if self.isVisible():
+            self.__clock.subscribe(self.__alarmTick, self.__alarmInterval)
 
     def stopAlarm(self) -> None:
         """ 停止报警闪烁 """
-        if not self.__timerAlarm.isActive(): return
-        self.__timerAlarm.stop()
+        if not self.__alarming: return
+        self.__alarming = False
+        self.__clock.unsubscribe(self.__alarmTick)
+
+    def __alarmTick(self, elapsed: float) -> None:
+        self.alarm()
 
     def alarm(self) -> None:
         """ 设置闪烁颜色 """
@@ -2,10 +2,12 @@ from enum import Enum
 from typing import List
 
 import shiboken2
-from PySide2.QtCore import QEnum, QTimer, QSize, Qt, QRect
-from PySide2.QtGui import QFont, QColor, QPaintEvent, QPainter, QPen
+from PySide2.QtCore import QEnum, QSize, Qt, QRect
+from PySide2.QtGui import QFont, QColor, QPaintEvent, QPainter, QPen, QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class PanelItem(QWidget):
     """
@@ -47,9 +49,16 @@ class PanelItem(QWidget):
 
         self.__isDark: bool = False  # 是否加深
         self.__tempColor: QColor = self.__borderColor  # 临时颜色
-        self.__timer: QTimer = QTimer(self)  # 报警切换定时器
-        self.__timer.timeout.connect(self.checkAlarm)
-        self.__timer.setInterval(500)
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,报警时按切换间隔订阅
+
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续报警切换
+        if self.__isAlarm and self.__isEnable:
+            self.__clock.subscribe(self.__alarmTick, self.__alarmInterval)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停报警切换
+        self.__clock.unsubscribe(self.__alarmTick)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         # 绘制准备工作,启用反锯齿
@@ -213,7 +222,8 @@ class PanelItem(QWidget):
     def alarmInterval(self, alarm_interval: int) -> None:
         if self.__alarmInterval == alarm_interval: return
         self.__alarmInterval = alarm_interval
-        self.__timer.setInterval(alarm_interval)
+        if self.__clock.isSubscribed(self.__alarmTick):
+            self.__clock.subscribe(self.__alarmTick, alarm_interval)
 
     @property
     def alarmTextColor(self) -> QColor: return self.__alarmTextColor
@@ -253,11 +263,12 @@ class PanelItem(QWidget):
 
         self.__isAlarm = is_alarm
         if is_alarm:
-            if not self.__timer.isActive(): self.__timer.start()
+            if self.isVisible():
+                self.__clock.subscribe(self.__alarmTick, self.__alarmInterval)
             self.__isDark = True
             self.__tempColor = self.__alarmDarkColor
         else:
-            if self.__timer.isActive(): self.__timer.stop()
+            self.__clock.unsubscribe(self.__alarmTick)
             self.__isDark = False
             self.__tempColor = self.__borderColor
         self.update()
@@ -268,7 +279,7 @@ class PanelItem(QWidget):
     @isEnable.setter
     def isEnable(self, is_enable: bool) -> None:
         self.__isEnable = is_enable
-        if self.__timer.isActive(): self.__timer.stop()
+        self.__clock.unsubscribe(self.__alarmTick)
 
         if is_enable:
             self.__tempColor = self.__borderColor
@@ -294,6 +305,9 @@ class PanelItem(QWidget):
         self.__isDark = not self.__isDark
         self.update()
 
+    def __alarmTick(self, elapsed: float) -> None:
+        self.checkAlarm()
+
 
 if __name__ == '__main__':
     import sys
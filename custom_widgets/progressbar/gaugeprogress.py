@@ -3,9 +3,12 @@ import math
 from enum import Enum
 
 from PySide2.QtCore import QEnum, QEvent, QPropertyAnimation, QPointF, Signal, QTime, Qt, QRectF, QSize, QPoint
-from PySide2.QtGui import QColor, QMouseEvent, QPaintEvent, QPainter, QLinearGradient, QPolygon, QPen, QFont
+from PySide2.QtGui import QColor, QMouseEvent, QPaintEvent, QPainter, QLinearGradient, QPolygon, QPen, QFont, \
+    QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class GaugeProgress(QWidget):
     """
@@ -57,7 +60,10 @@ class GaugeProgress(QWidget):
         self.__hover: bool = False  # 是否鼠标悬停
         self.__radiusCoverCircle: int = 85  # 覆盖圆半径
         self.__radiusCircle: int = 80  # 中间圆半径
-        self.__animation: QPropertyAnimation = QPropertyAnimation(self, b'')  # 动画对象
+        self.__animation: QPropertyAnimation = QPropertyAnimation(self, b'')  # 动画对象,只负责按曲线插值
+        self.__animationTime: float = 0.0  # 动画已推进的毫秒数
+        self.__animating: bool = False  # 动画是否进行中,隐藏时暂停
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,动画进行中订阅
 
         self.__pressed: bool = False  # 鼠标是否按下
 
@@ -68,15 +74,40 @@ class GaugeProgress(QWidget):
 
         self.setFont(QFont("Arial", 9))
 
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续未完成的动画
+        if self.__animating:
+            self.__clock.subscribe(self.__advance)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停动画
+        self.__clock.unsubscribe(self.__advance)
+
     def enterEvent(self, event: QEvent) -> None:
         self.__hover = True
-        self.__animation.stop()
-        self.__animation.start()
+        self.__startAnimation()
 
     def leaveEvent(self, event: QEvent) -> None:
         self.__hover = False
-        self.__animation.stop()
-        self.__animation.start()
+        self.__startAnimation()
+
+    def __startAnimation(self) -> None:
+        """ 从头开始动画,由全局动画时钟推进 """
+        self.__animationTime = 0.0
+        self.__animation.setCurrentTime(0)
+        self.__animating = True
+        if self.isVisible():
+            self.__clock.subscribe(self.__advance)
+
+    def __advance(self, elapsed: float) -> None:
+        """ 推进动画,到达终点后取消订阅 """
+        duration: int = self.__animation.duration()
+        self.__animationTime = min(self.__animationTime + elapsed, duration)
+        self.__animation.setCurrentTime(int(self.__animationTime))
+
+        if self.__animationTime >= duration:
+            self.__animating = False
+            self.__clock.unsubscribe(self.__advance)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         self.__pressed = True
@@ -1,7 +1,9 @@
-from PySide2.QtCore import QSize, Signal, Slot, Qt, QRect, QTimer, QRectF
-from PySide2.QtGui import QPainter, QFont, QColor, QPen, QResizeEvent, QMouseEvent, QPaintEvent
+from PySide2.QtCore import QSize, Signal, Qt, QRect, QRectF
+from PySide2.QtGui import QPainter, QFont, QColor, QPen, QResizeEvent, QMouseEvent, QPaintEvent, QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 class ProgressButton(QWidget):
     """
     按钮进度条控件
@@ -26,20 +28,29 @@ class ProgressButton(QWidget):
         self.__value: float = 0.0  # 当前值
         self.__status: int = 0  # 状态
         self.__tempWidth: int = 0  # 动态改变宽度
-        self.__timer: QTimer = QTimer(self)  # 定时器改变进度
-        self.__timer.setInterval(10)
-        self.__timer.timeout.connect(self.__progress)
+        self.__running: bool = False  # 进度动画是否进行中,隐藏时暂停
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,动画进行中订阅
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         self.__tempWidth = event.size().width()
         self.update()
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
-        if self.__timer.isActive(): return
+        if self.__running: return
         self.__status = 0
         self.__value = 0.0
         self.__tempWidth = self.width()
-        self.__timer.start()
+        self.__running = True
+        self.__clock.subscribe(self.__progress)
+
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续未完成的进度动画
+        if self.__running:
+            self.__clock.subscribe(self.__progress)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停动画
+        self.__clock.unsubscribe(self.__progress)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         painter = QPainter(self)
@@ -116,23 +127,25 @@ class ProgressButton(QWidget):
 
         painter.restore()
 
-    @Slot()
-    def __progress(self):
+    def __progress(self, elapsed: float) -> None:
+        # 原先每10毫秒宽度变化5像素,进度增加1度,按实际经过的时间折算
+        ticks: float = elapsed / 10
         if 0 is self.__status:
-            self.__tempWidth -= 5
+            self.__tempWidth -= max(1, round(5 * ticks))
             if self.__tempWidth < self.height() / 2:
                 self.__tempWidth = self.height() / 2
                 self.__status = 1
         elif 1 is self.__status:
-            self.__value += 1.0
+            self.__value += ticks
             if self.__value >= 360:
                 self.__value = 360.0
                 self.__status = 2
         elif 2 is self.__status:
-            self.__tempWidth += 5
+            self.__tempWidth += max(1, round(5 * ticks))
             if self.__tempWidth > self.width():
                 self.__tempWidth = self.width()
-                self.__timer.stop()
+                self.__running = False
+                self.__clock.unsubscribe(self.__progress)
 
         self.update()
 
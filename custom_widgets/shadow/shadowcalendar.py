@@ -200,7 +200,7 @@ if __name__ == '__main__':
     from PySide2.QtGui import QFont, QFontDatabase, QPalette
     from PySide2.QtCore import QDateTime, QRect, QTextCodec
     from PySide2.QtWidgets import QApplication, QFrame, QPushButton, QLabel, QVBoxLayout, QHBoxLayout, QSizePolicy
-    from custom_widgets.iconhelper.resource import *
+    from custom_widgets.iconhelper.iconhelper import initResources
     from custom_widgets.line.line import Line
 
     class FrmShadowCalendar(QWidget):
@@ -244,6 +244,7 @@ if __name__ == '__main__':
             # 判断图形字体是否存在，不存在则加入
             fontDb: QFontDatabase = QFontDatabase()
             if not fontDb.families().__contains__("FontAwesome"):
+                initResources()
                 fontId: int = fontDb.addApplicationFont(":/image/fontawesome-webfont.ttf")
                 fontName: List[str] = fontDb.applicationFontFamilies(fontId)
                 if len(fontName) == 0:
@@ -1,10 +1,12 @@
 from typing import List, AnyStr
 
-from PySide2.QtCore import QPropertyAnimation, QDateTime, QTime, Qt, QPointF, QSize
+from PySide2.QtCore import QDateTime, QTime, Qt, QPointF, QSize
 from PySide2.QtGui import QPaintEvent, QPainter, QColor, QRadialGradient, QFont, QFontMetricsF, QPainterPath, QPen, \
-    QBrush
+    QBrush, QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class ShadowClock(QWidget):
     """
@@ -30,14 +32,18 @@ class ShadowClock(QWidget):
         self.__minuteColor: QColor = QColor("#22A3A9")  # 分钟颜色
         self.__secondColor: QColor = QColor("#22A3A9")  # 秒钟颜色
 
-        # 采用动画机制,产生过渡效果
-        self.animation: QPropertyAnimation = QPropertyAnimation(self, b'')
-        self.animation.valueChanged.connect(self.update)
-        self.animation.setDuration(1000)
-        self.animation.setStartValue(0)
-        self.animation.setEndValue(20)
-        self.animation.setLoopCount(-1)
-        self.animation.start()
+        # 采用动画机制,产生过渡效果,显示期间订阅全局动画时钟,每秒刷新20次
+        self.__clock: FrameClock = FrameClock()
+        self.__interval: int = 50  # 刷新间隔
+
+    def showEvent(self, event: QShowEvent) -> None:
+        self.__clock.subscribe(self.__refresh, self.__interval)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        self.__clock.unsubscribe(self.__refresh)
+
+    def __refresh(self, elapsed: float) -> None:
+        self.update()
 
     def paintEvent(self, event: QPaintEvent) -> None:
         width: int = self.width()
@@ -0,0 +1,16 @@
+"""
+单例元类
+
+QObject 的子类指定 metaclass=Singleton 后, 进程内只创建一个实例, 之后的构造调用都返回同一个实例
+"""
+
+from PySide2.QtCore import QObject
+
+
+class Singleton(type(QObject), type):
+    _instances = {}
+
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        return cls._instances[cls]
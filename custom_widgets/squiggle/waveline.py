@@ -1,9 +1,13 @@
-from typing import List
+from typing import List, Tuple, Iterable, Optional, Union
+from array import array
 
-from PySide2.QtCore import QTimer, QSize, QPoint, Qt, QPointF
-from PySide2.QtGui import QColor, QPaintEvent, QPainter, QLinearGradient, QPen
+import shiboken2
+from PySide2.QtCore import QSize, QPoint, Qt, QPointF
+from PySide2.QtGui import QColor, QPaintEvent, QPainter, QLinearGradient, QPen, QPolygonF, QTransform, QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 
 class WaveLine(QWidget):
     """
@@ -15,7 +19,12 @@ class WaveLine(QWidget):
     3. 可设置item之间的间隔
     4. 可设置渐变的背景颜色
     5. 可设置线条的颜色
+    6. 可持续追加采样数据,数据保存在固定容量的环形缓冲区中
+    7. 数据个数远多于像素列时按列保留首末及最大最小值绘制,绘制耗时只与控件宽度有关
+    8. 可关闭按列抽稀,始终绘制全部数据
     """
+    __rawPolygon: Optional[bool] = None  # 当前平台 QPointF 是否可以按两个 double 整块拷贝
+
     def __init__(self, parent: QWidget = None):
         super(WaveLine, self).__init__(parent)
         self.__maxValue: int = 100  # 最大值
@@ -26,12 +35,30 @@ class WaveLine(QWidget):
         self.__bgColorEnd: QColor = QColor(60, 60, 60)  # 背景渐变结束颜色
         self.__lineColor: QColor = QColor(100, 184, 255)  # 线条颜色
 
-        self.__timer: QTimer = QTimer(self)  # 绘制定时器
-        self.__timer.setInterval(10)
-        self.__timer.timeout.connect(self.updateData)
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,过渡时订阅
+
+        # 数据按环形缓冲区保存,缓冲区满之后 __head 指向最早的数据
+        self.__capacity: int = 1000  # 环形缓冲区容量,追加采样数据时超出的旧数据被丢弃
+        self.__head: int = 0  # 最早数据的位置
+        self.__converged: bool = True  # 当前数据是否已经全部过渡到目标数据
+        self.__currentDataVec: array = array('d')  # 当前数据集合
+        self.__dataVec: array = array('d')  # 目标数据集合
+
+        self.__xyVec: array = array('d')  # 绘制线段用的 x,y 交错坐标,x 为数据序号
+        self.__xyCount: int = 0  # __xyVec 中 x 坐标对应的原始数据个数,抽稀后为-1
+        self.__polygon: QPolygonF = QPolygonF()  # 复用的绘制点集合
+        self.__dataVersion: int = 0  # 当前数据版本,数据改变后递增
+        self.__polygonKey: tuple = ()  # 点集合对应的 (数据版本, 抽稀列数)
+        self.__decimation: bool = True  # 数据个数远多于像素列时是否按列抽稀
+
+    def showEvent(self, event: QShowEvent) -> None:
+        # 重新显示后继续未完成的过渡
+        if not self.__converged:
+            self.__clock.subscribe(self.updateData)
 
-        self.__currentDataVec: List[int] = []  # 当前数据集合
-        self.__dataVec: List[int] = []  # 目标数据集合
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停过渡
+        self.__clock.unsubscribe(self.updateData)
 
     def paintEvent(self, event: QPaintEvent) -> None:
         # 绘制准备工作,启用反锯齿
@@ -52,57 +79,216 @@ class WaveLine(QWidget):
         painter.restore()
 
     def drawLine(self, painter: QPainter) -> None:
+        count: int = len(self.__currentDataVec)
+        if count < 2:
+            return
+
         painter.save()
         painter.setPen(QPen(self.__lineColor, 2))
 
-        count: int = len(self.__dataVec)
-        increment: float = self.width() / count
-        initX: float = 0.0
-        pointVec: List[QPointF] = []
-
-        for i in range(count - 1):
-            currentValue: float = self.__currentDataVec[i]
-            y1: float = self.height() - self.height() / self.__maxValue * currentValue
-            nextValue: float = self.__currentDataVec[i + 1]
-            y2: float = self.height() - self.height() / self.__maxValue * nextValue
-
-            point1: QPointF = QPointF(initX, y1)
-            point2: QPointF = QPointF(initX + increment, y2)
-            initX += increment
-
-            pointVec.append(point1)
-            pointVec.append(point2)
+        # 数据个数超过像素列数4倍时按列抽稀,数据和宽度都没有变化时直接复用上次的点集合
+        columns: int = max(1, round(self.width() * self.devicePixelRatioF()))
+        key: tuple = (self.__dataVersion, columns if self.__decimation and count > columns * 4 else 0)
+        if key != self.__polygonKey:
+            self.__updatePolygon(key[1])
+            self.__polygonKey = key
 
-        painter.drawLines(pointVec)
+        # 由序号和数值映射到控件坐标: x = 序号 * 间隔, y = 高度 - 高度 / 最大值 * 数值
+        increment: float = self.width() / count
+        height: float = self.height()
+        transform: QTransform = QTransform(increment, 0, 0, -height / self.__maxValue, 0, height)
+        painter.drawLines(transform.map(self.__polygon))
         painter.restore()
 
-    def updateData(self) -> None:
-        count: int = len(self.__dataVec)
-
-        for i in range(count):
-            if self.__currentDataVec[i] < self.__dataVec[i]:
-                self.__currentDataVec[i] += self.__step
-            elif self.__currentDataVec[i] > self.__dataVec[i]:
-                self.__currentDataVec[i] -= self.__step
+    def __updatePolygon(self, columns: int) -> None:
+        """ 按当前数据生成线段点集合, columns 大于0时先按像素列抽稀 """
+        values: array = self.__ordered(self.__currentDataVec)
+        indexs: Optional[array] = None
+        if columns > 0:
+            indexs, values = WaveLine.__decimate(values, columns)
+
+        # 每段线条两个点,交错坐标中 x 为数据序号,未抽稀时只有数据个数改变才重新生成
+        count: int = len(values)
+        if len(self.__xyVec) != (count - 1) * 4:
+            self.__xyVec = array('d', bytes((count - 1) * 32))
+            self.__xyCount = 0
+            self.__polygon.resize((count - 1) * 2)
+
+        if indexs is not None:
+            self.__xyVec[0::4] = indexs[:-1]
+            self.__xyVec[2::4] = indexs[1:]
+            self.__xyCount = -1
+        elif self.__xyCount != count:
+            self.__xyVec[0::4] = array('d', range(count - 1))
+            self.__xyVec[2::4] = array('d', range(1, count))
+            self.__xyCount = count
+
+        # y 按时间顺序直接拷贝,再整体拷贝到复用的点集合中
+        self.__xyVec[1::4] = values[:-1]
+        self.__xyVec[3::4] = values[1:]
+        WaveLine.__fillPolygon(self.__polygon, self.__xyVec)
+
+    @staticmethod
+    def __decimate(values: array, columns: int) -> Tuple[array, array]:
+        """
+        按像素列抽稀(M4),每列按时间顺序只保留 首个+最小+最大+末个 数据
+        返回保留数据的 (序号, 数值), 峰值不会丢失,连线后与直接绘制全部数据的效果基本一致
+        """
+        indexs: array = array('d')
+        result: array = array('d')
+        count: int = len(values)
+        start: int = 0
+        for column in range(1, columns + 1):
+            # 序号 i 落在第 i * columns // count 列
+            end: int = (column * count + columns - 1) // columns
+            if end <= start:
+                continue
+
+            segment: array = values[start:end]
+            for index in sorted({0, segment.index(min(segment)), segment.index(max(segment)), end - start - 1}):
+                indexs.append(start + index)
+                result.append(segment[index])
+            start = end
+
+        return indexs, result
+
+    @staticmethod
+    def __fillPolygon(polygon: QPolygonF, xy_vec: array) -> None:
+        """ QPointF 由两个 double 组成时直接整块拷贝,否则逐个点赋值 """
+        if WaveLine.__rawPolygon is None:
+            WaveLine.__rawPolygon = WaveLine.__checkRawPolygon()
+
+        if WaveLine.__rawPolygon:
+            buffer: memoryview = memoryview(shiboken2.VoidPtr(polygon.data(), xy_vec.itemsize * len(xy_vec), True))
+            buffer[:] = memoryview(xy_vec).cast('B')
+        else:
+            for i in range(polygon.size()):
+                polygon.replace(i, QPointF(xy_vec[i * 2], xy_vec[i * 2 + 1]))
+
+    @staticmethod
+    def __checkRawPolygon() -> bool:
+        polygon: QPolygonF = QPolygonF()
+        polygon.resize(1)
+        try:
+            memoryview(shiboken2.VoidPtr(polygon.data(), 16, True))[:] = memoryview(array('d', [1.5, 2.5])).cast('B')
+        except (TypeError, ValueError):
+            return False
+        return polygon.at(0) == QPointF(1.5, 2.5)
+
+    def __ordered(self, data_vec: array) -> array:
+        """ 按时间先后顺序返回环形缓冲区中的数据 """
+        if self.__head == 0:
+            return data_vec
+        return data_vec[self.__head:] + data_vec[:self.__head]
+
+    def __linearize(self) -> None:
+        """ 将环形缓冲区按时间先后顺序展开,最早的数据位于开头 """
+        if self.__head != 0:
+            self.__dataVec = self.__ordered(self.__dataVec)
+            self.__currentDataVec = self.__ordered(self.__currentDataVec)
+            self.__head = 0
+
+    def updateData(self, elapsed: float = 10) -> None:
+        if self.__converged:
+            return
+
+        # 每个数据按步长(每10毫秒)向目标数据过渡,步长按实际经过的时间折算,剩余差值不足一个步长时直接到达
+        step: float = self.__step * elapsed / 10
+        self.__currentDataVec = array('d', [
+            current + step if current + step < target else (current - step if current - step > target else target)
+            for current, target in zip(self.__currentDataVec, self.__dataVec)])
+        self.__converged = self.__currentDataVec == self.__dataVec
+        self.__dataVersion += 1
+
+        # 全部到达目标数据后取消订阅,有新数据时再订阅
+        if self.__converged:
+            self.__clock.unsubscribe(self.updateData)
 
         self.update()
 
     def setData(self, data_vec: List[int]) -> None:
         count: int = len(data_vec)
+        self.__linearize()
 
         if len(self.__currentDataVec) < count:
-            for i in range(count - len(self.__currentDataVec)):
-                self.__currentDataVec.insert(0, 0)
+            self.__currentDataVec[0:0] = array('d', bytes((count - len(self.__currentDataVec)) * 8))
 
         if len(self.__dataVec) < count:
-            for i in range(count - len(self.__dataVec)):
-                self.__dataVec.insert(0, 0)
+            self.__dataVec[0:0] = array('d', bytes((count - len(self.__dataVec)) * 8))
+
+        self.__dataVec[0:count] = array('d', data_vec)
+        self.__capacity = max(self.__capacity, len(self.__dataVec))
+        self.__converged = self.__currentDataVec == self.__dataVec
+        self.__dataVersion += 1
+
+        if not self.__converged and self.isVisible():
+            self.__clock.subscribe(self.updateData)
+
+    def appendSamples(self, samples: Union[Iterable[float], array]) -> None:
+        """
+        追加采样数据,追加的数据直接显示不做过渡
+        缓冲区已满时覆盖最早的数据,每次追加只拷贝新增的数据
+        """
+        samples: array = samples if isinstance(samples, array) and samples.typecode == 'd' else array('d', samples)
+        capacity: int = self.__capacity
+        if len(samples) >= capacity:
+            self.__dataVec = samples[len(samples) - capacity:]
+            self.__currentDataVec = array('d', self.__dataVec)
+            self.__head = 0
+        else:
+            # 缓冲区未满时先追加到末尾
+            size: int = len(self.__dataVec)
+            if size < capacity:
+                fill: array = samples[:capacity - size]
+                self.__dataVec.extend(fill)
+                self.__currentDataVec.extend(fill)
+                samples = samples[len(fill):]
+
+            # 缓冲区已满时从最早的数据开始覆盖,超出末尾则回到开头
+            count: int = len(samples)
+            if count > 0:
+                first: int = min(count, capacity - self.__head)
+                self.__dataVec[self.__head:self.__head + first] = samples[:first]
+                self.__currentDataVec[self.__head:self.__head + first] = samples[:first]
+                self.__dataVec[:count - first] = samples[first:]
+                self.__currentDataVec[:count - first] = samples[first:]
+                self.__head = (self.__head + count) % capacity
+
+        self.__dataVersion += 1
+        self.update()
+
+    def clearData(self) -> None:
+        """ 清空全部数据 """
+        self.__dataVec = array('d')
+        self.__currentDataVec = array('d')
+        self.__head = 0
+        self.__converged = True
+        self.__dataVersion += 1
+        self.__clock.unsubscribe(self.updateData)
+        self.update()
 
-        for i in range(count):
-            self.__dataVec[i] = data_vec[i]
+    @property
+    def capacity(self) -> int: return self.__capacity
+
+    @capacity.setter
+    def capacity(self, n_capacity: int) -> None:
+        if self.__capacity == n_capacity or n_capacity <= 0: return
+        # 容量变小时只保留最新的数据
+        self.__linearize()
+        del self.__dataVec[:max(0, len(self.__dataVec) - n_capacity)]
+        del self.__currentDataVec[:max(0, len(self.__currentDataVec) - n_capacity)]
+        self.__capacity = n_capacity
+        self.__dataVersion += 1
+        self.update()
 
-        if not self.__timer.isActive():
-            self.__timer.start()
+    @property
+    def decimation(self) -> bool: return self.__decimation
+
+    @decimation.setter
+    def decimation(self, n_decimation: bool) -> None:
+        if self.__decimation == n_decimation: return
+        self.__decimation = n_decimation
+        self.update()
 
     @property
     def maxValue(self) -> int: return self.__maxValue
@@ -165,7 +351,7 @@ class WaveLine(QWidget):
 
 if __name__ == '__main__':
     import sys, random
-    from PySide2.QtCore import QTextCodec
+    from PySide2.QtCore import QTextCodec, QTimer
     from PySide2.QtGui import QFont
     from PySide2.QtWidgets import QApplication, QVBoxLayout
 
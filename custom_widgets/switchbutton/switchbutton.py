@@ -1,9 +1,12 @@
 from enum import Enum
 
 from PySide2.QtCore import QTimer, QSize, Slot, Signal, QEnum, Qt, QRect, QObject
-from PySide2.QtGui import QColor, QMouseEvent, QResizeEvent, QPaintEvent, QPainter, QPen, QPainterPath, QRadialGradient
+from PySide2.QtGui import QColor, QMouseEvent, QResizeEvent, QPaintEvent, QPainter, QPen, QPainterPath, QRadialGradient, \
+    QShowEvent, QHideEvent
 from PySide2.QtWidgets import QWidget
 
+from custom_widgets.frameclock.frameclock import FrameClock
+
 class SwitchButton(QWidget):
     """
     开关按钮控件
@@ -50,9 +53,7 @@ class SwitchButton(QWidget):
         self.__step: int = 0  # 每次移动的步长
         self.__startX: int = 0  # 滑块开始X轴坐标
         self.__endX: int = 0  # 滑块结束X轴坐标
-        self.__timer: QTimer = QTimer(self)  # 定时器绘制
-        self.__timer.setInterval(30)
-        self.__timer.timeout.connect(self.__updateValue)
+        self.__clock: FrameClock = FrameClock()  # 全局动画时钟,滑动时订阅
 
     @property
     def space(self) -> int: return self.__space
@@ -208,8 +209,8 @@ class SwitchButton(QWidget):
         else:
             self.__endX = 0
 
-        if self.__animation:
-            self.__timer.start()
+        if self.__animation and self.isVisible():
+            self.__clock.subscribe(self.__updateValue)
         else:
             self.__startX = self.__endX
             self.update()
@@ -230,6 +231,15 @@ class SwitchButton(QWidget):
 
         self.update()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        # 隐藏期间没有完成的滑动,重新显示后继续
+        if self.__animation and self.__startX != self.__endX:
+            self.__clock.subscribe(self.__updateValue)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        # 隐藏后不再需要绘制,暂停滑动
+        self.__clock.unsubscribe(self.__updateValue)
+
     def paintEvent(self, event: QPaintEvent) -> None:
         # 绘制准备工作,启用反锯齿
         painter: QPainter = QPainter(self)
@@ -355,20 +365,21 @@ class SwitchButton(QWidget):
     def __change(self) -> None:
         self.mousePressEvent(None)
 
-    @Slot()
-    def __updateValue(self) -> None:
+    def __updateValue(self, elapsed: float) -> None:
+        # 原先每30毫秒移动一个步长,按实际经过的时间折算
+        step: int = max(1, round(self.__step * elapsed / 30))
         if self.__checked:
             if self.__startX < self.__endX:
-                self.__startX = self.__startX + self.__step
+                self.__startX = self.__startX + step
             else:
                 self.__startX = self.__endX
-                self.__timer.stop()
+                self.__clock.unsubscribe(self.__updateValue)
         else:
             if self.__startX > self.__endX:
-                self.__startX = self.__startX - self.__step
+                self.__startX = self.__startX - step
             else:
                 self.__startX = self.__endX
-                self.__timer.stop()
+                self.__clock.unsubscribe(self.__updateValue)
 
         self.update()
 
@@ -1,16 +1,23 @@
 import random, shiboken2
-from typing import List, AnyStr
+from array import array
+from collections import OrderedDict
+from bisect import bisect_left, bisect_right
+from functools import partial
+from itertools import repeat
+from typing import List, Dict, Set, Tuple, Iterable, Optional, Union, AnyStr
 
 from PySide2.QtCore import (QSize, QPoint, Signal, QObject, QEvent, QPropertyAnimation, QDateTime,
-                            QTimer, Qt, QRectF, QPointF, QRect, QEasingCurve)
-from PySide2.QtGui import (QPixmap, QColor, QPaintEvent, QMouseEvent, QResizeEvent, QShowEvent, QPainter, QFont,
-                           QPen, QWheelEvent)
+                            QTimer, Qt, QRectF, QPointF, QRect, QEasingCurve, QRunnable, QThreadPool)
+from PySide2.QtGui import (QPixmap, QImage, QColor, QPaintEvent, QMouseEvent, QResizeEvent, QMoveEvent, QShowEvent, QPainter,
+                           QFont, QPen, QWheelEvent)
 from PySide2.QtWidgets import (QWidget, QScrollBar, QScrollArea, QGridLayout, QVBoxLayout, QStyleOptionSlider,
-                               QStyle, QApplication, QSpacerItem, QSizePolicy)
+                               QStyle, QApplication, QSpacerItem, QSizePolicy, QLayoutItem)
 
+from custom_widgets.singleton.singleton import Singleton
 from custom_widgets.zhtopy.zhtopy import ZhToPY
 from main import *
 
+
 # 字母高亮背景类
 class TelHigh(QWidget):
 
@@ -18,10 +25,14 @@ class TelHigh(QWidget):
         super(TelHigh, self).__init__(parent)
         self.__fontSize: int = 30  # 字体大小
         self.__bgImage: QPixmap = QPixmap()  # 背景图片
+        self.__bgPixmap: QPixmap = QPixmap()  # 缩放后的背景图片,尺寸或图片改变后重新生成
         self.__bgColor: QColor = Qt.transparent  # 背景颜色
         self.__text: str = 'A'  # 显示的文字
         self.__textColor: QColor = QColor(255, 255, 255)  # 文字颜色
 
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.__bgPixmap = QPixmap()
+
     def paintEvent(self, event: QPaintEvent) -> None:
         width: int = self.width()
         height: int = self.height()
@@ -36,11 +47,17 @@ class TelHigh(QWidget):
         font.setPixelSize(self.__fontSize)
         painter.setFont(font)
 
-        # 优先绘制背景图片,居中绘制
-        if self.__bgImage is not None:
-            pix: QPixmap = self.__bgImage.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            pixX: int = self.rect().center().x() - pix.width() // 2
-            pixY: int = self.rect().center().y() - pix.height() // 2
+        # 优先绘制背景图片,居中绘制,缩放结果缓存到尺寸或图片改变为止
+        if not self.__bgImage.isNull():
+            if self.__bgPixmap.isNull():
+                dpr: float = self.devicePixelRatioF()
+                self.__bgPixmap = self.__bgImage.scaled(self.size() * dpr, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                self.__bgPixmap.setDevicePixelRatio(dpr)
+
+            pix: QPixmap = self.__bgPixmap
+            pixSize: QSize = pix.size() / pix.devicePixelRatio()
+            pixX: int = self.rect().center().x() - pixSize.width() // 2
+            pixY: int = self.rect().center().y() - pixSize.height() // 2
             point: QPoint = QPoint(pixX, pixY)
             painter.drawPixmap(point, pix)
             textRect = QRectF(0, 0, width - 40, height - 5)
@@ -70,6 +87,7 @@ class TelHigh(QWidget):
     def bgImage(self, bg_image: QPixmap) -> None:
         if self.__bgImage == bg_image: return
         self.__bgImage = bg_image
+        self.__bgPixmap = QPixmap()
         self.update()
 
     @property
@@ -319,6 +337,65 @@ class TelLetter(QWidget):
         self.__highColor = high_color
         self.update()
 
+# 联系人头像缓存类
+class TelAvatar(QObject, metaclass=Singleton):
+    """ 同一路径的头像只解码一次,各尺寸的缩略图按最近使用缓存,绘制时直接取用 """
+
+    def __init__(self):
+        super(TelAvatar, self).__init__()
+
+        self.source_size: int = 64  # 原图缓存最大数量
+        self.cache_size: int = 512  # 缩略图缓存最大数量
+        self.cache_hits: int = 0  # 缩略图缓存命中次数
+        self.cache_misses: int = 0  # 缩略图缓存未命中次数
+        # 原图缓存, 键为图片路径, 按最近使用排序
+        self.__sources: Dict[str, QPixmap] = OrderedDict()
+        # 缩略图缓存, 键为 (原图缓存键, 尺寸, 设备像素比), 按最近使用排序
+        self.__thumbs: Dict[Tuple, QPixmap] = OrderedDict()
+
+    def pixmap(self, file_name: str) -> QPixmap:
+        """ 载入头像原图, 相同路径只解码一次 """
+        pix: QPixmap = self.__sources.get(file_name)
+        if pix is not None:
+            self.__sources.move_to_end(file_name)
+            return pix
+
+        pix = QPixmap(file_name)
+        self.__sources[file_name] = pix
+        while self.__sources.__len__() > self.source_size:
+            self.__sources.popitem(last=False)
+
+        return pix
+
+    def thumbnail(self, pixmap: QPixmap, size: int, dpr: float = 1.0) -> QPixmap:
+        """ 返回按比例缩放到 size 以内的缩略图, 相同原图和尺寸直接从缓存中返回 """
+        if pixmap.isNull() or size <= 0: return QPixmap()
+
+        key: Tuple = (pixmap.cacheKey(), size, dpr)
+        pix: QPixmap = self.__thumbs.get(key)
+        if pix is not None:
+            self.__thumbs.move_to_end(key)
+            self.cache_hits += 1
+            return pix
+
+        self.cache_misses += 1
+        side: int = int(size * dpr)
+        pix = pixmap.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pix.setDevicePixelRatio(dpr)
+
+        self.__thumbs[key] = pix
+        while self.__thumbs.__len__() > self.cache_size:
+            self.__thumbs.popitem(last=False)
+
+        return pix
+
+    def clearCache(self) -> None:
+        """ 清空原图及缩略图缓存和命中统计 """
+        self.__sources.clear()
+        self.__thumbs.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
 # 通讯录按钮类
 class TelButton(QWidget):
 
@@ -331,7 +408,7 @@ class TelButton(QWidget):
         self.__padding: int = 30  # 左侧图标离左边的距离
         self.__space: int = 10  # 图标与右侧文字之间的间隔
 
-        self.__pixmap: QPixmap = QPixmap(":/image/tel.png")  # 左侧小图标
+        self.__pixmap: QPixmap = TelAvatar().pixmap(":/image/tel.png")  # 左侧小图标
         self.__name: str = "张三"  # 姓名
         self.__belong: str = "公司"  # 类型
         self.__tel: str = "13888888888"  # 电话
@@ -383,8 +460,8 @@ class TelButton(QWidget):
         # 绘制左侧小图标
         rectPix: QRect = QRect(self.__padding, height // 2 - pixSize // 2, pixSize, pixSize)
         if self.__pixVisible:
-            pix: QPixmap = self.__pixmap.scaled(pixSize, pixSize, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            painter.drawPixmap(rectPix.x(), rectPix.y(), pix)
+            pix: QPixmap = TelAvatar().thumbnail(self.__pixmap, pixSize, self.devicePixelRatioF())
+            if not pix.isNull(): painter.drawPixmap(rectPix.x(), rectPix.y(), pix)
 
         # 绘制姓名
         p: QPoint = rectPix.topRight()
@@ -513,6 +590,7 @@ class ScrollBar(QScrollBar):
 class TelPanel(QWidget):
 
     positionChanged = Signal(int)  # value
+    layoutChanged = Signal()  # 元素位置可能发生变化
 
     def __init__(self, parent: QWidget = None):
         super(TelPanel, self).__init__(parent)
@@ -535,7 +613,14 @@ class TelPanel(QWidget):
         self.__animation: QPropertyAnimation = QPropertyAnimation(self.__scrollArea.verticalScrollBar(), b"value")  # 动画滑动
         self.__scrollBar: QScrollBar = QScrollBar(Qt.Vertical, self)  # 滚动条
         self.__widget: QWidget = QWidget(self.__scrollArea)  # 滚动区域载体,自动变宽变高
-        self.__gridLayout: QGridLayout = QGridLayout(self.__widget)  # 表格布局
+        self.__boxLayout: QVBoxLayout = QVBoxLayout(self.__widget)  # 依次放置各分区的分割窗体和表格布局
+
+        # 按分割窗体分区,每个分区一个表格布局,插入元素时只重新排列所在的分区
+        # 第一个分区为第一个分割窗体之前的元素,没有分割窗体
+        self.__sectionBanners: List[Optional[QWidget]] = []  # 各分区的分割窗体
+        self.__sectionLayouts: List[QGridLayout] = []  # 各分区的表格布局
+        self.__sectionItems: List[Optional[List[QWidget]]] = []  # 各分区已排列的元素,为空表示需要重新排列
+        self.__vSpacer: Optional[QSpacerItem] = None  # 底边弹簧
 
         self.__movetop: bool = False  # 是否上滑
         self.__pressed: bool = False  # 鼠标按下
@@ -543,15 +628,20 @@ class TelPanel(QWidget):
         self.__pressedPos: QPoint = QPoint(0, 0)  # 鼠标按下处坐标
         self.__pressedTime: QDateTime = QDateTime()  # 鼠标按下时间
         self.__timer: QTimer = QTimer(self)  # 定时器控制滚动条隐藏
+        self.__layoutTimer: QTimer = QTimer(self)  # 定时器合并多次插入后的重新排列
 
         self.initControl()
         self.initForm()
         self.initBar()
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        if watched == self.__widget:
+        if watched == self.__scrollArea.widget():
             if event.type() == QEvent.Resize:
                 self.initBar()
+                self.layoutChanged.emit()
+            elif event.type() == QEvent.LayoutRequest:
+                # 布局在事件过滤器之前已经处理完毕,此时元素位置已更新
+                self.layoutChanged.emit()
 
         return super(TelPanel, self).eventFilter(watched, event)
 
@@ -607,7 +697,8 @@ class TelPanel(QWidget):
         # 如果滚动条已经在顶部且当前下滑或者在底部且当前上滑则无需滚动
         value: int = self.__scrollArea.verticalScrollBar().value()
         height: int = self.__scrollArea.verticalScrollBar().height()
-        if (value == 0 and not self.__movetop) or ((value + height) == self.__widget.height() and self.__movetop):
+        widgetHeight: int = self.__scrollArea.widget().height()
+        if (value == 0 and not self.__movetop) or ((value + height) == widgetHeight and self.__movetop):
             return
 
         if self.__pressedY != currentY:
@@ -645,9 +736,9 @@ class TelPanel(QWidget):
         self.__widget.setStyleSheet("QWidget#TelPanel_Widget{background:transparent;}")
         self.__scrollArea.setWidget(self.__widget)
 
-        # 表格布局
-        self.__gridLayout.setSpacing(0)
-        self.__gridLayout.setContentsMargins(0, 0, 0, 0)
+        # 分区布局
+        self.__boxLayout.setSpacing(0)
+        self.__boxLayout.setContentsMargins(0, 0, 0, 0)
 
     def initForm(self) -> None:
         """ 初始化窗体 """
@@ -659,6 +750,11 @@ class TelPanel(QWidget):
         # 启动定时器隐藏滚动条
         self.__timer.timeout.connect(self.checkBar)
 
+        # 插入元素后回到事件循环再统一排列
+        self.__layoutTimer.setSingleShot(True)
+        self.__layoutTimer.setInterval(0)
+        self.__layoutTimer.timeout.connect(self.layoutItems)
+
     def initBar(self) -> None:
         """ 初始化滚动条 """
 
@@ -694,6 +790,17 @@ class TelPanel(QWidget):
         """ 设置滚动条范围值 """
         self.__scrollBar.setRange(n_min, n_max)
 
+    def setView(self, view: QWidget = None) -> None:
+        """ 设置滚动区域载体,为空时使用表格布局载体 """
+        target: QWidget = self.__widget if view is None else view
+        if self.__scrollArea.widget() is target: return
+
+        # 先取回原有载体,避免被滚动区域删除
+        self.__scrollArea.takeWidget()
+        target.installEventFilter(self)
+        self.__scrollArea.setWidget(target)
+        self.initBar()
+
     @property
     def step(self) -> int: return self.__step
 
@@ -746,17 +853,22 @@ class TelPanel(QWidget):
 
     def setMargin(self, left: int, top: int, right: int, bottom: int) -> None:
         """ 设置四个方位边距 """
-        self.__gridLayout.setContentsMargins(left, top, right, bottom)
+        self.__boxLayout.setContentsMargins(left, top, right, bottom)
 
     @space.setter
     def space(self, n_space: int) -> None:
         """ 设置元素间距 """
-        if self.__space != n_space: self.__gridLayout.setSpacing(n_space)
+        if self.__space != n_space:
+            self.__space = n_space
+            self.__boxLayout.setSpacing(n_space)
+            for grid in self.__sectionLayouts: grid.setSpacing(n_space)
 
     @autoWidth.setter
     def autoWidth(self, auto_width: bool) -> None:
         """ 设置是否自动宽度 """
-        if self.__autoWidth != auto_width: self.__autoWidth = auto_width
+        if self.__autoWidth != auto_width:
+            self.__autoWidth = auto_width
+            self.__sectionItems = [None] * self.__sectionItems.__len__()
 
     @autoHeight.setter
     def autoHeight(self, auto_height: bool) -> None:
@@ -795,59 +907,462 @@ class TelPanel(QWidget):
     @columnCount.setter
     def columnCount(self, column_count: int) -> None:
         """ 设置窗体元素列数 """
-        if self.__columnCount != column_count: self.__columnCount = column_count
+        if self.__columnCount != column_count:
+            self.__columnCount = column_count
+            self.__sectionItems = [None] * self.__sectionItems.__len__()
 
     @items.setter
     def items(self, n_items: List[QWidget]) -> None:
         """ 设置窗体元素集合 """
         self.__items = n_items.copy()
+        self.layoutItems()
+
+    def insertItem(self, index: int, item: QWidget) -> None:
+        """ 插入单个元素,分割窗体索引需要同时通过 indexs 更新 """
+        self.__items.insert(index, item)
+        self.__layoutTimer.start()
+
+    def insertBanner(self, index: int, banner: QWidget) -> None:
+        """ 插入单个分割窗体,分割窗体索引需要同时通过 indexs 更新 """
+        self.__banners.insert(index, banner)
+        self.__layoutTimer.start()
+
+    def activateLayout(self) -> None:
+        """ 立即执行等待中的重新排列并更新元素位置,读取元素坐标前调用 """
+        if not self.__layoutTimer.isActive():
+            self.__boxLayout.activate()
+            return
 
-        row: int = 0
-        column: int = 0
-        count: int = 0
-        temp: int = 0
+        # 排列后的布局请求依次传递到滚动区域,滚动区域据此调整载体大小,载体大小改变后元素随之重新排列
+        self.layoutItems()
+        self.__boxLayout.activate()
+        QApplication.sendPostedEvents(None, QEvent.LayoutRequest)
+        self.__boxLayout.activate()
+        self.layoutChanged.emit()
+
+    def layoutItems(self) -> None:
+        """ 按照元素集合和分割窗体分区排列,只重新排列元素有变化的分区,已有的窗体不会重建 """
+        self.__layoutTimer.stop()
+
+        # 分区边界,分割窗体索引为各分区第一个元素的位置
+        banners: List[Optional[QWidget]] = [None] + self.__banners[:self.__indexs.__len__()]
+        bounds: List[int] = [0] + self.__indexs[:banners.__len__() - 1] + [self.__items.__len__()]
+        self.__syncSections(banners)
+
+        sections: List[Tuple[int, List[QWidget]]] = []
+        for section in range(banners.__len__()):
+            items: List[QWidget] = self.__items[bounds[section]:bounds[section + 1]]
+            if items != self.__sectionItems[section]: sections.append((section, items))
+
+        # 先取出所有要重新排列的分区的布局项,窗体的布局项留着重新放入以保留尺寸缓存,弹簧一并释放
+        # 元素在分区之间移动时不会先加入新分区再从旧分区移除
+        layoutItems: Dict[QWidget, QLayoutItem] = {}
+        for section, items in sections:
+            grid: QGridLayout = self.__sectionLayouts[section]
+            while grid.count() > 0:
+                layoutItem: QLayoutItem = grid.takeAt(0)
+                if layoutItem.widget() is not None: layoutItems[layoutItem.widget()] = layoutItem
+
+        for section, items in sections:
+            grid: QGridLayout = self.__sectionLayouts[section]
+            for i, item in enumerate(items):
+                row, column = divmod(i, self.__columnCount)
+                layoutItem: QLayoutItem = layoutItems.pop(item, None)
+                if layoutItem is None:
+                    grid.addWidget(item, row, column)
+                    self.__showWidget(item)
+                else:
+                    grid.addItem(layoutItem, row, column)
 
-        # 单独添加第一行标识符
-        if self.__indexs.__len__() > 0 and self.__indexs[0] == 0:
-            self.__gridLayout.addWidget(self.__banners[0], row, column, 1, self.__columnCount)
-            row += 1
+            # 设置右边弹簧
+            if not self.__autoWidth:
+                hSpacer: QSpacerItem = QSpacerItem(1, 1, QSizePolicy.Expanding, QSizePolicy.Minimum)
+                grid.addItem(hSpacer, 0, self.__columnCount)
 
-        for item in n_items:
-            # 逐行添加元素到表格布局
-            self.__gridLayout.addWidget(item, row, column)
-            column += 1
-            count += 1
-            temp += 1
+            self.__sectionItems[section] = items
 
-            # 强制插入分割控件,另起一行
-            index: int = self.__indexs.index(count) if count in self.__indexs else -1
-            if index >= 0:
-                row += 1
-                column = 0
-                self.__gridLayout.addWidget(self.__banners[index], row, column, 1, self.__columnCount)
+        # 设置底边弹簧
+        if not self.__autoHeight and self.__vSpacer is None:
+            self.__vSpacer = QSpacerItem(1, 1, QSizePolicy.Minimum, QSizePolicy.Expanding)
+            self.__boxLayout.addItem(self.__vSpacer)
+        elif self.__autoHeight and self.__vSpacer is not None:
+            self.__boxLayout.removeItem(self.__vSpacer)
+            shiboken2.delete(self.__vSpacer)
+            self.__vSpacer = None
+
+    def __syncSections(self, banners: List[Optional[QWidget]]) -> None:
+        """ 按分割窗体集合增删分区,保留的分区顺序不变时只插入新分区,否则全部重建 """
+        if banners == self.__sectionBanners: return
+
+        kept: set = set(banners)
+        for section in reversed(range(self.__sectionBanners.__len__())):
+            if self.__sectionBanners[section] not in kept: self.__removeSection(section)
+
+        existed: set = set(self.__sectionBanners)
+        if [banner for banner in banners if banner in existed] != self.__sectionBanners:
+            for section in reversed(range(self.__sectionBanners.__len__())): self.__removeSection(section)
+
+        for section, banner in enumerate(banners):
+            if section < self.__sectionBanners.__len__() and self.__sectionBanners[section] is banner: continue
+            self.__insertSection(section, banner)
+
+    def __insertSection(self, section: int, banner: Optional[QWidget]) -> None:
+        """ 插入分区,分区布局中依次为 分区0表格, 分割窗体1, 分区1表格, 分割窗体2 ... """
+        grid: QGridLayout = QGridLayout()
+        grid.setSpacing(self.__space)
+        grid.setContentsMargins(0, 0, 0, 0)
+
+        if banner is None:
+            self.__boxLayout.insertLayout(0, grid)
+        else:
+            self.__boxLayout.insertWidget(section * 2 - 1, banner)
+            self.__boxLayout.insertLayout(section * 2, grid)
+            self.__showWidget(banner)
+
+        self.__sectionBanners.insert(section, banner)
+        self.__sectionLayouts.insert(section, grid)
+        self.__sectionItems.insert(section, None)
+
+    def __showWidget(self, widget: QWidget) -> None:
+        """ 新加入布局的窗体立即显示,不等待布局排队的显示调用,隐藏的窗体不占位置也不会被排列 """
+        if not self.__widget.isVisible(): return
+        if widget.isHidden() and widget.testAttribute(Qt.WA_WState_ExplicitShowHide): return
+        widget.show()
+
+    def __removeSection(self, section: int) -> None:
+        """ 移除分区,窗体仍留在载体上,可能重新放入其他分区 """
+        banner: Optional[QWidget] = self.__sectionBanners.pop(section)
+        grid: QGridLayout = self.__sectionLayouts.pop(section)
+        self.__sectionItems.pop(section)
+
+        while grid.count() > 0: grid.takeAt(0)
+        self.__boxLayout.removeItem(grid)
+        if banner is not None and shiboken2.isValid(banner): self.__boxLayout.removeWidget(banner)
+        shiboken2.delete(grid)
+
+# 虚拟通讯录视图类,只为可见行创建按钮
+class TelView(QWidget):
+
+    btnPressed = Signal()
+    btnRelease = Signal(QWidget)  # btn
 
-                # 奇数偶数增加的数量不一样
-                if temp % self.__columnCount == 0: temp += self.__columnCount
-                else: temp += 1
+    def __init__(self, parent: QWidget = None):
+        super(TelView, self).__init__(parent)
+        self.__columnCount: int = 2  # 联系人列数
+        self.__itemHeight: int = 40  # 联系人按钮高度
+        self.__bannerHeight: int = 35  # 字母分隔高度
+
+        self.__infos: List = []  # 排好序的联系人信息集合
+        self.__texts: List[str] = []  # 字母分隔文字集合
+        self.__indexs: List[int] = []  # 字母分隔对应的第一个联系人索引
+
+        # 行表: 每行的起始位置+所属分隔+联系人索引范围,分隔行的联系人索引为 -1
+        self.__rowTops: array = array('i')
+        self.__rowSections: array = array('i')
+        self.__rowStarts: array = array('i')
+        self.__rowEnds: array = array('i')
+        self.__itemTops: array = array('i')  # 每个分隔下第一行联系人的起始位置
+
+        self.__buttons: List[TelButton] = []  # 循环使用的按钮池
+        self.__buttonIndexs: List[int] = []  # 按钮池当前对应的联系人索引
+        self.__banners: List[TelBanner] = []  # 循环使用的分隔池
+        self.__buttonStyle: Dict[str, object] = {}  # 按钮池统一属性
+        self.__bannerStyle: Dict[str, object] = {}  # 分隔池统一属性
+        self.__rowsTimer: QTimer = QTimer(self)  # 定时器合并多次插入后的行表计算
+
+        self.__rowsTimer.setSingleShot(True)
+        self.__rowsTimer.setInterval(0)
+        self.__rowsTimer.timeout.connect(self.initRows)
+
+        self.setObjectName("TelView")
+        self.setStyleSheet("QWidget#TelView{background:transparent;}")
+
+    def event(self, event: QEvent) -> bool:
+        # 放入滚动区域后监听视口大小,视口变高时需要补齐可见行
+        if event.type() == QEvent.ParentChange and self.parentWidget() is not None:
+            self.parentWidget().installEventFilter(self)
+
+        return super(TelView, self).event(event)
 
-                row += 1
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self.parentWidget() and event.type() == QEvent.Resize:
+            self.updateRows()
 
-            # 如果到了列数则换行
-            if temp % self.__columnCount == 0:
-                row += 1
-                column = 0
+        return super(TelView, self).eventFilter(watched, event)
 
-        row += 1
+    def moveEvent(self, event: QMoveEvent) -> None:
+        # 滚动区域通过移动载体实现滚动
+        self.updateRows()
 
-        # 设置右边弹簧
-        if not self.__autoWidth:
-            hSpacer: QSpacerItem = QSpacerItem(1, 1, QSizePolicy.Expanding, QSizePolicy.Minimum)
-            self.__gridLayout.addItem(hSpacer, 0, self.__gridLayout.columnCount())
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        self.updateRows()
+
+    def setInfos(self, infos: List, texts: List[str], indexs: List[int], delay: bool = False) -> None:
+        """
+        设置排好序的联系人信息集合,以及字母分隔文字和对应的第一个联系人索引
+        delay 为真时回到事件循环再计算行表,连续插入只计算一次
+        """
+        self.__infos = infos
+        self.__texts = texts
+        self.__indexs = indexs
+        if delay: self.__rowsTimer.start()
+        else: self.initRows()
+
+    def initRows(self) -> None:
+        """ 计算每一行的位置,只在联系人集合变化时调用 """
+        self.__rowsTimer.stop()
+        self.__buttonIndexs = [-1] * self.__buttons.__len__()
+        rowTops: array = array('i')
+        rowSections: array = array('i')
+        rowStarts: array = array('i')
+        rowEnds: array = array('i')
+        itemTops: array = array('i')
+
+        top: int = 0
+        count: int = self.__infos.__len__()
+        sectionCount: int = self.__indexs.__len__()
+        for section in range(sectionCount):
+            start: int = self.__indexs[section]
+            end: int = self.__indexs[section + 1] if section + 1 < sectionCount else count
+
+            # 字母分隔独占一行
+            rowTops.append(top)
+            rowSections.append(section)
+            rowStarts.append(-1)
+            rowEnds.append(-1)
+            top += self.__bannerHeight
+            itemTops.append(top)
+
+            # 联系人按照列数换行,整段批量写入
+            rowCount: int = (end - start + self.__columnCount - 1) // self.__columnCount
+            rowTops.extend(range(top, top + rowCount * self.__itemHeight, self.__itemHeight))
+            rowSections.extend(repeat(section, rowCount))
+            rowStarts.extend(range(start, end, self.__columnCount))
+            rowEnds.extend(range(start + self.__columnCount, end, self.__columnCount))
+            if rowCount > 0: rowEnds.append(end)
+            top += rowCount * self.__itemHeight
+
+        self.__rowTops = rowTops
+        self.__rowSections = rowSections
+        self.__rowStarts = rowStarts
+        self.__rowEnds = rowEnds
+        self.__itemTops = itemTops
+
+        # 总高度交给滚动区域计算滚动范围
+        self.setMinimumHeight(top)
+        self.updateRows()
+
+    def updateRows(self) -> None:
+        """ 根据当前可见区域重新分配按钮池和分隔池 """
+        # 未放入滚动区域时没有可见区域
+        parent: QWidget = self.parentWidget()
+        if parent is None: return
+
+        top: int = max(-self.y(), 0)
+        height: int = parent.height()
+        width: int = self.width()
+        itemWidth: int = width // self.__columnCount
+
+        # 二分查找可见区域内的行
+        first: int = max(bisect_right(self.__rowTops, top) - 1, 0)
+        last: int = bisect_left(self.__rowTops, top + height)
+
+        buttonCount: int = 0
+        bannerCount: int = 0
+        for row in range(first, last):
+            y: int = self.__rowTops[row]
+            start: int = self.__rowStarts[row]
+            if start < 0:
+                banner: TelBanner = self.__banner(bannerCount)
+                banner.text = self.__texts[self.__rowSections[row]]
+                banner.setGeometry(0, y, width, self.__bannerHeight)
+                banner.show()
+                bannerCount += 1
+                continue
+
+            for column, index in enumerate(range(start, self.__rowEnds[row])):
+                btn: TelButton = self.__button(buttonCount)
+                if self.__buttonIndexs[buttonCount] != index:
+                    self.__buttonIndexs[buttonCount] = index
+                    info = self.__infos[index]
+                    btn.letter = info.letter[0]
+                    btn.pixmap = info.pixmap
+                    btn.name = info.name
+                    btn.belong = info.n_type
+                    btn.tel = info.tel
+
+                # 最后一列占满剩余宽度
+                x: int = column * itemWidth
+                w: int = width - x if column == self.__columnCount - 1 else itemWidth
+                btn.setGeometry(x, y, w, self.__itemHeight)
+                btn.show()
+                buttonCount += 1
+
+        # 隐藏多余的按钮和分隔
+        for btn in self.__buttons[buttonCount:]: btn.hide()
+        for banner in self.__banners[bannerCount:]: banner.hide()
+
+    def __button(self, index: int) -> TelButton:
+        """ 从按钮池取出按钮,不够时新建 """
+        if index < self.__buttons.__len__(): return self.__buttons[index]
+
+        btn: TelButton = TelButton(self)
+        btn.btnPressed.connect(self.btnPressed)
+        btn.btnRelease.connect(self.__btnRelease)
+        for name, value in self.__buttonStyle.items(): setattr(btn, name, value)
+        self.__buttons.append(btn)
+        self.__buttonIndexs.append(-1)
+        return btn
+
+    def __banner(self, index: int) -> TelBanner:
+        """ 从分隔池取出分隔,不够时新建 """
+        if index < self.__banners.__len__(): return self.__banners[index]
+
+        banner: TelBanner = TelBanner(self)
+        for name, value in self.__bannerStyle.items(): setattr(banner, name, value)
+        self.__banners.append(banner)
+        return banner
+
+    def __btnRelease(self) -> None:
+        self.btnRelease.emit(self.sender())
+
+    def setButtonStyle(self, name: str, value: object) -> None:
+        """ 设置按钮池的属性,新建的按钮同样生效 """
+        self.__buttonStyle[name] = value
+        for btn in self.__buttons: setattr(btn, name, value)
+
+    def setBannerStyle(self, name: str, value: object) -> None:
+        """ 设置分隔池的属性,新建的分隔同样生效 """
+        self.__bannerStyle[name] = value
+        for banner in self.__banners: setattr(banner, name, value)
+
+    def letterAt(self, position: int) -> str:
+        """ 返回滚动位置所在分隔的字母,没有联系人时返回空 """
+        if self.__rowsTimer.isActive(): self.initRows()
+        if not self.__rowTops: return ''
+        row: int = max(bisect_right(self.__rowTops, position) - 1, 0)
+        return self.__texts[self.__rowSections[row]]
+
+    def letterPosition(self, letter: str) -> int:
+        """ 返回字母分隔下第一行联系人的位置,字母不存在时返回 -1 """
+        if self.__rowsTimer.isActive(): self.initRows()
+        if letter not in self.__texts: return -1
+        return self.__itemTops[self.__texts.index(letter)]
 
-        # 设置底边弹簧
-        if not self.__autoHeight:
-            vSpacer: QSpacerItem = QSpacerItem(1, 1, QSizePolicy.Minimum, QSizePolicy.Expanding)
-            self.__gridLayout.addItem(vSpacer, row, 0)
+    @property
+    def buttons(self) -> List[TelButton]: return self.__buttons
+
+    @property
+    def columnCount(self) -> int: return self.__columnCount
+
+    @columnCount.setter
+    def columnCount(self, column_count: int) -> None:
+        if self.__columnCount == column_count: return
+        self.__columnCount = column_count
+        self.initRows()
+
+    def sizeHint(self) -> QSize: return QSize(300, 200)
+
+# 联系人后台载入类
+class TelLoader(QObject):
+    """ 在线程池中准备联系人: 拼音首字母/排序/字母分隔索引/头像缩略图, 结果通过信号交回界面线程 """
+
+    progress = Signal(int, int)  # current, total
+    finished = Signal(object)  # (姓名, 类型, 电话, 头像, 联系人, 排序键, 分隔文字, 分隔索引)
+    canceled = Signal()
+
+    # 已开始的载入,结束信号送回界面线程前一直保持引用,不随界面控件销毁
+    __running: Set['TelLoader'] = set()
+
+    class Task(QRunnable):
+        """ 线程池任务,只负责调用载入类; 开始执行后即释放对载入类的引用,载入类的生命周期由界面线程管理 """
+        def __init__(self, loader: 'TelLoader'):
+            super(TelLoader.Task, self).__init__()
+            self.loader: Optional[TelLoader] = loader
+
+        def run(self) -> None:
+            loader: TelLoader = self.loader
+            self.loader = None
+            loader.run()
+
+    def __init__(self, infos: List[Tuple], thumb_size: int = 64, parent: QObject = None):
+        super(TelLoader, self).__init__(parent)
+        self.__infos: List[Tuple] = infos  # 待载入的联系人
+        self.__thumbSize: int = thumb_size  # 头像缩略图尺寸
+        self.__canceled: bool = False  # 是否已取消
+
+        self.__task: TelLoader.Task = TelLoader.Task(self)
+        self.__task.setAutoDelete(False)
+
+        # 载入结束后在界面线程释放,先于其他接收者连接
+        self.finished.connect(self.__release)
+        self.canceled.connect(self.__release)
+
+    def start(self) -> None:
+        """ 放入全局线程池执行 """
+        TelLoader.__running.add(self)
+        QThreadPool.globalInstance().start(self.__task)
+
+    def __release(self) -> None:
+        """ 后台线程已结束,释放引用并在界面线程销毁 """
+        TelLoader.__running.discard(self)
+        # deleteLater 后由 Qt 负责销毁,最后一个 Python 引用在后台线程释放时也不会在后台线程析构
+        self.deleteLater()
+
+    def cancel(self) -> None:
+        """ 取消载入,后台线程在下一个联系人处退出 """
+        self.__canceled = True
+
+    def isCanceled(self) -> bool:
+        return self.__canceled
+
+    def run(self) -> None:
+        """ 在后台线程中执行,不能访问任何界面对象 """
+        total: int = self.__infos.__len__()
+        step: int = max(total // 100, 1)
+
+        names: List[str] = []
+        types: List[str] = []
+        tels: List[str] = []
+        avatars: List[object] = []
+        telInfos: List[TelWidget.TelInfo] = []
+        images: Dict[object, QImage] = {}  # 相同来源的头像只解码缩放一次
+        for i, (n_name, n_type, n_tel, n_avatar) in enumerate(self.__infos):
+            if self.__canceled:
+                self.canceled.emit()
+                return
+
+            avatar: object = self.__thumbnail(n_avatar, images)
+            names.append(n_name)
+            types.append(n_type)
+            tels.append(n_tel)
+            avatars.append(avatar)
+            telInfos.append(TelWidget.createInfo(n_name, n_type, n_tel, avatar))
+
+            if i % step == 0: self.progress.emit(i, total)
+
+        result: Tuple = TelWidget.sortInfos(telInfos)
+        if self.__canceled:
+            self.canceled.emit()
+            return
+
+        self.progress.emit(total, total)
+        self.finished.emit((names, types, tels, avatars) + result)
+
+    def __thumbnail(self, avatar: object, images: Dict[object, QImage]) -> object:
+        """ 图片路径和 QImage 在后台解码并缩放, QPixmap 原样返回 """
+        if isinstance(avatar, str): key: object = avatar
+        elif isinstance(avatar, QImage): key: object = avatar.cacheKey()
+        else: return avatar
+
+        image: QImage = images.get(key)
+        if image is None:
+            image = QImage(avatar) if isinstance(avatar, str) else avatar
+            if not image.isNull():
+                image = image.scaled(self.__thumbSize, self.__thumbSize, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            images[key] = image
+
+        return image
 
 # 通讯录控件
 class TelWidget(QWidget):
@@ -871,9 +1386,20 @@ class TelWidget(QWidget):
     13. 支持单击右侧字母导航定位+文本突出显示
     14. 单击发出当前联系人的姓名+类型+电话等信息
     15. 根据汉字字母排序从小到大排列联系人,自带汉字转拼音功能
+    16. 支持虚拟列表模式,只为可见行创建按钮,十万级联系人也只有固定数量的控件
+    17. 支持后台线程载入联系人,可获取载入进度以及取消载入
     """
 
     telClicked = Signal(str, str, str)  # name, type, tel
+    loadProgress = Signal(int, int)  # current, total
+    loadFinished = Signal()
+    loadCanceled = Signal()
+
+    # 行标识符文字集合
+    TEXTS: List[str] = [
+        "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M",
+        "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z", "#"
+    ]
 
     class TelInfo:
         """ 联系人结构体 """
@@ -882,7 +1408,8 @@ class TelWidget(QWidget):
             self.name: str = ''
             self.n_type: str = ''
             self.tel: str = ''
-            self.pixmap: QPixmap = QPixmap()
+            # 头像,结构体可能在后台线程生成,不在此创建 QPixmap; 后台载入时先保存 QImage,交回界面线程后再转换
+            self.pixmap: Union[QPixmap, QImage, None] = None
 
         def __lt__(self, other):
             return self.letter < other.letter
@@ -900,6 +1427,7 @@ class TelWidget(QWidget):
         self.__tels: List[AnyStr] = []  # 电话集合
 
         self.__bgImage: QPixmap = QPixmap()  # 背景图片
+        self.__bgPixmap: QPixmap = QPixmap()  # 缩放后的背景图片,尺寸或图片改变后重新生成
         self.__bgColor: QColor = Qt.transparent  # 背景颜色
 
         self.__lastPosition: int = 0  # 最后滚动条位置
@@ -907,6 +1435,8 @@ class TelWidget(QWidget):
         self.__telHigh: TelHigh = TelHigh(self.__telPanel)  # 高亮字母标签
         self.__telBanner: TelBanner = TelBanner(self.__telPanel)  # 顶部间隔字母导航
         self.__telLetter: TelLetter = TelLetter(self.__telPanel)  # 右侧字母标签
+        self.__telView: TelView = TelView()  # 虚拟列表模式的视图
+        self.__virtual: bool = False  # 虚拟列表模式
 
         self.__telHighFontSize: int = self.__telHigh.fontSize  # 高亮标签字体大小
         self.__telHighBgImage: QPixmap = self.__telHigh.bgImage  # 高亮标签背景图片
@@ -932,119 +1462,305 @@ class TelWidget(QWidget):
         self.__pixmaps: List[QPixmap] = []  # 联系人图片集合
         self.__timer: QTimer = QTimer(self)  # 隐藏高亮标签定时器
 
+        self.__telInfos: List[TelWidget.TelInfo] = []  # 排好序的联系人集合
+        self.__telKeys: List[Tuple[int, str]] = []  # 排好序的联系人排序键
+        self.__bannerTexts: List[str] = []  # 已有的字母分隔文字
+        self.__indexs: List[int] = []  # 字母分隔对应的第一个联系人索引
+        self.__sectionTops: Optional[array] = None  # 字母分隔的起始位置,布局变化后重新计算
+        self.__loader: Optional[TelLoader] = None  # 正在进行的后台载入
+        # 所有尚未结束的后台载入,包括已被新载入取代的,收到完成或取消信号后释放
+        self.__loaders: List[TelLoader] = []
+        # 控件销毁时取消所有未结束的载入,回调不能引用控件本身
+        self.destroyed.connect(partial(TelWidget.__cancelLoaders, self.__loaders))
+
         self.initControl()
         # self.initForm()
 
     def setInfo(self) -> None:
         if not self.__names or not self.__types or not self.__tels: return
 
-        # 行标识符文字集合
-        texts: List[AnyStr] = [
-            "A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "L", "M", 
-            "N", "O", "P", "Q", "R", "S", "T", "U", "V", "W", "X", "Y", "Z", "#"
-        ]
-        
         if self.__names.__len__() == self.__types.__len__() or \
                 self.__types.__len__() == self.__tels.__len__() or \
                 self.__tels.__len__() == self.__pixmaps.__len__():
-            
-            # 取出对应汉字首字母,先对所有姓名按照字母从小到大排序
-            poundInfos: List[TelWidget.TelInfo] = []
+
+            # 取出对应汉字首字母,再对所有姓名按照字母从小到大排序
             telInfos: List[TelWidget.TelInfo] = []
             for i in range(self.__names.__len__()):
-                telInfo: TelWidget.TelInfo = TelWidget.TelInfo()
-                telInfo.name = self.__names[i]
-                telInfo.n_type = self.__types[i]
-                telInfo.tel = self.__tels[i]
-                telInfo.pixmap = self.__pixmaps[i]
-    
-                # 如果首字母未找到字母则归结到 '#' 分类中
-                letter: str = self.zhtopy.zhToZM(self.__names[i][0])
-                if letter in texts:
-                    telInfo.letter = self.zhtopy.zhToJP(self.__names[i])
-                    telInfos.append(telInfo)
-                else:
-                    telInfo.letter = "#"
-                    poundInfos.append(telInfo)
-    
-            # 对信息集合进行升序排序
-            telInfos.sort()
-    
-            # 对最后的 '#' 类别追加到末尾
-            for n_telInfo in poundInfos:
-                telInfos.append(n_telInfo)
-
-            # 先要清空所有元素
-            for i in self.__items: shiboken2.delete(i)
-            for i in self.__banners: shiboken2.delete(i)
-            self.__items.clear()
-            self.__banners.clear()
-    
+                telInfos.append(TelWidget.createInfo(self.__names[i], self.__types[i],
+                                                     self.__tels[i], self.__pixmaps[i]))
+
+            self.__applyInfos(*TelWidget.sortInfos(telInfos))
+
+    def __applyInfos(self, telInfos: List['TelWidget.TelInfo'], telKeys: List[Tuple[int, str]],
+                     bannerTexts: List[str], indexs: List[int]) -> None:
+        """ 按照排好序的联系人集合重建按钮和字母分隔,必须在界面线程调用 """
+
+        # 保存排序结果,后续单个添加时在此基础上插入
+        self.__telInfos = telInfos
+        self.__telKeys = telKeys
+        self.__bannerTexts = bannerTexts
+        self.__indexs = indexs
+        self.__sectionTops = None
+
+        # 先要清空所有元素
+        for i in self.__items: shiboken2.delete(i)
+        for i in self.__banners: shiboken2.delete(i)
+        self.__items.clear()
+        self.__banners.clear()
+
+        if self.__virtual:
+            # 虚拟列表模式只保存排好序的信息,由视图按可见行分配按钮
+            self.__telPanel.setView(self.__telView)
+            self.__telView.setInfos(telInfos, bannerTexts, indexs)
+        else:
             # 生成电话本按钮
-            for i in range(self.__names.__len__()):
-                telInfo: TelWidget.TelInfo = telInfos[i]
-                btn: TelButton = TelButton()
-                btn.btnPressed.connect(self.btnPressed)
-                btn.btnRelease.connect(self.btnRelease)
-    
-                # 设置字母属性
-                letter: str = telInfo.letter[0]
-                btn.letter = letter
-    
-                # 设置头像+姓名+类型+电话
-                btn.pixmap = telInfo.pixmap
-                btn.name = telInfo.name
-                btn.belong = telInfo.n_type
-                btn.tel = telInfo.tel
-                self.__items.append(btn)
-    
-            # 逐个计算字母对应的索引
-            tempIndex: List[int] = []
-            textCount: int = texts.__len__()
-            for j in range(textCount):
-                text: str = texts[j]
-                index: int = -1
-                for k in range(self.__items.__len__()):
-                    if str(self.__items[k].letter) == text:
-                        index = k
-                        break
-    
-                tempIndex.append(index)
-    
-            # 过滤索引,标识符索引>=0才算数
-            indexs: List[int] = []
-            for j in range(textCount):
-                index: int = tempIndex[j]
-                if index >= 0:
-                    banner: TelBanner = TelBanner()
-                    banner.text = texts[j]
-                    self.__banners.append(banner)
-                    indexs.append(index)
-    
+            for telInfo in telInfos:
+                self.__items.append(self.__newButton(telInfo))
+
+            for text in bannerTexts:
+                self.__banners.append(self.__newBanner(text))
+
             # 设置标识符+元素集合
+            self.__telPanel.setView(None)
             self.__telPanel.indexs = indexs.copy()
             self.__telPanel.banners = self.__banners.copy()
             self.__telPanel.items = self.__items.copy()
-    
-            # 重新设置颜色
-            self.telHighBgColor = self.__telHighBgColor
-            self.telBannerBgColor = self.__telBannerBgColor
-            self.telBannerTextColor = self.__telBannerTextColor
-            self.telLetterNormalColor = self.__telLetterNormalColor
-            self.telLetterHighColor = self.__telLetterHighColor
-            self.telButtonNameColor = self.__telButtonNameColor
-            self.telButtonBelongColor = self.__telButtonBelongColor
-            self.telPanelNormalColor = self.__telPanelNormalColor
-            self.telPanelHighColor = self.__telPanelHighColor
-    
+
+        # 重新设置颜色
+        self.telHighBgColor = self.__telHighBgColor
+        self.telBannerBgColor = self.__telBannerBgColor
+        self.telBannerTextColor = self.__telBannerTextColor
+        self.telLetterNormalColor = self.__telLetterNormalColor
+        self.telLetterHighColor = self.__telLetterHighColor
+        self.telButtonNameColor = self.__telButtonNameColor
+        self.telButtonBelongColor = self.__telButtonBelongColor
+        self.telPanelNormalColor = self.__telPanelNormalColor
+        self.telPanelHighColor = self.__telPanelHighColor
+
     def addInfo(self, n_name: str, n_type: str, n_tel: str, n_pixmap: QPixmap):
+        """ 添加单个联系人,只转换新姓名并插入到排好序的位置 """
         self.__names.append(n_name)
         self.__types.append(n_type)
         self.__tels.append(n_tel)
         self.__pixmaps.append(n_pixmap)
+
+        # 集合被外部直接修改过则整体重建
+        if self.__telInfos.__len__() + 1 != self.__names.__len__() or \
+                self.__names.__len__() != self.__types.__len__() or \
+                self.__names.__len__() != self.__tels.__len__() or \
+                self.__names.__len__() != self.__pixmaps.__len__():
+            self.setInfo()
+            return
+
+        self.__insertInfo(TelWidget.createInfo(n_name, n_type, n_tel, n_pixmap))
+
+    def addInfos(self, infos: Iterable[Tuple[str, str, str, QPixmap]]) -> None:
+        """ 批量添加联系人(姓名, 类型, 电话, 图片),只整体重建一次 """
+        for n_name, n_type, n_tel, n_pixmap in infos:
+            self.__names.append(n_name)
+            self.__types.append(n_type)
+            self.__tels.append(n_tel)
+            self.__pixmaps.append(n_pixmap)
+
         self.setInfo()
 
+    def loadInfos(self, infos: Iterable[Tuple[str, str, str, Union[str, QImage, QPixmap]]],
+                  thumb_size: int = 64) -> None:
+        """
+        在后台线程载入联系人集合(姓名, 类型, 电话, 头像),替换现有联系人
+        拼音转换/排序/字母分隔索引/头像解码缩放都在线程池中完成,界面线程只负责最后的重建
+        头像可以是图片路径或 QImage,会缩放到 thumb_size 以内; QPixmap 只能在界面线程处理,原样使用
+        过程中发出 loadProgress 信号,完成后发出 loadFinished, 调用 cancelLoad 后发出 loadCanceled
+        """
+        self.cancelLoad()
+
+        # 载入对象没有父对象,后台线程结束前不会随控件销毁,结束后自行在界面线程销毁
+        self.__loader = TelLoader(list(infos), thumb_size)
+        self.__loader.progress.connect(self.__loadProgress)
+        self.__loader.finished.connect(self.__loadFinished)
+        self.__loader.canceled.connect(self.__loadCanceled)
+        self.__loaders.append(self.__loader)
+        self.__loader.start()
+
+    def cancelLoad(self) -> None:
+        """ 取消正在进行的后台载入,已有的联系人保持不变 """
+        if self.__loader is None: return
+        self.__loader.cancel()
+
+    def __releaseLoader(self, loader: TelLoader) -> None:
+        """ 后台载入已结束,载入对象自行销毁,这里只移除引用 """
+        if loader in self.__loaders: self.__loaders.remove(loader)
+        if loader is self.__loader: self.__loader = None
+
+    @staticmethod
+    def __cancelLoaders(loaders: List[TelLoader]) -> None:
+        """ 取消集合中所有未结束的载入 """
+        for loader in loaders: loader.cancel()
+        loaders.clear()
+
+    def __loadProgress(self, current: int, total: int) -> None:
+        # 已被取代的载入不再发出进度
+        if self.sender() is self.__loader: self.loadProgress.emit(current, total)
+
+    def __loadFinished(self, result: Tuple) -> None:
+        loader: TelLoader = self.sender()
+        current: bool = loader is self.__loader
+        self.__releaseLoader(loader)
+        if not current: return
+
+        # 取消时后台线程可能已经处理完全部联系人,仍按取消处理
+        if loader.isCanceled():
+            self.loadCanceled.emit()
+            return
+
+        names, types, tels, avatars, telInfos, telKeys, bannerTexts, indexs = result
+
+        # QImage 只能在界面线程转换为 QPixmap,相同的图片只转换一次,没有头像的使用空图片
+        pixmaps: Dict[int, QPixmap] = {}
+        for i, avatar in enumerate(avatars):
+            if isinstance(avatar, QImage):
+                pixmap: QPixmap = pixmaps.get(avatar.cacheKey())
+                if pixmap is None:
+                    pixmap = QPixmap.fromImage(avatar)
+                    pixmaps[avatar.cacheKey()] = pixmap
+                avatars[i] = pixmap
+            elif avatar is None:
+                avatars[i] = QPixmap()
+
+        for telInfo in telInfos:
+            if isinstance(telInfo.pixmap, QImage): telInfo.pixmap = pixmaps[telInfo.pixmap.cacheKey()]
+            elif telInfo.pixmap is None: telInfo.pixmap = QPixmap()
+
+        self.__names = names
+        self.__types = types
+        self.__tels = tels
+        self.__pixmaps = avatars
+        self.__applyInfos(telInfos, telKeys, bannerTexts, indexs)
+        self.loadFinished.emit()
+
+    def __loadCanceled(self) -> None:
+        loader: TelLoader = self.sender()
+        current: bool = loader is self.__loader
+        self.__releaseLoader(loader)
+        # 被新载入取代的旧载入不发出取消信号
+        if current: self.loadCanceled.emit()
+
+    @staticmethod
+    def createInfo(n_name: str, n_type: str, n_tel: str,
+                   n_pixmap: Union[QPixmap, QImage, None]) -> 'TelWidget.TelInfo':
+        """ 生成联系人结构体,并转换姓名的拼音首字母; 头像原样保存,不创建 QPixmap,可以在后台线程调用 """
+        telInfo: TelWidget.TelInfo = TelWidget.TelInfo()
+        telInfo.name = n_name
+        telInfo.n_type = n_type
+        telInfo.tel = n_tel
+        telInfo.pixmap = n_pixmap
+
+        # 如果首字母未找到字母则归结到 '#' 分类中
+        zhtopy: ZhToPY = ZhToPY()
+        letter: str = zhtopy.zhToZM(n_name[0]) if n_name else ''
+        if letter and letter in TelWidget.TEXTS:
+            telInfo.letter = zhtopy.zhToJP(n_name)
+        else:
+            telInfo.letter = "#"
+        return telInfo
+
+    @staticmethod
+    def infoKey(telInfo: 'TelWidget.TelInfo') -> Tuple[int, str]:
+        """ 排序键, '#' 类别排在最后且保持添加顺序 """
+        return (1, '') if telInfo.letter == "#" else (0, telInfo.letter)
+
+    @staticmethod
+    def sortInfos(telInfos: List['TelWidget.TelInfo']) -> Tuple[List['TelWidget.TelInfo'], List[Tuple[int, str]],
+                                                                List[str], List[int]]:
+        """ 对联系人升序排序,返回 (联系人集合, 排序键, 字母分隔文字, 分隔对应的第一个联系人索引),可以在后台线程调用 """
+        telInfos = sorted(telInfos, key=TelWidget.infoKey)
+        telKeys: List[Tuple[int, str]] = [TelWidget.infoKey(telInfo) for telInfo in telInfos]
+
+        # 排好序后同一字母连续排列,二分查找每个字母的第一个联系人
+        indexs: List[int] = []
+        bannerTexts: List[str] = []
+        for text in TelWidget.TEXTS:
+            key: Tuple[int, str] = (1, '') if text == "#" else (0, text)
+            index: int = bisect_left(telKeys, key)
+            if index < telKeys.__len__() and telInfos[index].letter[0] == text:
+                bannerTexts.append(text)
+                indexs.append(index)
+
+        return telInfos, telKeys, bannerTexts, indexs
+
+    def __newButton(self, telInfo: 'TelWidget.TelInfo') -> TelButton:
+        """ 生成联系人按钮 """
+        btn: TelButton = TelButton()
+        btn.btnPressed.connect(self.btnPressed)
+        btn.btnRelease.connect(self.btnRelease)
+
+        # 设置字母属性
+        btn.letter = telInfo.letter[0]
+
+        # 设置头像+姓名+类型+电话
+        btn.pixmap = telInfo.pixmap
+        btn.name = telInfo.name
+        btn.belong = telInfo.n_type
+        btn.tel = telInfo.tel
+
+        btn.bgColor = self.__telButtonBgColor
+        btn.nameColor = self.__telButtonNameColor
+        btn.belongColor = self.__telButtonBelongColor
+        return btn
+
+    def __newBanner(self, text: str) -> TelBanner:
+        """ 生成字母分隔 """
+        banner: TelBanner = TelBanner()
+        banner.text = text
+        banner.bgColor = self.__telBannerBgColor
+        banner.textColor = self.__telBannerTextColor
+        banner.lineColor = self.__telBannerLineColor
+        return banner
+
+    def __insertInfo(self, telInfo: 'TelWidget.TelInfo') -> None:
+        """ 二分插入单个联系人,只新建一个按钮,出现新字母时再新建一个分隔 """
+        key: Tuple[int, str] = TelWidget.infoKey(telInfo)
+        index: int = bisect_right(self.__telKeys, key)
+        self.__telKeys.insert(index, key)
+        self.__telInfos.insert(index, telInfo)
+
+        # 找到所属的字母分隔,没有则按照字母顺序插入新的分隔
+        text: str = telInfo.letter[0]
+        newBanner: bool = text not in self.__bannerTexts
+        if newBanner:
+            order: int = TelWidget.TEXTS.index(text)
+            section: int = 0
+            while section < self.__bannerTexts.__len__() and TelWidget.TEXTS.index(self.__bannerTexts[section]) < order:
+                section += 1
+            self.__bannerTexts.insert(section, text)
+            self.__indexs.insert(section, index)
+        else:
+            section: int = self.__bannerTexts.index(text)
+
+        # 后面分隔的第一个联系人索引依次后移
+        for i in range(section + 1, self.__indexs.__len__()):
+            self.__indexs[i] += 1
+        self.__sectionTops = None
+
+        if self.__virtual:
+            self.__telPanel.setView(self.__telView)
+            self.__telView.setInfos(self.__telInfos, self.__bannerTexts, self.__indexs, True)
+            return
+
+        self.__telPanel.setView(None)
+        self.__telPanel.indexs = self.__indexs.copy()
+
+        btn: TelButton = self.__newButton(telInfo)
+        self.__items.insert(index, btn)
+        self.__telPanel.insertItem(index, btn)
+
+        if newBanner:
+            banner: TelBanner = self.__newBanner(text)
+            self.__banners.insert(section, banner)
+            self.__telPanel.insertBanner(section, banner)
+
     def resizeEvent(self, event: QResizeEvent) -> None:
+        self.__bgPixmap = QPixmap()
         self.showEvent()
 
     def showEvent(self, event: QShowEvent = None) -> None:
@@ -1060,10 +1776,14 @@ class TelWidget(QWidget):
     def paintEvent(self, event: QPaintEvent) -> None:
         painter: QPainter = QPainter(self)
 
-        # 优先绘制背景图片
-        if self.__bgImage is not None:
-            pix: QPixmap = self.__bgImage.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            painter.drawPixmap(0, 0, pix)
+        # 优先绘制背景图片,缩放结果缓存到尺寸或图片改变为止
+        if not self.__bgImage.isNull():
+            if self.__bgPixmap.isNull():
+                dpr: float = self.devicePixelRatioF()
+                self.__bgPixmap = self.__bgImage.scaled(self.size() * dpr, Qt.KeepAspectRatioByExpanding,
+                                                        Qt.SmoothTransformation)
+                self.__bgPixmap.setDevicePixelRatio(dpr)
+            painter.drawPixmap(0, 0, self.__bgPixmap)
         else:
             painter.setPen(Qt.NoPen)
             painter.setBrush(self.__bgColor)
@@ -1096,8 +1816,14 @@ class TelWidget(QWidget):
         # 右侧字母列表
         self.__telLetter.letterClicked.connect(self.letterClicked)
 
+        # 虚拟列表模式的按钮池
+        self.__telView.columnCount = self.__telPanel.columnCount
+        self.__telView.btnPressed.connect(self.btnPressed)
+        self.__telView.btnRelease.connect(self.btnRelease)
+
         # 绑定面板滑动位置改变信号槽,计算当前字母
         self.__telPanel.positionChanged.connect(self.positionChanged)
+        self.__telPanel.layoutChanged.connect(self.layoutChanged)
 
         # 定时器隐藏突出显示字母
         self.__timer.timeout.connect(self.__telHigh.hide)
@@ -1130,7 +1856,7 @@ class TelWidget(QWidget):
             self.__names.append("{} {}".format(letter, str(count).rjust(2, '0')))
             self.__types.append(lists[random.randint(0, 100) % 3])
             self.__tels.append("1381234{}".format(str(random.randint(0, 100)).rjust(3, '0')))
-            self.__pixmaps.append(QPixmap(":/image/img{}.jpg".format(random.randint(0, 100) % 10)))
+            self.__pixmaps.append(TelAvatar().pixmap(":/image/img{}.jpg".format(random.randint(0, 100) % 10)))
 
         self.setInfo()
 
@@ -1138,37 +1864,48 @@ class TelWidget(QWidget):
         # 记录下滚动条位置,过滤鼠标松开地方
         self.__lastPosition = self.__telPanel.position
 
-    def btnRelease(self) -> None:
+    def btnRelease(self, btn: TelButton = None) -> None:
         # 如果鼠标按下时候和松开时候的滚动条位置一致则说明是单击
         position: int = self.__telPanel.position
         if self.__lastPosition == position:
-            btn: TelButton = self.sender()
+            if btn is None: btn = self.sender()
             self.telClicked.emit(btn.name, btn.belong, btn.tel)
 
+    def layoutChanged(self) -> None:
+        # 元素位置变化后再重新计算字母分隔的起始位置
+        self.__sectionTops = None
+
+    def letterAt(self, position: int) -> str:
+        """ 二分查找滚动位置所在的字母分隔,没有联系人时返回空 """
+        if self.__virtual: return self.__telView.letterAt(position)
+        if not self.__banners: return ''
+
+        # 刚插入的联系人还在等待排列时先排列,否则读到的是旧位置
+        self.__telPanel.activateLayout()
+        if self.__sectionTops is None:
+            self.__sectionTops = array('i', [banner.y() for banner in self.__banners])
+
+        section: int = max(bisect_right(self.__sectionTops, position) - 1, 0)
+        return self.__bannerTexts[section]
+
+    def letterPosition(self, letter: str) -> int:
+        """ 返回字母下第一个联系人的位置,字母不存在时返回 -1 """
+        if self.__virtual: return self.__telView.letterPosition(letter)
+        if letter not in self.__bannerTexts: return -1
+        self.__telPanel.activateLayout()
+        return self.__items[self.__indexs[self.__bannerTexts.index(letter)]].y()
+
     def positionChanged(self, value: int) -> None:
-        # 找到当前位置的按钮的姓名的首字母
-        for i in range(self.__items.__len__()):
-            item: QWidget = self.__items[i]
-            p: QPoint = item.pos()
-
-            # 相邻近似算法,当前滚动条的值需要加上按钮的高度,不然找到的是上一个
-            offset: int = abs(p.y() - (value + 20))
-            if offset < 5:
-                btn: TelButton = item
-                letter: str = str(btn.letter)
-                self.__telLetter.highLetter = letter
-                self.__telBanner.text = letter
-                return
+        # 找到当前位置所在的字母,当前滚动条的值需要加上按钮的高度,不然找到的是上一个
+        letter: str = self.letterAt(value + 20)
+        if letter:
+            self.__telLetter.highLetter = letter
+            self.__telBanner.text = letter
 
     def letterClicked(self, letter: str, letter_y: int) -> None:
-        # 找到当前字母所在的第一行,滚动条滚过去
-        for i in range(self.__items.__len__()):
-            w: QWidget = self.__items[i]
-            text = str(w.letter)
-            if text == letter:
-                # 需要减去字母导航标签的高度
-                self.__telPanel.position = w.pos().y() - 30
-                break
+        # 找到当前字母所在的第一行,滚动条滚过去,需要减去字母导航标签的高度
+        y: int = self.letterPosition(letter)
+        if y >= 0: self.__telPanel.position = y - 30
 
         # 根据不同的类型移动到不同的位置
         if not self.__telHigh.bgImage.isNull():
@@ -1184,6 +1921,15 @@ class TelWidget(QWidget):
         self.__timer.stop()
         self.__timer.start()
 
+    @property
+    def virtual(self) -> bool: return self.__virtual
+
+    @virtual.setter
+    def virtual(self, n_virtual: bool) -> None:
+        if self.__virtual == n_virtual: return
+        self.__virtual = n_virtual
+        self.setInfo()
+
     @property
     def names(self) -> List[AnyStr]: return self.__names
 
@@ -1226,6 +1972,7 @@ class TelWidget(QWidget):
     @bgImage.setter
     def bgImage(self, bg_image: QPixmap) -> None:
         self.__bgImage = bg_image
+        self.__bgPixmap = QPixmap()
         self.update()
 
     @property
@@ -1275,6 +2022,7 @@ class TelWidget(QWidget):
     def telBannerBgColor(self, tel_banner_bg_color: QColor) -> None:
         self.__telBannerBgColor = tel_banner_bg_color
         self.__telBanner.bgColor = tel_banner_bg_color
+        self.__telView.setBannerStyle('bgColor', tel_banner_bg_color)
         for bannerr in self.__banners:
             b: TelBanner = bannerr
             b.bgColor = tel_banner_bg_color
@@ -1286,6 +2034,7 @@ class TelWidget(QWidget):
     def telBannerTextColor(self, tel_banner_text_color: QColor) -> None:
         self.__telBannerTextColor = tel_banner_text_color
         self.__telBanner.textColor = tel_banner_text_color
+        self.__telView.setBannerStyle('textColor', tel_banner_text_color)
         for banner in self.__banners:
             b: TelBanner = banner
             b.textColor = tel_banner_text_color
@@ -1297,6 +2046,7 @@ class TelWidget(QWidget):
     def telBannerLineColor(self, tel_banner_line_color: QColor) -> None:
         self.__telBannerLineColor = tel_banner_line_color
         self.__telBanner.lineColor = tel_banner_line_color
+        self.__telView.setBannerStyle('lineColor', tel_banner_line_color)
         for banner in self.__banners:
             b: TelBanner = banner
             b.lineColor = tel_banner_line_color
@@ -1323,6 +2073,7 @@ class TelWidget(QWidget):
     @telButtonBgColor.setter
     def telButtonBgColor(self, tel_button_bg_color: QColor) -> None:
         self.__telButtonBgColor = tel_button_bg_color
+        self.__telView.setButtonStyle('bgColor', tel_button_bg_color)
         for item in self.__items:
             btn: TelButton = item
             btn.bgColor = tel_button_bg_color
@@ -1333,6 +2084,7 @@ class TelWidget(QWidget):
     @telButtonNameColor.setter
     def telButtonNameColor(self, tel_button_name_color: QColor) -> None:
         self.__telButtonNameColor = tel_button_name_color
+        self.__telView.setButtonStyle('nameColor', tel_button_name_color)
         for item in self.__items:
             btn: TelButton = item
             btn.nameColor = tel_button_name_color
@@ -1343,6 +2095,7 @@ class TelWidget(QWidget):
     @telButtonBelongColor.setter
     def telButtonBelongColor(self, tel_button_belong_color: QColor) -> None:
         self.__telButtonBelongColor = tel_button_belong_color
+        self.__telView.setButtonStyle('belongColor', tel_button_belong_color)
         for item in self.__items:
             btn: TelButton = item
             btn.belongColor = tel_button_belong_color
@@ -1375,6 +2128,8 @@ if __name__ == '__main__':
             self.telWidget = TelWidget()
             self.telWidget.telClicked.connect(self.telClicked)
             self.telWidget.bgImage = QPixmap(":/image/bg.jpg")
+            # 联系人较多时开启虚拟列表模式,只为可见行创建按钮
+            # self.telWidget.virtual = True
 
             sublayout = QHBoxLayout()
             self.txtName = QLineEdit('阿波')
@@ -1438,7 +2193,7 @@ if __name__ == '__main__':
                 self.telWidget.names.append("{} {}".format(letter, str(count).rjust(2, '0')))
                 self.telWidget.types.append(lists[random.randint(0, 100) % 3])
                 self.telWidget.tels.append("1381234{}".format(str(random.randint(0, 100)).rjust(3, '0')))
-                self.telWidget.pixmaps.append(QPixmap(":/image/img{}.jpg".format(random.randint(0, 100) % 10)))
+                self.telWidget.pixmaps.append(TelAvatar().pixmap(":/image/img{}.jpg".format(random.randint(0, 100) % 10)))
 
             self.telWidget.setInfo()
 
@@ -1450,7 +2205,7 @@ if __name__ == '__main__':
             n_name: str = self.txtName.text()
             n_type: str = self.txtType.text()
             n_tel: str = self.txtTel.text()
-            self.telWidget.addInfo(n_name, n_type, n_tel, QPixmap(":/image/tel.png"))
+            self.telWidget.addInfo(n_name, n_type, n_tel, TelAvatar().pixmap(":/image/tel.png"))
 
     app = QApplication()
     window = FrmTelWidget()
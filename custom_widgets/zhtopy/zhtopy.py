@@ -1,16 +1,33 @@
-from typing import List, AnyStr
+from array import array
+from itertools import islice
+from typing import List, Dict, Tuple, Iterable, Sequence, AnyStr
 
 from PySide2.QtCore import QObject, QFile
 
-import custom_widgets.zhtopy.resource
+from custom_widgets.singleton.singleton import Singleton
+from custom_widgets.zhtopy.zhtopybin import PYBIN_FILE, readPYBin
 
-class Singleton(type(QObject), type):
-    _instances = {}
+def initResources() -> None:
+    """ 注册拼音文件资源,首次调用时才导入资源模块,重复调用无副作用 """
+    import custom_widgets.zhtopy.resource
 
-    def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+# 拼音文件覆盖的 unicode 汉字范围
+PY_BEGIN: int = 0x4E00
+PY_END: int = 0x9FA5
+
+class JPTable(dict):
+    """ 简拼转换表, 供 str.translate 使用, 表中不存在的字符直接丢弃 """
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+class PYTable(dict):
+    """ 全拼转换表, 供 str.translate 使用, 每个字符转换为 "拼音 ", 非汉字字符原样输出并缓存 """
+
+    def __missing__(self, key: int) -> str:
+        value: str = chr(key) + ' '
+        self[key] = value
+        return value
 
 class ZhToPY(QObject, metaclass=Singleton):
 
@@ -26,10 +43,15 @@ class ZhToPY(QObject, metaclass=Singleton):
     def __init__(self, parent: QObject = None):
         super(ZhToPY, self).__init__(parent)
 
-        self.__listPY: List[AnyStr] = []
+        # 拼音字符串池(去重后约500个拼音)与按 unicode - PY_BEGIN 索引的池下标
+        self.__pyPool: Tuple[str, ...] = ()
+        self.__pyIndex: Sequence[int] = array('H')
+        # 批量转换用的全拼转换表,首次批量转换时才构建
+        self.__pyTable: PYTable = PYTable()
 
-        # 加载拼音文件
-        self.loadPY()
+        # 加载拼音文件,优先 mmap 预编译的二进制拼音文件,不存在时解析文本拼音文件
+        if not self.loadPYBin():
+            self.loadPY()
 
         # 加载简拼数组
         self.__listJP: List[AnyStr] = [
@@ -245,51 +267,92 @@ class ZhToPY(QObject, metaclass=Singleton):
             "XY"
         ]
 
+        # 构建简拼转换表: 字母转大写, 数字原样输出, 汉字转首字母
+        self.__jpTable: JPTable = JPTable(
+            (PY_BEGIN + i, letter) for i, letter in enumerate(''.join(self.__listJP)))
+        for vChar in range(ord('a'), ord('z') + 1):
+            self.__jpTable[vChar] = chr(vChar).upper()
+        for vChar in range(ord('A'), ord('Z') + 1):
+            self.__jpTable[vChar] = chr(vChar)
+        for vChar in range(ord('0'), ord('9') + 1):
+            self.__jpTable[vChar] = chr(vChar)
+
     def loadPY(self, file_name: str = ":/image/zhtopy.txt") -> None:
         """ 载入拼音文件 """
+        initResources()
         file: QFile = QFile(file_name)
         if file.open(QFile.ReadOnly | QFile.Text):
-            text = file.readAll()
-            self.__listPY = text.split(" ")
+            text: str = file.readAll().data().decode()
+            file.close()
+            self.buildIndex(text.split(" "))
+
+    def loadPYBin(self, file_name: str = PYBIN_FILE) -> bool:
+        """ 载入二进制拼音文件(由 zhtopybin.py 生成),成功返回 True """
+        data = readPYBin(file_name)
+        if data is None or data[0] != PY_BEGIN: return False
+        # 索引表必须覆盖 PY_BEGIN 到 PY_END 的所有汉字,否则按 unicode 查表会越界,由调用方回退到文本拼音文件
+        if data[2].__len__() < PY_END - PY_BEGIN: return False
+
+        self.__pyPool = data[1]
+        self.__pyIndex = data[2]
+        self.__pyTable.clear()
+        return True
+
+    def buildIndex(self, listPY: List[str]) -> None:
+        """ 构建拼音索引, listPY 为按照 UNICODE 每个中文对应的拼音数组 """
+        pool: Dict[str, int] = {}
+        index: array = array('H')
+        for py in listPY:
+            index.append(pool.setdefault(py, pool.__len__()))
+        self.__pyPool = tuple(pool)
+        self.__pyIndex = index
+        self.__pyTable.clear()
 
     def zhToPY(self, chinese: str) -> str:
         """ 汉字转拼音 """
-        if not self.__listPY.__len__(): return ""
-    
-        items: List[AnyStr] = []
-        for i in range(chinese.__len__()):
-            unicode: int = ord(chinese[i])
-            # 这里的listPY就是按照UNICODE每个中文对应的拼音数组
-            if 0x9FA5 > unicode >= 0x4E00:
-                items.append(self.__listPY[unicode - 0x4E00].data().decode())
+        if not self.__pyIndex.__len__(): return ""
+
+        pool: Tuple[str, ...] = self.__pyPool
+        index: Sequence[int] = self.__pyIndex
+        items: List[str] = []
+        for ch in chinese:
+            unicode: int = ord(ch)
+            if PY_END > unicode >= PY_BEGIN:
+                items.append(pool[index[unicode - PY_BEGIN]])
             else:
-                items.append(chinese[i])
+                items.append(ch)
         return ' '.join(items)
 
+    def zhToPYMany(self, chineses: Iterable[str]) -> List[str]:
+        """ 批量汉字转拼音,结果与逐个调用 zhToPY 一致 """
+        if not self.__pyIndex.__len__(): return ["" for _ in chineses]
+
+        if not self.__pyTable:
+            pool: Tuple[str, ...] = self.__pyPool
+            self.__pyTable.update(
+                (PY_BEGIN + i, pool[index] + ' ')
+                for i, index in enumerate(islice(self.__pyIndex, PY_END - PY_BEGIN)))
+
+        # 每个字符转换为 "拼音 ",去掉末尾多余的空格即为空格分隔的结果
+        table: PYTable = self.__pyTable
+        return [chinese.translate(table)[:-1] for chinese in chineses]
+
     def zhToJP(self, chinese: str) -> str:
         """ 汉字转字母简拼 """
-        strChineseFirstPY: str = ''.join(self.__listJP)
-        if not chinese.__len__(): return chinese
-    
-        item: str = ''
-        index: int = 0
-        for i in range(chinese.__len__()):
-            # 若是字母或数字则直接输出
-            vChar: int = ord(chinese[i])
-            if ord('a') <= vChar <= ord('z') or ord('A') <= vChar <= ord('Z'):
-                item += chinese[i].upper()
-    
-            if ord('0') <= vChar <= ord('9'):
-                item += chinese[i]
-            else:
-                index: int = vChar - 19968
-                if 0 <= index < strChineseFirstPY.__len__():
-                    item += strChineseFirstPY[index]
-        return item
+        return chinese.translate(self.__jpTable)
+
+    def zhToJPMany(self, chineses: Iterable[str]) -> List[str]:
+        """ 批量汉字转字母简拼 """
+        table: JPTable = self.__jpTable
+        return [chinese.translate(table) for chinese in chineses]
 
     def zhToZM(self, chinese: str) -> str:
         """ 汉字转首字母 """
-        return self.zhToJP(chinese)[0]
+        # 只查找第一个可转换的字符,不再转换整个字符串
+        for ch in chinese:
+            letter: str = self.__jpTable[ord(ch)]
+            if letter is not None: return letter
+        return ""
 
 
 if __name__ == '__main__':
@@ -0,0 +1,92 @@
+"""
+预编译二进制拼音文件
+
+文件格式(小端):
+1. 文件头: 魔数 b'ZHPY' + 版本号(H) + 保留(H) + 起始unicode(I) + 汉字数量(I) + 拼音数量(I)
+2. 拼音偏移表: (拼音数量 + 1) 个 I, 第 i 个拼音为字符串池中 [offsets[i], offsets[i + 1]) 的内容
+3. 汉字索引表: 汉字数量个 H, 按 unicode - 起始unicode 索引对应的拼音序号
+4. 字符串池: 所有去重后的拼音(ascii)依次拼接
+
+载入时直接 mmap 文件, 汉字索引表以 memoryview 的形式使用, 无需解析
+"""
+
+import os
+import sys
+import mmap
+import struct
+from array import array
+from typing import List, Dict, Tuple, Optional
+
+PYBIN_MAGIC: bytes = b'ZHPY'
+PYBIN_VERSION: int = 1
+PYBIN_HEADER: struct.Struct = struct.Struct('<4sHHIII')
+
+# 默认的拼音文本文件及二进制拼音文件路径
+PYBIN_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'image')
+PYTXT_FILE: str = os.path.join(PYBIN_DIR, 'zhtopy.txt')
+PYBIN_FILE: str = os.path.join(PYBIN_DIR, 'zhtopy.bin')
+
+
+def writePYBin(listPY: List[str], file_name: str = PYBIN_FILE, begin: int = 0x4E00) -> None:
+    """ 将按照 UNICODE 每个中文对应的拼音数组写入二进制拼音文件 """
+    pool: Dict[str, int] = {}
+    index: array = array('H')
+    for py in listPY:
+        index.append(pool.setdefault(py, pool.__len__()))
+
+    offsets: array = array('I', [0])
+    for py in pool:
+        offsets.append(offsets[-1] + py.encode('ascii').__len__())
+
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        index.byteswap()
+
+    with open(file_name, 'wb') as file:
+        file.write(PYBIN_HEADER.pack(PYBIN_MAGIC, PYBIN_VERSION, 0, begin, index.__len__(), pool.__len__()))
+        file.write(offsets.tobytes())
+        file.write(index.tobytes())
+        file.write(''.join(pool).encode('ascii'))
+
+
+def readPYBin(file_name: str = PYBIN_FILE) -> Optional[Tuple[int, Tuple[str, ...], memoryview]]:
+    """ 以 mmap 方式载入二进制拼音文件, 返回 (起始unicode, 拼音池, 汉字索引表), 文件无效时返回 None """
+    # memoryview 按本机字节序解释, 大端机器上直接回退到文本拼音文件
+    if sys.byteorder != 'little' or not os.path.isfile(file_name): return None
+
+    with open(file_name, 'rb') as file:
+        try:
+            buffer: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    if buffer.__len__() < PYBIN_HEADER.size: return None
+    magic, version, _, begin, count, poolCount = PYBIN_HEADER.unpack_from(buffer, 0)
+    if magic != PYBIN_MAGIC or version != PYBIN_VERSION: return None
+
+    indexStart: int = PYBIN_HEADER.size + (poolCount + 1) * 4
+    poolStart: int = indexStart + count * 2
+    if buffer.__len__() < poolStart: return None
+
+    view: memoryview = memoryview(buffer)
+    offsets: memoryview = view[PYBIN_HEADER.size:indexStart].cast('I')
+    if buffer.__len__() < poolStart + offsets[-1]: return None
+
+    # 拼音池只有几百个短字符串, 直接解码; 汉字索引表保持为 mmap 上的视图
+    pool: Tuple[str, ...] = tuple(
+        bytes(view[poolStart + offsets[i]:poolStart + offsets[i + 1]]).decode('ascii') for i in range(poolCount))
+    index: memoryview = view[indexStart:poolStart].cast('H')
+    # 拼音序号超出拼音池说明文件已损坏, 否则按 unicode 查表时会越界
+    if index.__len__() and max(index) >= poolCount: return None
+    return begin, pool, index
+
+
+if __name__ == '__main__':
+    # 用法: python zhtopybin.py [zhtopy.txt] [zhtopy.bin]
+    txt_file: str = sys.argv[1] if sys.argv.__len__() > 1 else PYTXT_FILE
+    bin_file: str = sys.argv[2] if sys.argv.__len__() > 2 else PYBIN_FILE
+
+    with open(txt_file, 'r', encoding='utf-8') as f:
+        writePYBin(f.read().split(' '), bin_file)
+
+    print('%s -> %s (%d bytes)' % (txt_file, bin_file, os.path.getsize(bin_file)))